@@ -2,6 +2,11 @@
 from syft.node.routes import make_routes
 
 # grid absolute
+from grid.core.config import settings
 from grid.core.node import worker
 
-router = make_routes(worker=worker)
+router = make_routes(
+    worker=worker,
+    api_call_workers=settings.API_CALL_WORKERS,
+    login_workers=settings.LOGIN_WORKERS,
+)
@@ -101,6 +101,9 @@ class Settings(BaseSettings):
     LEDGER_DB_ID: int = int(os.getenv("LEDGER_DB_ID", 1))
     NETWORK_CHECK_INTERVAL: int = int(os.getenv("NETWORK_CHECK_INTERVAL", 60))
     DOMAIN_CHECK_INTERVAL: int = int(os.getenv("DOMAIN_CHECK_INTERVAL", 60))
+    # thread pools of the API routes, logins hash passwords in their own pool
+    API_CALL_WORKERS: int = int(os.getenv("SYFT_API_CALL_WORKERS", 16))
+    LOGIN_WORKERS: int = int(os.getenv("SYFT_LOGIN_WORKERS", 4))
     CONTAINER_HOST: str = str(os.getenv("CONTAINER_HOST", "docker"))
     MONGO_HOST: str = str(os.getenv("MONGO_HOST", ""))
     MONGO_PORT: int = int(os.getenv("MONGO_PORT", 0))
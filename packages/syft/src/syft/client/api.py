@@ -4,6 +4,7 @@ from __future__ import annotations
 # stdlib
 import inspect
 from inspect import signature
+import sys
 import types
 from typing import Any
 from typing import Callable
@@ -587,17 +588,19 @@ def monkey_patch_getdef(self, obj, oname="") -> Union[str, None]:
         return None
 
 
-# try to monkeypatch IPython
-try:
-    # third party
-    from IPython.core.oinspect import Inspector
+# try to monkeypatch IPython, only when we are running inside of it so that
+# IPython isn't imported as a side effect of importing syft
+if "IPython" in sys.modules:
+    try:
+        # third party
+        from IPython.core.oinspect import Inspector
 
-    if not hasattr(Inspector, "_getdef_bak"):
-        Inspector._getdef_bak = Inspector._getdef
-        Inspector._getdef = types.MethodType(monkey_patch_getdef, Inspector)
-except Exception:
-    # print("Failed to monkeypatch IPython Signature Override")
-    pass  # nosec
+        if not hasattr(Inspector, "_getdef_bak"):
+            Inspector._getdef_bak = Inspector._getdef
+            Inspector._getdef = types.MethodType(monkey_patch_getdef, Inspector)
+    except Exception:
+        # print("Failed to monkeypatch IPython Signature Override")
+        pass  # nosec
 
 
 @serializable()
@@ -24,6 +24,10 @@ from .. import __version__
 from ..abstract_node import AbstractNode
 from ..node.credentials import SyftSigningKey
 from ..node.credentials import UserLoginCredentials
+from ..serde.compression import accept_encoding_header
+from ..serde.compression import choose_encoding
+from ..serde.compression import compress_body
+from ..serde.compression import decompress_body
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
@@ -89,6 +93,8 @@ class HTTPConnection(NodeConnection):
     url: GridURL
     routes: Type[Routes] = Routes
     session_cache: Optional[Session]
+    # content coding of the request bodies, learned from the node's responses
+    request_encoding: Optional[str]
 
     def __init__(
         self, url: Union[GridURL, str], proxy_target_uid: Optional[UID] = None
@@ -121,7 +127,11 @@ class HTTPConnection(NodeConnection):
     def _make_get(self, path: str, params: Optional[Dict] = None) -> bytes:
         url = self.url.with_path(path)
         response = self.session.get(
-            str(url), verify=verify_tls(), proxies={}, params=params
+            str(url),
+            verify=verify_tls(),
+            proxies={},
+            params=params,
+            headers={"Accept-Encoding": accept_encoding_header()},
         )
         if response.status_code != 200:
             raise requests.ConnectionError(
@@ -131,7 +141,14 @@ class HTTPConnection(NodeConnection):
         # upgrade to tls if available
         self.url = upgrade_tls(self.url, response)
 
-        return response.content
+        return self._read_content(response)
+
+    def _read_content(self, response: Response) -> bytes:
+        if "Accept-Encoding" in response.headers:
+            self.request_encoding = choose_encoding(response.headers["Accept-Encoding"])
+        return decompress_body(
+            response.content, response.headers.get("Content-Encoding")
+        )
 
     def _make_post(
         self,
@@ -196,11 +213,19 @@ class HTTPConnection(NodeConnection):
         response = _deserialize(response, from_bytes=True)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
+    def make_call(
+        self, signed_call: SignedSyftAPICall, timeout: Optional[float] = None
+    ) -> Union[Any, SyftError]:
         msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        msg_bytes, encoding = compress_body(msg_bytes, self.request_encoding)
+        headers = {"Accept-Encoding": accept_encoding_header()}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
         response = requests.post(  # nosec
             url=str(self.api_url),
             data=msg_bytes,
+            headers=headers,
+            timeout=timeout,
         )
 
         if response.status_code != 200:
@@ -208,7 +233,7 @@ class HTTPConnection(NodeConnection):
                 f"Failed to fetch metadata. Response returned with code {response.status_code}"
             )
 
-        result = _deserialize(response.content, from_bytes=True)
+        result = _deserialize(self._read_content(response), from_bytes=True)
         return result
 
     def __repr__(self) -> str:
@@ -285,7 +310,10 @@ class PythonConnection(NodeConnection):
         response = method(context=service_context, new_user=new_user)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Union[Any, SyftError]:
+    def make_call(
+        self, signed_call: SignedSyftAPICall, timeout: Optional[float] = None
+    ) -> Union[Any, SyftError]:
+        # runs on this thread, so it can't be stopped after `timeout`
         return self.node.handle_api_call(signed_call)
 
     def __repr__(self) -> str:
@@ -2,9 +2,6 @@
 import os
 from typing import Optional
 
-# third party
-from gevent import monkey
-
 
 def str_to_bool(bool_str: Optional[str]) -> bool:
     result = False
@@ -38,5 +35,8 @@ def is_notebook() -> bool:
 jupyter_notebook = is_notebook()
 
 if jupyter_notebook:
+    # third party
+    from gevent import monkey
+
     # print("Patching Gevent in Jupyter")
     monkey.patch_all(thread=False)
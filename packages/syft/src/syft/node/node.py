@@ -14,13 +14,11 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Type
 from typing import Union
 
 # third party
-import gevent
-import gipc
-from gipc.gipc import _GIPCDuplexHandle
 from nacl.signing import SigningKey
 from result import Err
 from result import Result
@@ -37,6 +35,12 @@ from ..client.api import SyftAPIData
 from ..external import OBLV
 from ..serde.deserialize import _deserialize
 from ..serde.serialize import _serialize
+from ..serde.shared_memory import SHARED_ARRAY_PREFIX
+from ..serde.shared_memory import share_arrays
+from ..serde.shared_memory import task_array_prefix
+from ..serde.shared_memory import unlink_shared_arrays
+from ..service.action.action_permissions import ActionObjectPermission
+from ..service.action.action_permissions import ActionPermission
 from ..service.action.action_service import ActionService
 from ..service.action.action_store import DictActionStore
 from ..service.action.action_store import SQLiteActionStore
@@ -55,8 +59,13 @@ from ..service.metadata.node_metadata import NodeMetadata
 from ..service.network.network_service import NetworkService
 from ..service.policy.policy_service import PolicyService
 from ..service.project.project_service import ProjectService
+from ..service.queue.queue_manager import QueueConfig
+from ..service.queue.queue_manager import QueueManager
+from ..service.queue.queue_service import QueueService
+from ..service.queue.queue_stash import QUEUE_WAIT_TIMEOUT_MAX
 from ..service.queue.queue_stash import QueueItem
 from ..service.queue.queue_stash import QueueStash
+from ..service.queue.queue_stash import Status
 from ..service.request.request_service import RequestService
 from ..service.response import SyftError
 from ..service.service import AbstractService
@@ -79,8 +88,13 @@ from ..util.telemetry import instrument
 from ..util.util import random_name
 from .credentials import SyftSigningKey
 from .credentials import SyftVerifyKey
+from .peer_client_pool import PeerClientPool
 from .worker_settings import WorkerSettings
 
+if TYPE_CHECKING:
+    # third party
+    from gipc.gipc import _GIPCDuplexHandle
+
 
 def thread_ident() -> int:
     return threading.current_thread().ident
@@ -91,12 +105,15 @@ def thread_ident() -> int:
 CODE_RELOADER: Dict[int, Callable] = {}
 
 
-def gipc_encoder(obj):
-    return _serialize(obj, to_bytes=True)
+def gipc_encoder(obj, prefix: str = SHARED_ARRAY_PREFIX):
+    # large arrays are mapped by the other process instead of going through the pipe
+    with share_arrays(prefix=prefix):
+        return _serialize(obj, to_bytes=True)
 
 
 def gipc_decoder(obj_bytes):
-    return _deserialize(obj_bytes, from_bytes=True)
+    with share_arrays():
+        return _deserialize(obj_bytes, from_bytes=True)
 
 
 NODE_PRIVATE_KEY = "NODE_PRIVATE_KEY"
@@ -154,6 +171,7 @@ class Node(AbstractNode):
         node_type: NodeType = NodeType.DOMAIN,
         local_db: bool = False,
         sqlite_path: Optional[str] = None,
+        queue_config: Optional[QueueConfig] = None,
     ):
         # 🟡 TODO 22: change our ENV variable format and default init args to make this
         # less horrible or add some convenience functions
@@ -194,6 +212,7 @@ class Node(AbstractNode):
                 MessageService,
                 ProjectService,
                 DataSubjectMemberService,
+                QueueService,
             ]
             if services is None
             else services
@@ -224,9 +243,13 @@ class Node(AbstractNode):
             node=self,
         )
 
-        self.client_cache = {}
+        self.peer_client_pool = PeerClientPool(node=self)
         self.node_type = node_type
 
+        self.queue_manager = QueueManager(
+            node=self, stash=self.queue_stash, task=queue_task, config=queue_config
+        )
+
         self.post_init()
 
     @classmethod
@@ -314,6 +337,8 @@ class Node(AbstractNode):
             pass
         else:
             print(f"> {self}")
+            if self.processes > 0:
+                self.queue_manager.recover()
 
         def reload_user_code() -> None:
             user_code_service.load_user_code(context=context)
@@ -392,6 +417,7 @@ class Node(AbstractNode):
                 MessageService,
                 ProjectService,
                 DataSubjectMemberService,
+                QueueService,
             ]
 
             if OBLV:
@@ -457,8 +483,20 @@ class Node(AbstractNode):
 
         return True
 
-    def resolve_future(self, uid: UID) -> Union[Optional[QueueItem], SyftError]:
-        result = self.queue_stash.pop(uid)
+    def resolve_future(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        timeout: Optional[float] = None,
+    ) -> Union[Optional[QueueItem], SyftError]:
+        if timeout:
+            # long poll, hold the request until the worker sets the result
+            self.queue_stash.wait_for_result(
+                credentials=credentials,
+                uid=uid,
+                timeout=min(timeout, QUEUE_WAIT_TIMEOUT_MAX),
+            )
+        result = self.queue_stash.pop(credentials=credentials, uid=uid)
         if result.is_ok():
             return result.ok()
         return result.err()
@@ -475,23 +513,7 @@ class Node(AbstractNode):
                 )
             )
 
-        client = None
-        if node_uid in self.client_cache:
-            client = self.client_cache[node_uid]
-        else:
-            network_service = self.get_service(NetworkService)
-            peer = network_service.stash.get_by_uid(node_uid)
-
-            if peer.is_ok() and peer.ok():
-                peer = peer.ok()
-                context = NodeServiceContext(node=self)
-                client = peer.client_with_context(context=context)
-                self.client_cache[node_uid] = client
-
-        if client:
-            return client.connection.make_call(api_call)
-
-        return SyftError(message=(f"Node has no route to {node_uid}"))
+        return self.peer_client_pool.call(node_uid, api_call)
 
     def get_role_for_credentials(self, credentials: SyftVerifyKey) -> ServiceRole:
         role = self.get_service("userservice").get_role_for_credentials(
@@ -524,73 +546,67 @@ class Node(AbstractNode):
             return self.forward_message(api_call=api_call)
 
         if api_call.message.path == "queue":
-            return self.resolve_future(uid=api_call.message.kwargs["uid"])
+            return self.resolve_future(
+                credentials=api_call.credentials,
+                uid=api_call.message.kwargs["uid"],
+                timeout=api_call.message.kwargs.get("timeout", None),
+            )
 
         if api_call.message.path == "metadata":
             return self.metadata
 
         result = None
-        if self.is_subprocess or self.processes == 0:
-            credentials: SyftVerifyKey = api_call.credentials
-            api_call = api_call.message
-
-            role = self.get_role_for_credentials(credentials=credentials)
-            context = AuthedServiceContext(
-                node=self, credentials=credentials, role=role
+        # the jobs are managed by this process, so are the calls about them
+        is_queue_call = api_call.message.path.startswith("queue.")
+        if self.is_subprocess or self.processes == 0 or is_queue_call:
+            result = self.handle_verified_api_call(
+                credentials=api_call.credentials, api_call=api_call.message
             )
-
-            user_config_registry = UserServiceConfigRegistry.from_role(role)
-
-            if api_call.path not in user_config_registry:
-                if ServiceConfigRegistry.path_exists(api_call.path):
-                    return SyftError(
-                        message=f"As a `{role}`,"
-                        f"you have has no access to: {api_call.path}"
-                    )  # type: ignore
-                else:
-                    return SyftError(message=f"API call not in registered services: {api_call.path}")  # type: ignore
-
-            _private_api_path = user_config_registry.private_path_for(api_call.path)
-            method = self.get_service_method(_private_api_path)
-            try:
-                result = method(context, *api_call.args, **api_call.kwargs)
-            except Exception:
-                result = SyftError(
-                    message=f"Exception calling {api_call.path}. {traceback.format_exc()}"
-                )
         else:
-            worker_settings = WorkerSettings(
-                id=self.id,
-                name=self.name,
-                signing_key=self.signing_key,
-                document_store_config=self.document_store_config,
-                action_store_config=self.action_store_config,
-            )
+            role = self.get_role_for_credentials(credentials=api_call.credentials)
+            item = self.queue_manager.submit(api_call=api_call, role=role)
+            if item.is_err():
+                return SyftError(message=item.err())
+            item = item.ok()
 
-            task_uid = UID()
-            item = QueueItem(id=task_uid, node_uid=self.id)
-            # 🟡 TODO 36: Needs distributed lock
-            # self.queue_stash.set_placeholder(item)
-            # self.queue_stash.partition.commit()
-            thread = gevent.spawn(
-                queue_task,
-                api_call,
-                worker_settings,
-                task_uid,
-                api_call.message.blocking,
-            )
             if api_call.message.blocking:
-                gevent.joinall([thread])
-                signed_result = thread.value
-
-                if not signed_result.is_valid:
-                    return SyftError(message="The result signature is invalid")  # type: ignore
+                # unsigned, it comes from our own worker process
+                api_data = self.queue_manager.wait(item.id)
+                if api_data is None:
+                    return SyftError(message=f"Job {item.id} failed or was cancelled")  # type: ignore
 
-                result = signed_result.message.data
+                result = api_data.data
             else:
                 result = item
         return result
 
+    def handle_verified_api_call(
+        self, credentials: SyftVerifyKey, api_call: SyftAPICall
+    ) -> Result[Union[QueueItem, SyftObject], Err]:
+        """Run a call in this process, its signature has been checked already"""
+        role = self.get_role_for_credentials(credentials=credentials)
+        context = AuthedServiceContext(node=self, credentials=credentials, role=role)
+
+        user_config_registry = UserServiceConfigRegistry.from_role(role)
+
+        if api_call.path not in user_config_registry:
+            if ServiceConfigRegistry.path_exists(api_call.path):
+                return SyftError(
+                    message=f"As a `{role}`,"
+                    f"you have has no access to: {api_call.path}"
+                )  # type: ignore
+            else:
+                return SyftError(message=f"API call not in registered services: {api_call.path}")  # type: ignore
+
+        _private_api_path = user_config_registry.private_path_for(api_call.path)
+        method = self.get_service_method(_private_api_path)
+        try:
+            return method(context, *api_call.args, **api_call.kwargs)
+        except Exception:
+            return SyftError(
+                message=f"Exception calling {api_call.path}. {traceback.format_exc()}"
+            )
+
     def get_api(self, for_user: Optional[SyftVerifyKey] = None) -> SyftAPI:
         return SyftAPI.for_user(node=self, user_verify_key=for_user)
 
@@ -607,14 +623,20 @@ class Node(AbstractNode):
 
 
 def task_producer(
-    pipe: _GIPCDuplexHandle, api_call: SyftAPICall, blocking: bool
+    pipe: _GIPCDuplexHandle, api_call: SignedSyftAPICall, blocking: bool
 ) -> Any:
+    # third party
+    import gevent
+    import gipc
+
     print("task_producer: Start")
 
     try:
         result = None
         with pipe:
-            pipe.put(api_call)
+            # the node checked the signature, the worker gets the call itself so
+            # its arrays can go through shared memory
+            pipe.put((api_call.credentials, api_call.message))
             gevent.sleep(0)
             if blocking:
                 try:
@@ -649,16 +671,33 @@ def task_runner(
     )
     try:
         with pipe:
-            api_call = pipe.get()
+            credentials, api_call = pipe.get()
 
-            result = worker.handle_api_call(api_call)
+            result = worker.handle_verified_api_call(
+                credentials=credentials, api_call=api_call
+            )
             if blocking:
-                pipe.put(result)
+                # unsigned like the call, so the result is in shared memory too
+                pipe.put(SyftAPIData(data=result))
             else:
                 item = QueueItem(
-                    node_uid=worker.id, id=task_uid, result=result, resolved=True
+                    node_uid=worker.id,
+                    id=task_uid,
+                    result=SyftAPIData(data=result).sign(worker.signing_key),
+                    resolved=True,
+                    status=Status.COMPLETED,
+                )
+                # the caller has to be able to read the result of their task
+                read_permission = ActionObjectPermission(
+                    uid=task_uid,
+                    permission=ActionPermission.READ,
+                    credentials=credentials,
+                )
+                worker.queue_stash.set_result(
+                    credentials=worker.signing_key.verify_key,
+                    item=item,
+                    add_permissions=[read_permission],
                 )
-                worker.queue_stash.set_result(item)
                 worker.queue_stash.partition.close()
             pipe.close()
     except Exception as e:
@@ -673,22 +712,40 @@ def queue_task(
     task_uid: UID,
     blocking: bool,
 ) -> Optional[Any]:
+    # third party
+    import gevent
+    import gipc
+
     print("queue_task: Start")
 
-    with gipc.pipe(encoder=gipc_encoder, decoder=gipc_decoder, duplex=True) as (
-        cend,
-        pend,
-    ):
-        process = gipc.start_process(
-            task_runner, args=(cend, worker_settings, task_uid, blocking)
-        )
-        producer = gevent.spawn(task_producer, pend, api_call, blocking)
-        try:
+    # the arrays sent for this task, the ones which were never received are
+    # removed once both sides are done
+    prefix = task_array_prefix(task_uid)
+    encoder = partial(gipc_encoder, prefix=prefix)
+    try:
+        with gipc.pipe(encoder=encoder, decoder=gipc_decoder, duplex=True) as (
+            cend,
+            pend,
+        ):
+            process = gipc.start_process(
+                task_runner, args=(cend, worker_settings, task_uid, blocking)
+            )
+            producer = gevent.spawn(task_producer, pend, api_call, blocking)
+            try:
+                process.join()
+            except KeyboardInterrupt:
+                producer.kill(block=True)
+                process.terminate()
+            except gevent.GreenletExit:
+                # the job was cancelled
+                producer.kill(block=True)
+                process.terminate()
+                process.join()
+                raise
             process.join()
-        except KeyboardInterrupt:
-            producer.kill(block=True)
-            process.terminate()
-        process.join()
+            producer.join()
+    finally:
+        unlink_shared_arrays(prefix)
 
     if blocking:
         print("queue_task: End")
@@ -0,0 +1,216 @@
+# stdlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ..abstract_node import AbstractNode
+from ..client.api import SignedSyftAPICall
+from ..client.api import SyftAPICall
+from ..client.client import SyftClient
+from ..service.context import NodeServiceContext
+from ..service.network.network_service import NetworkService
+from ..service.response import SyftError
+from ..types.uid import UID
+from ..util.experimental_flags import flags
+
+
+class PeerClientPool:
+    """Clients of the peers of a node, by node id.
+
+    A client is made from the first route of the peer in the NetworkService and
+    reused until its TTL runs out. The least recently used clients are dropped
+    when there are more than `max_size`, and the client of a peer is dropped as
+    soon as a call through its route raises, so the next call looks it up again.
+    The settings which aren't given are read from the experimental flags.
+    """
+
+    def __init__(
+        self,
+        node: AbstractNode,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        fan_out_workers: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.node = node
+        self.ttl = flags.PEER_CLIENT_TTL if ttl is None else ttl
+        self.max_size = flags.PEER_CLIENT_POOL_SIZE if max_size is None else max_size
+        self.fan_out_workers = (
+            flags.PEER_FAN_OUT_WORKERS if fan_out_workers is None else fan_out_workers
+        )
+        self.clock = clock
+        self._clients: "OrderedDict[UID, Tuple[SyftClient, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, node_uid: UID) -> Result[SyftClient, str]:
+        with self._lock:
+            entry = self._clients.get(node_uid, None)
+            if entry is not None:
+                client, expires_at = entry
+                if self.clock() < expires_at:
+                    self._clients.move_to_end(node_uid)
+                    return Ok(client)
+                del self._clients[node_uid]
+
+        # made outside of the lock, a python route starts a worker
+        client = self._connect(node_uid)
+        if client.is_err():
+            return client
+
+        with self._lock:
+            self._clients[node_uid] = (client.ok(), self.clock() + self.ttl)
+            self._clients.move_to_end(node_uid)
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def _connect(self, node_uid: UID) -> Result[SyftClient, str]:
+        if NetworkService not in self.node.services:
+            return Err(
+                "Node has no network service so we can't "
+                f"forward this message to {node_uid}"
+            )
+        network_service = self.node.get_service(NetworkService)
+        peer = network_service.stash.get_by_uid(
+            self.node.signing_key.verify_key, node_uid
+        )
+        if peer.is_err():
+            return peer
+        if peer.ok() is None:
+            return Err(f"Node has no route to {node_uid}")
+        try:
+            context = NodeServiceContext(node=self.node)
+            return Ok(peer.ok().client_with_context(context=context))
+        except Exception as e:
+            return Err(f"Failed to connect to {node_uid}: {e}")
+
+    def evict(self, node_uid: UID) -> None:
+        with self._lock:
+            self._clients.pop(node_uid, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def __contains__(self, node_uid: UID) -> bool:
+        return node_uid in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def call(
+        self,
+        node_uid: UID,
+        api_call: SignedSyftAPICall,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Send a signed call to a peer, like its connection would. An HTTP call
+        raises after `timeout` seconds without an answer, which evicts the peer."""
+        client = self.get(node_uid)
+        if client.is_err():
+            return SyftError(message=client.err())
+        try:
+            return client.ok().connection.make_call(api_call, timeout=timeout)
+        except Exception as e:
+            # the route is broken, don't hand out its client again
+            self.evict(node_uid)
+            return SyftError(message=f"Failed to call {node_uid}: {e}")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.fan_out_workers, thread_name_prefix="syft-peer"
+                )
+            return self._executor
+
+    def _submit(self, *args: Any) -> Future:
+        executor = self._get_executor()
+        try:
+            return executor.submit(*args)
+        except RuntimeError:
+            # shut down since it was handed out, the next one takes the call
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            return self._get_executor().submit(*args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _call_unsigned(
+        self, node_uid: UID, message: SyftAPICall, deadline: float
+    ) -> Any:
+        # the time waiting for a free thread counts
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            return SyftError(message=f"{node_uid} wasn't called in time")
+        api_call = message.copy(update={"node_uid": node_uid})
+        signed_result = self.call(
+            node_uid, api_call.sign(self.node.signing_key), timeout=timeout
+        )
+        if isinstance(signed_result, SyftError):
+            return signed_result
+        if not isinstance(signed_result, SignedSyftAPICall):
+            return SyftError(message=f"The result of {node_uid} is not signed")
+        if not signed_result.is_valid:
+            return SyftError(message=f"The result signature of {node_uid} is invalid")
+        return signed_result.message.data
+
+    def fan_out(
+        self,
+        message: SyftAPICall,
+        peers: List[UID],
+        timeout: Optional[float] = None,
+    ) -> Dict[UID, Any]:
+        """Send `message` to every peer at once, signed by this node.
+
+        Returns the result of each peer by its id, or a SyftError for the peers
+        which failed or didn't answer within `timeout` seconds, including the
+        time waiting for a free thread. Each call times out on its own, so a
+        slow peer only delays its own result and gives its thread back. The
+        peers which didn't answer in time are evicted.
+        """
+        if timeout is None:
+            timeout = flags.PEER_CALL_TIMEOUT
+        # one deadline for all, the calls were sent at the same time
+        deadline = time.monotonic() + timeout
+        futures = {
+            peer: self._submit(self._call_unsigned, peer, message, deadline)
+            for peer in dict.fromkeys(peers)
+        }
+        results: Dict[UID, Any] = {}
+        for peer, future in futures.items():
+            try:
+                results[peer] = future.result(
+                    timeout=max(0.0, deadline - time.monotonic())
+                )
+            except TimeoutError:
+                # not sent yet, its result isn't waited for anymore
+                future.cancel()
+                self.evict(peer)
+                results[peer] = SyftError(
+                    message=f"{peer} didn't answer within {timeout} seconds"
+                )
+            except Exception as e:
+                results[peer] = SyftError(message=f"Failed to call {peer}: {e}")
+        return results
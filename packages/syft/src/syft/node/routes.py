@@ -1,11 +1,20 @@
 # stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from functools import partial
+import os
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 # third party
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import Depends
+from fastapi import HTTPException
 from fastapi import Request
 from fastapi import Response
 from fastapi.responses import JSONResponse
@@ -14,6 +23,10 @@ from pydantic import ValidationError
 
 # relative
 from ..abstract_node import AbstractNode
+from ..serde.compression import accept_encoding_header
+from ..serde.compression import choose_encoding
+from ..serde.compression import compress_body
+from ..serde.compression import decompress_body
 from ..serde.deserialize import _deserialize as deserialize
 from ..serde.serialize import _serialize as serialize
 from ..service.context import NodeServiceContext
@@ -29,8 +42,21 @@ from .credentials import SyftVerifyKey
 from .credentials import UserLoginCredentials
 from .worker import Worker
 
+# threads which run the API calls and the password hashing of logins / registers,
+# kept apart so a burst of logins can't starve the API calls
+API_CALL_WORKERS = int(os.getenv("SYFT_API_CALL_WORKERS", 16))
+LOGIN_WORKERS = int(os.getenv("SYFT_LOGIN_WORKERS", 4))
+# threads which hold the long polls for queue results, which can each wait for
+# up to QUEUE_WAIT_TIMEOUT_MAX seconds, so they don't starve the API calls
+QUEUE_WAIT_WORKERS = int(os.getenv("SYFT_QUEUE_WAIT_WORKERS", 32))
 
-def make_routes(worker: Worker) -> APIRouter:
+
+def make_routes(
+    worker: Worker,
+    api_call_workers: int = API_CALL_WORKERS,
+    login_workers: int = LOGIN_WORKERS,
+    queue_wait_workers: int = QUEUE_WAIT_WORKERS,
+) -> APIRouter:
     if TRACE_MODE:
         # third party
         from opentelemetry import trace
@@ -38,7 +64,26 @@ def make_routes(worker: Worker) -> APIRouter:
 
     router = APIRouter()
 
+    api_call_executor = ThreadPoolExecutor(
+        max_workers=api_call_workers, thread_name_prefix="syft-api-call"
+    )
+    login_executor = ThreadPoolExecutor(
+        max_workers=login_workers, thread_name_prefix="syft-login"
+    )
+    queue_wait_executor = ThreadPoolExecutor(
+        max_workers=queue_wait_workers, thread_name_prefix="syft-queue-wait"
+    )
+
+    async def run_in_executor(
+        executor: ThreadPoolExecutor, func: Callable, *args: Any
+    ) -> Any:
+        # the context carries the current tracing span into the executor thread
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(context.run, func, *args))
+
     async def get_body(request: Request) -> bytes:
+        # the body is read on the event loop as it arrives, without holding a thread
         return await request.body()
 
     @router.get(
@@ -71,48 +116,93 @@ def make_routes(worker: Worker) -> APIRouter:
             media_type="application/octet-stream",
         )
 
-    def handle_syft_new_api(user_verify_key: SyftVerifyKey) -> Response:
-        return Response(
+    def compressed_response(content: bytes, accept_encoding: Optional[str]) -> Response:
+        body, encoding = compress_body(content, choose_encoding(accept_encoding))
+        # tells the client which encodings it can use for its requests
+        headers = {"Accept-Encoding": accept_encoding_header()}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(body, media_type="application/octet-stream", headers=headers)
+
+    def handle_syft_new_api(
+        user_verify_key: SyftVerifyKey, accept_encoding: Optional[str]
+    ) -> Response:
+        return compressed_response(
             serialize(worker.get_api(user_verify_key), to_bytes=True),
-            media_type="application/octet-stream",
+            accept_encoding,
         )
 
     # get the SyftAPI object
     @router.get("/api")
-    def syft_new_api(request: Request, verify_key: str) -> Response:
+    async def syft_new_api(request: Request, verify_key: str) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
+        accept_encoding = request.headers.get("Accept-Encoding")
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api.__module__).start_as_current_span(
                 syft_new_api.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_syft_new_api(user_verify_key)
+                return await run_in_executor(
+                    api_call_executor,
+                    handle_syft_new_api,
+                    user_verify_key,
+                    accept_encoding,
+                )
         else:
-            return handle_syft_new_api(user_verify_key)
+            return await run_in_executor(
+                api_call_executor, handle_syft_new_api, user_verify_key, accept_encoding
+            )
 
-    def handle_new_api_call(data: bytes) -> Response:
+    def parse_api_call(
+        data: bytes, content_encoding: Optional[str]
+    ) -> Tuple[Any, bool]:
+        """The call in the body and if it is a long poll for a queue result"""
+        try:
+            data = decompress_body(data, content_encoding)
+        except ValueError as e:
+            raise HTTPException(status_code=415, detail=str(e))
         obj_msg = deserialize(blob=data, from_bytes=True)
+        message = getattr(obj_msg, "message", obj_msg)
+        is_queue_wait = getattr(message, "path", None) == "queue" and bool(
+            message.kwargs.get("timeout", None)
+        )
+        return obj_msg, is_queue_wait
+
+    def handle_new_api_call(obj_msg: Any, accept_encoding: Optional[str]) -> Response:
         result = worker.handle_api_call(api_call=obj_msg)
-        return Response(
-            serialize(result, to_bytes=True),
-            media_type="application/octet-stream",
+        return compressed_response(serialize(result, to_bytes=True), accept_encoding)
+
+    async def run_new_api_call(
+        data: bytes, content_encoding: Optional[str], accept_encoding: Optional[str]
+    ) -> Response:
+        obj_msg, is_queue_wait = await run_in_executor(
+            api_call_executor, parse_api_call, data, content_encoding
+        )
+        # long polls wait on their own threads, the API calls keep theirs
+        executor = queue_wait_executor if is_queue_wait else api_call_executor
+        return await run_in_executor(
+            executor, handle_new_api_call, obj_msg, accept_encoding
         )
 
     # make a request to the SyftAPI
     @router.post("/api_call")
-    def syft_new_api_call(
+    async def syft_new_api_call(
         request: Request, data: bytes = Depends(get_body)
     ) -> Response:
+        encodings = (
+            request.headers.get("Content-Encoding"),
+            request.headers.get("Accept-Encoding"),
+        )
         if TRACE_MODE:
             with trace.get_tracer(syft_new_api_call.__module__).start_as_current_span(
                 syft_new_api_call.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_new_api_call(data)
+                return await run_new_api_call(data, *encodings)
         else:
-            return handle_new_api_call(data)
+            return await run_new_api_call(data, *encodings)
 
     def handle_login(email: str, password: str, node: AbstractNode) -> Any:
         try:
@@ -162,7 +252,7 @@ def make_routes(worker: Worker) -> APIRouter:
 
     # exchange email and password for a SyftSigningKey
     @router.post("/login", name="login", status_code=200)
-    def login(
+    async def login(
         request: Request,
         email: str = Body(..., example="info@openmined.org"),
         password: str = Body(..., example="changethis"),
@@ -173,20 +263,26 @@ def make_routes(worker: Worker) -> APIRouter:
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_login(email, password, worker)
+                return await run_in_executor(
+                    login_executor, handle_login, email, password, worker
+                )
         else:
-            return handle_login(email, password, worker)
+            return await run_in_executor(
+                login_executor, handle_login, email, password, worker
+            )
 
     @router.post("/register", name="register", status_code=200)
-    def register(request: Request, data: bytes = Depends(get_body)) -> Any:
+    async def register(request: Request, data: bytes = Depends(get_body)) -> Any:
         if TRACE_MODE:
             with trace.get_tracer(register.__module__).start_as_current_span(
                 register.__qualname__,
                 context=extract(request.headers),
                 kind=trace.SpanKind.SERVER,
             ):
-                return handle_register(data, worker)
+                return await run_in_executor(
+                    login_executor, handle_register, data, worker
+                )
         else:
-            return handle_register(data, worker)
+            return await run_in_executor(login_executor, handle_register, data, worker)
 
     return router
@@ -11,6 +11,9 @@ from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
 from .deserialize import _deserialize
 from .serialize import _serialize
+from .shared_memory import from_shared_memory
+from .shared_memory import should_share
+from .shared_memory import to_shared_memory
 
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
@@ -111,7 +114,9 @@ def arraytonumpyutf8(string_list: Union[str, np.ndarray]) -> bytes:
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
+    if should_share(obj):
+        return cast(bytes, _serialize(to_shared_memory(obj), to_bytes=True))
+    elif obj.dtype.type != np.str_:
         return arrow_serialize(obj)
     else:
         return arraytonumpyutf8(obj)
@@ -123,5 +128,7 @@ def numpy_deserialize(buf: bytes) -> np.ndarray:
         return arrow_deserialize(*deser)
     elif isinstance(deser, np.ndarray):
         return numpyutf8toarray(deser)
+    elif isinstance(deser, dict):
+        return from_shared_memory(deser)
     else:
         raise ValueError(f"Invalid type:{type(deser)} for numpy deserialization")
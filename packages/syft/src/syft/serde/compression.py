@@ -0,0 +1,113 @@
+# stdlib
+import struct
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+import pyarrow as pa
+
+# relative
+from ..util.experimental_flags import ApacheArrowCompression
+from ..util.experimental_flags import flags
+
+# content codings of HTTP bodies in order of preference. The compressed body is
+# prefixed with its size, so they are named apart from the standard zstd coding.
+CONTENT_ENCODINGS = {
+    "syft-zstd": ApacheArrowCompression.ZSTD,
+    "syft-lz4": ApacheArrowCompression.LZ4,
+}
+IDENTITY = "identity"
+
+SIZE_HEADER = struct.Struct("<Q")
+
+# bytes of the body compressed to estimate if compressing all of it pays off
+SAMPLE_BYTES = 2**13
+# skip compression when the sample shrinks less than this, e.g. arrow buffers
+# which are already compressed
+MIN_SAMPLE_SAVING = 0.1
+
+
+def available_encodings() -> List[str]:
+    return [
+        encoding
+        for encoding, codec in CONTENT_ENCODINGS.items()
+        if pa.Codec.is_available(codec.value)
+    ]
+
+
+def accept_encoding_header() -> str:
+    return ", ".join(available_encodings() + [IDENTITY])
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Our preferred content coding which the other side accepts, if any"""
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for token in accept_encoding.split(","):
+        name, _, param = token.partition(";")
+        param = param.replace(" ", "")
+        try:
+            rejected = param.startswith("q=") and float(param[2:]) == 0
+        except ValueError:
+            rejected = False
+        if not rejected:
+            accepted.add(name.strip().lower())
+    for encoding in available_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def _sample(body: bytes) -> bytes:
+    if len(body) <= 3 * SAMPLE_BYTES:
+        return body
+    middle = (len(body) - SAMPLE_BYTES) // 2
+    return (
+        body[:SAMPLE_BYTES]
+        + body[middle : middle + SAMPLE_BYTES]
+        + body[-SAMPLE_BYTES:]
+    )
+
+
+def compress_body(body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """Compress a HTTP body with `encoding` if it is large and compressible.
+
+    Returns the body and the content coding which was applied, None if the body
+    was left as is.
+    """
+    min_bytes = flags.HTTP_COMPRESSION_MIN_BYTES
+    if encoding is None or min_bytes <= 0 or len(body) < min_bytes:
+        return body, None
+
+    codec = CONTENT_ENCODINGS[encoding].value
+    sample = _sample(body)
+    compressed_sample = pa.compress(sample, codec=codec, asbytes=True)
+    if len(compressed_sample) > len(sample) * (1 - MIN_SAMPLE_SAVING):
+        return body, None
+
+    compressed = pa.compress(body, codec=codec, asbytes=True)
+    return SIZE_HEADER.pack(len(body)) + compressed, encoding
+
+
+def decompress_body(body: bytes, encoding: Optional[str]) -> bytes:
+    if not encoding or encoding.lower() == IDENTITY:
+        return body
+    if encoding.lower() not in CONTENT_ENCODINGS:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+    if len(body) < SIZE_HEADER.size:
+        raise ValueError("Compressed body is too short")
+
+    (size,) = SIZE_HEADER.unpack_from(body)
+    if size > flags.MAX_DECOMPRESSED_BYTES:
+        raise ValueError(f"Compressed body is too large: {size} bytes")
+    try:
+        return pa.decompress(
+            body[SIZE_HEADER.size :],
+            decompressed_size=size,
+            codec=CONTENT_ENCODINGS[encoding.lower()].value,
+            asbytes=True,
+        )
+    except (pa.ArrowException, OSError) as e:
+        raise ValueError(f"Compressed body is corrupt: {e}") from e
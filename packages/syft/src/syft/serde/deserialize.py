@@ -11,6 +11,7 @@ def _deserialize(
     from_bytes: bool = False,
 ) -> Any:
     # relative
+    from .recursive import fixed_layout_serde
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
 
@@ -26,6 +27,9 @@ def _deserialize(
         raise TypeError("Wrong deserialization format.")
 
     if from_bytes:
+        serde = fixed_layout_serde(blob)
+        if serde is not None:
+            return serde.deserialize(blob)
         return rs_bytes2object(blob)
 
     if from_proto:
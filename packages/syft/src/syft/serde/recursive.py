@@ -1,13 +1,19 @@
 # stdlib
+from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum
 import sys
 import threading
 import types
 from typing import Any
 from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -25,8 +31,55 @@ from .capnp import get_capnp_schema
 
 TYPE_BANK = {}
 
+# top level module name -> callables which register the serde for that module's types
+# these are only run the first time a type from that module is serialized or
+# deserialized so heavy third party libraries aren't imported with syft
+LAZY_TYPE_BANK: Dict[str, List[Callable]] = defaultdict(list)
+_lazy_type_bank_lock = threading.RLock()
+
 recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde  # type: ignore
 
+_trusted = threading.local()
+
+
+@contextmanager
+def trusted_deserialize() -> Iterator[None]:
+    """Skip the validation of opted in pydantic objects while deserializing.
+
+    Only for data the node serialized itself, like the rows of its stores.
+    Classes with `__trusted_construct__ = True` are then created with
+    `construct()` from the deserialized fields instead of their validating
+    constructor. Anything else, like the messages of clients, is validated.
+    """
+    active = getattr(_trusted, "active", False)
+    _trusted.active = True
+    try:
+        yield
+    finally:
+        _trusted.active = active
+
+
+def is_trusted_deserialize() -> bool:
+    return getattr(_trusted, "active", False)
+
+
+# pydantic class -> names of its required fields
+_required_fields: Dict[type, Set[str]] = {}
+
+
+def can_construct(class_type: Type[BaseModel], kwargs: Dict[str, Any]) -> bool:
+    """If `class_type` can be created from `kwargs` without validating them"""
+    if not (
+        getattr(class_type, "__trusted_construct__", False) and is_trusted_deserialize()
+    ):
+        return False
+    if class_type not in _required_fields:
+        _required_fields[class_type] = {
+            name for name, field in class_type.__fields__.items() if field.required
+        }
+    # e.g. ids which aren't serialized are created by the validators
+    return _required_fields[class_type].issubset(kwargs)
+
 
 def thread_ident() -> int:
     return int(threading.current_thread().ident)
@@ -97,6 +150,138 @@ def recursive_serde_register(
     )
 
 
+def recursive_serde_register_lazy(*module_names: str) -> Callable:
+    """
+    Defer a serde registration function until one of `module_names` is encountered.
+
+    Args:
+        `module_names` : Top level module names of the types registered by the function
+
+    Returns:
+        Decorated function
+    """
+
+    def lazy_decorator(register: Callable) -> Callable:
+        with _lazy_type_bank_lock:
+            for module_name in module_names:
+                LAZY_TYPE_BANK[module_name].append(register)
+        return register
+
+    return lazy_decorator
+
+
+def resolve_lazy_serde(fqn: str) -> bool:
+    """Run the deferred registrations for the top level module of `fqn`."""
+    module_name = fqn.split(".", 1)[0]
+    with _lazy_type_bank_lock:
+        registers = LAZY_TYPE_BANK.pop(module_name, None)
+        if not registers:
+            return False
+
+        for register in registers:
+            # the same function can be deferred for several modules
+            for other_registers in LAZY_TYPE_BANK.values():
+                if register in other_registers:
+                    other_registers.remove(register)
+            register()
+    return fqn in TYPE_BANK
+
+
+class FixedLayoutSerde:
+    """Serde of a type whose message only differs in a fixed size payload.
+
+    The recursive serde message of e.g. a UID is the same for every UID apart
+    from its 16 bytes, so instead of building the capnp messages the payload is
+    copied into, or out of, a template message. The bytes are the same as the
+    ones rs_object2proto writes, so both sides of the wire can use either path.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        payload_size: int,
+        to_payload: Callable[[Any], bytes],
+        from_payload: Callable[[bytes], Any],
+    ) -> None:
+        self.cls = cls
+        self.payload_size = payload_size
+        self.to_payload = to_payload
+        self.from_payload = from_payload
+        self._template: Optional[Tuple[bytes, bytes]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def template(self) -> Tuple[bytes, bytes]:
+        """The message bytes before and after the payload"""
+        if self._template is None:
+            with self._lock:
+                if self._template is None:
+                    self._template = self._build_template()
+        return self._template
+
+    def _build_template(self) -> Tuple[bytes, bytes]:
+        zeros = rs_object2proto(self.from_payload(bytes(self.payload_size)))
+        ones = rs_object2proto(self.from_payload(b"\xff" * self.payload_size))
+        zeros, ones = zeros.to_bytes(), ones.to_bytes()
+        diff = [i for i, (a, b) in enumerate(zip(zeros, ones)) if a != b]
+        start = diff[0] if diff else -1
+        if len(zeros) != len(ones) or diff != list(
+            range(start, start + self.payload_size)
+        ):
+            raise ValueError(f"{self.cls} doesn't have a fixed layout message")
+        return zeros[:start], zeros[start + self.payload_size :]
+
+    def serialize(self, obj: Any) -> bytes:
+        prefix, suffix = self.template
+        return prefix + self.to_payload(obj) + suffix
+
+    def match(self, blob: bytes) -> bool:
+        prefix, suffix = self.template
+        return (
+            len(blob) == len(prefix) + self.payload_size + len(suffix)
+            and blob.startswith(prefix)
+            and blob.endswith(suffix)
+        )
+
+    def deserialize(self, blob: bytes) -> Any:
+        start = len(self.template[0])
+        return self.from_payload(blob[start : start + self.payload_size])
+
+
+# exact type -> serde used instead of the recursive one when (de)serializing bytes
+FIXED_LAYOUT_TYPE_BANK: Dict[type, FixedLayoutSerde] = {}
+
+
+def recursive_serde_register_fixed_layout(
+    cls: type,
+    payload_size: int,
+    to_payload: Callable[[Any], bytes],
+    from_payload: Callable[[bytes], Any],
+) -> None:
+    """
+    Splice the payload of `cls` into a template message when (de)serializing bytes.
+
+    Only for recursive serde types whose messages differ in nothing but a
+    `payload_size` bytes payload, subclasses still use the recursive serde.
+
+    Args:
+        `cls`          : Type already registered with the recursive serde
+        `payload_size` : Size of the payload in bytes
+        `to_payload`   : Returns the payload of an instance
+        `from_payload` : Creates an instance from its payload
+    """
+    FIXED_LAYOUT_TYPE_BANK[cls] = FixedLayoutSerde(
+        cls, payload_size, to_payload, from_payload
+    )
+
+
+def fixed_layout_serde(blob: bytes) -> Optional[FixedLayoutSerde]:
+    for serde in FIXED_LAYOUT_TYPE_BANK.values():
+        if serde.match(blob):
+            return serde
+    return None
+
+
 def chunk_bytes(
     data: bytes, field_name: Union[str, int], builder: _DynamicStructBuilder
 ) -> None:
@@ -126,7 +311,7 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
 
     msg = recursive_scheme.new_message()
     fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
+    if fqn not in TYPE_BANK and not resolve_lazy_serde(fqn):
         # third party
         raise Exception(f"{fqn} not in TYPE_BANK")
 
@@ -148,6 +333,11 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
         chunk_bytes(serialize(self), "nonrecursiveBlob", msg)
         return msg
 
+    # so objects stored by an older version of a class can still be read
+    version = getattr(cls, "__version__", None)
+    if isinstance(version, int) and hasattr(cls, "__canonical_name__"):
+        msg.version = version
+
     if attribute_list is None:
         attribute_list = self.__dict__.keys()
 
@@ -176,6 +366,18 @@ def rs_object2proto(self: Any) -> _DynamicStructBuilder:
     return msg
 
 
+def versioned_class(class_type: type, version: int) -> type:
+    """The class of `version` with the same canonical name as `class_type`"""
+    # relative
+    from ..types.syft_object import SyftObjectRegistry
+
+    canonical_name = getattr(class_type, "__canonical_name__", None)
+    if canonical_name is None:
+        return class_type
+    versioned = SyftObjectRegistry.versioned_class(name=canonical_name, version=version)
+    return class_type if versioned is None else versioned
+
+
 def rs_bytes2object(blob: bytes) -> Any:
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
@@ -185,6 +387,41 @@ def rs_bytes2object(blob: bytes) -> Any:
         return rs_proto2object(msg)
 
 
+def rs_bytes2fields(
+    blob: bytes, fields: Collection[str], lengths: Collection[str] = ()
+) -> Dict[str, Any]:
+    """Deserialize only the `fields` of a serialized object, and the number of items
+    of its `lengths` collections without deserializing the items.
+
+    Views of large stored objects are built from these, fields which aren't in the
+    blob are left out.
+    """
+    # relative
+    from .deserialize import _deserialize
+    from .recursive_primitives import iterable_length
+
+    MAX_TRAVERSAL_LIMIT = 2**64 - 1
+    values: Dict[str, Any] = {}
+
+    with recursive_scheme.from_bytes(  # type: ignore
+        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+    ) as msg:
+        entry = TYPE_BANK.get(msg.fullyQualifiedName)
+        serde_overrides = entry[4] if entry is not None else {}
+        for attr_name, attr_bytes_list in zip(msg.fieldsName, msg.fieldsData):
+            if attr_name in fields:
+                attr_value = _deserialize(
+                    combine_bytes(attr_bytes_list), from_bytes=True
+                )
+                transforms = serde_overrides.get(attr_name, None)
+                if transforms is not None:
+                    attr_value = transforms[1](attr_value)
+                values[attr_name] = attr_value
+            elif attr_name in lengths:
+                values[attr_name] = iterable_length(combine_bytes(attr_bytes_list))
+    return values
+
+
 def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
     # relative
     from .deserialize import _deserialize
@@ -212,7 +449,9 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
                 except Exception:  # nosec
                     pass
 
-    if proto.fullyQualifiedName not in TYPE_BANK:
+    if proto.fullyQualifiedName not in TYPE_BANK and not resolve_lazy_serde(
+        proto.fullyQualifiedName
+    ):
         raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
 
     # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
@@ -241,6 +480,11 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
 
         return deserialize(combine_bytes(proto.nonrecursiveBlob))
 
+    version = proto.version
+    if version and version != getattr(class_type, "__version__", version):
+        class_type = versioned_class(class_type, version)
+        serde_overrides = getattr(class_type, "__serde_overrides__", {})
+
     kwargs = {}
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
@@ -267,6 +511,12 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
             obj = class_type()
             for attr_name, attr_value in kwargs.items():
                 setattr(obj, attr_name, attr_value)
+        elif can_construct(class_type, kwargs):
+            obj = class_type.construct(**kwargs)
+            # the part of __init__ which doesn't validate
+            post_init = getattr(obj, "__post_init__", None)
+            if post_init is not None:
+                post_init()
         else:
             obj = class_type(**kwargs)
 
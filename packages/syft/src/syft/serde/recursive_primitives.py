@@ -66,6 +66,33 @@ def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
     return iterable_type(values)
 
 
+def iterable_length(blob: bytes) -> int:
+    """The number of items of a serialized collection, without deserializing them"""
+    # relative
+    from .deserialize import _deserialize
+    from .recursive import recursive_scheme
+
+    MAX_TRAVERSAL_LIMIT = 2**64 - 1
+
+    with recursive_scheme.from_bytes(  # type: ignore
+        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+    ) as msg:
+        fqn = msg.fullyQualifiedName
+        if fqn in ("builtins.list", "builtins.tuple", "builtins.set"):
+            schema, items = iterable_schema, "values"
+        elif fqn == "builtins.dict":
+            schema, items = kv_iterable_schema, "keys"
+        else:
+            value = _deserialize(blob, from_bytes=True)
+            return 0 if value is None else len(value)
+
+        with schema.from_bytes(  # type: ignore
+            combine_bytes(msg.nonrecursiveBlob),
+            traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        ) as iterable:
+            return len(getattr(iterable, items))
+
+
 def serialize_kv(map: Mapping) -> bytes:
     # relative
     from .serialize import _serialize
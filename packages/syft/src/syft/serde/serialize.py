@@ -8,8 +8,12 @@ def _serialize(
     to_bytes: bool = False,
 ) -> Any:
     # relative
+    from .recursive import FIXED_LAYOUT_TYPE_BANK
     from .recursive import rs_object2proto
 
+    if to_bytes and type(obj) in FIXED_LAYOUT_TYPE_BANK:
+        return FIXED_LAYOUT_TYPE_BANK[type(obj)].serialize(obj)
+
     proto = rs_object2proto(obj)
 
     if to_bytes:
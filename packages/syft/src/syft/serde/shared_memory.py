@@ -0,0 +1,111 @@
+# stdlib
+from contextlib import contextmanager
+import os
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterator
+
+# third party
+import numpy as np
+
+# relative
+from ..util.experimental_flags import flags
+
+# tmpfs on linux, so the arrays never touch the disk
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+SHARED_ARRAY_PREFIX = "syft-array-"
+
+_shared_arrays = threading.local()
+
+
+@contextmanager
+def share_arrays(prefix: str = SHARED_ARRAY_PREFIX) -> Iterator[None]:
+    """Pass large numpy arrays through shared memory while (de)serializing.
+
+    Only used for messages between a node and its worker processes on the same
+    machine. An array is copied once into a shared memory file and the message
+    only carries its handle, the receiver maps the file instead of copying the
+    array through the pipe and unlinks it. The files are named with `prefix`, so
+    the sender can remove the ones a receiver never got with unlink_shared_arrays.
+    """
+    active = getattr(_shared_arrays, "active", False)
+    previous_prefix = getattr(_shared_arrays, "prefix", SHARED_ARRAY_PREFIX)
+    _shared_arrays.active = True
+    _shared_arrays.prefix = prefix
+    try:
+        yield
+    finally:
+        _shared_arrays.active = active
+        _shared_arrays.prefix = previous_prefix
+
+
+def is_sharing_arrays() -> bool:
+    return getattr(_shared_arrays, "active", False)
+
+
+def task_array_prefix(task_uid: Any) -> str:
+    return f"{SHARED_ARRAY_PREFIX}{task_uid}-"
+
+
+def unlink_shared_arrays(prefix: str) -> int:
+    """Remove the files with `prefix` which haven't been received"""
+    if not prefix.startswith(SHARED_ARRAY_PREFIX):
+        raise ValueError(f"Invalid shared memory prefix: {prefix}")
+    unlinked = 0
+    for name in os.listdir(SHARED_MEMORY_DIR):
+        if name.startswith(prefix):
+            try:
+                os.unlink(os.path.join(SHARED_MEMORY_DIR, name))
+                unlinked += 1
+            except FileNotFoundError:
+                # received in the meantime
+                pass
+    return unlinked
+
+
+def should_share(obj: np.ndarray) -> bool:
+    min_bytes = flags.SHARED_MEMORY_MIN_BYTES
+    return (
+        is_sharing_arrays()
+        and 0 < min_bytes <= obj.nbytes
+        and not obj.dtype.hasobject
+        and obj.dtype.fields is None
+    )
+
+
+def to_shared_memory(obj: np.ndarray) -> Dict[str, Any]:
+    prefix = getattr(_shared_arrays, "prefix", SHARED_ARRAY_PREFIX)
+    fd, path = tempfile.mkstemp(prefix=prefix, dir=SHARED_MEMORY_DIR)
+    os.close(fd)
+    try:
+        shared = np.memmap(path, dtype=obj.dtype, mode="w+", shape=obj.shape)
+        shared[...] = obj
+        shared.flush()
+        del shared
+    except Exception:
+        os.unlink(path)
+        raise
+    return {"path": path, "dtype": obj.dtype.str, "shape": obj.shape}
+
+
+def from_shared_memory(handle: Dict[str, Any]) -> np.ndarray:
+    path = os.path.realpath(handle["path"])
+    # handles can only come from our own worker processes
+    if (
+        not is_sharing_arrays()
+        or os.path.dirname(path) != os.path.realpath(SHARED_MEMORY_DIR)
+        or not os.path.basename(path).startswith(SHARED_ARRAY_PREFIX)
+    ):
+        raise ValueError(f"Invalid shared memory handle: {handle['path']}")
+
+    try:
+        # copy on write, the array is writable without changing the shared file
+        shared = np.memmap(
+            path, dtype=np.dtype(handle["dtype"]), mode="c", shape=handle["shape"]
+        )
+    finally:
+        # the mapping stays valid, the memory is freed when the array is
+        os.unlink(path)
+    return np.asarray(shared)
@@ -1,35 +1,39 @@
+# future
+from __future__ import annotations
+
 # stdlib
 from datetime import date
 from datetime import datetime
 from datetime import time
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 # third party
 from dateutil import parser
-import flax
-from flax.core.frozen_dict import FrozenDict
-from jax import numpy as jnp
-from jaxlib.xla_extension import DeviceArray
 from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 import numpy as np
-from pandas import DataFrame
-from pandas import Series
-from pandas._libs.tslibs.timestamps import Timestamp
 import pyarrow as pa
-import pyarrow.parquet as pq
 import pydantic
-from pymongo.collection import Collection
 from result import Err
 from result import Ok
 from result import Result
 
 # relative
+from ..util.experimental_flags import ApacheArrowCompression
+from ..util.experimental_flags import DataFrameCodec
+from ..util.experimental_flags import flags
 from .deserialize import _deserialize as deserialize
+from .recursive import recursive_serde_register_lazy
 from .recursive_primitives import recursive_serde_register
 from .recursive_primitives import recursive_serde_register_type
 from .serialize import _serialize as serialize
 
+if TYPE_CHECKING:
+    # third party
+    from pandas import DataFrame
+    from pandas import Series
+
 recursive_serde_register(
     SigningKey,
     serialize=lambda x: bytes(x),
@@ -53,12 +57,47 @@ recursive_serde_register(Result)
 # exceptions
 recursive_serde_register(cls=TypeError)
 
+
 # mongo collection
-recursive_serde_register_type(Collection)
+@recursive_serde_register_lazy("pymongo")
+def register_pymongo() -> None:
+    # third party
+    from pymongo.collection import Collection
 
+    recursive_serde_register_type(Collection)
+
+
+# parquet files start with this magic number, blobs written before the dataframe
+# codec was configurable are plain parquet files
+PARQUET_MAGIC = b"PAR1"
+
+# compression codecs which are supported inside of arrow ipc streams
+ARROW_IPC_COMPRESSION = {
+    ApacheArrowCompression.ZSTD: "zstd",
+    ApacheArrowCompression.LZ4: "lz4",
+}
+
+
+def arrow_ipc_write_table(table: pa.Table) -> bytes:
+    compression = ARROW_IPC_COMPRESSION.get(flags.APACHE_ARROW_COMPRESSION, None)
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_ipc_read_table(buf: bytes) -> pa.Table:
+    # py_buffer wraps the bytes without copying them and the compression is
+    # recorded in the stream so the reader doesn't depend on the current flags
+    with pa.ipc.open_stream(pa.py_buffer(buf)) as reader:
+        return reader.read_all()
+
+
+def parquet_write_table(table: pa.Table) -> bytes:
+    # third party
+    import pyarrow.parquet as pq
 
-def serialize_dataframe(df: DataFrame) -> bytes:
-    table = pa.Table.from_pandas(df)
     sink = pa.BufferOutputStream()
     # 🟡 TODO 37: Should we warn about this?
     parquet_args = {
@@ -66,37 +105,90 @@ def serialize_dataframe(df: DataFrame) -> bytes:
         "allow_truncated_timestamps": True,
     }
     pq.write_table(table, sink, **parquet_args)
-    buffer = sink.getvalue()
-    numpy_bytes = buffer.to_pybytes()
-    return numpy_bytes
+    return sink.getvalue().to_pybytes()
 
 
-def deserialize_dataframe(buf: bytes) -> DataFrame:
+def parquet_read_table(buf: bytes) -> pa.Table:
+    # third party
+    import pyarrow.parquet as pq
+
     reader = pa.BufferReader(buf)
-    numpy_bytes = reader.read_buffer()
-    result = pq.read_table(numpy_bytes)
-    df = result.to_pandas()
-    return df
+    return pq.read_table(reader.read_buffer())
 
 
-# pandas
-recursive_serde_register(
-    DataFrame,
-    serialize=serialize_dataframe,
-    deserialize=deserialize_dataframe,
-)
+def serialize_table(table: pa.Table) -> bytes:
+    codec = flags.DATAFRAME_CODEC
+    if codec is DataFrameCodec.PARQUET:
+        table_bytes = parquet_write_table(table)
+    else:
+        table_bytes = arrow_ipc_write_table(table)
+    return serialize((codec.value, table_bytes), to_bytes=True)
+
+
+def read_table(codec_value: str, table_bytes: bytes) -> pa.Table:
+    if DataFrameCodec(codec_value) is DataFrameCodec.PARQUET:
+        return parquet_read_table(table_bytes)
+    return arrow_ipc_read_table(table_bytes)
+
+
+def serialize_dataframe(df: DataFrame) -> bytes:
+    return serialize_table(pa.Table.from_pandas(df))
+
+
+def deserialize_dataframe(buf: bytes) -> DataFrame:
+    if buf[: len(PARQUET_MAGIC)] == PARQUET_MAGIC:
+        return parquet_read_table(buf).to_pandas()
+    return read_table(*deserialize(buf, from_bytes=True)).to_pandas()
+
+
+def serialize_series(series: Series) -> bytes:
+    try:
+        return serialize_table(pa.Table.from_pandas(series.to_frame()))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # object series with mixed python types can't be represented in arrow
+        # third party
+        from pandas import DataFrame
+
+        return serialize(DataFrame(series).to_dict(), to_bytes=True)
 
 
 def deserialize_series(blob: bytes) -> Series:
-    df = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return df[df.columns[0]]
+    # third party
+    from pandas import DataFrame
 
+    obj = deserialize(blob, from_bytes=True)
+    if isinstance(obj, dict):
+        df = DataFrame.from_dict(obj)
+        return df[df.columns[0]]
 
-recursive_serde_register(
-    Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
-    deserialize=deserialize_series,
-)
+    return read_table(*obj).to_pandas().iloc[:, 0]
+
+
+# pandas
+@recursive_serde_register_lazy("pandas")
+def register_pandas() -> None:
+    # third party
+    from pandas import DataFrame
+    from pandas import Series
+    from pandas._libs.tslibs.timestamps import Timestamp
+
+    recursive_serde_register(
+        DataFrame,
+        serialize=serialize_dataframe,
+        deserialize=deserialize_dataframe,
+    )
+
+    recursive_serde_register(
+        Series,
+        serialize=serialize_series,
+        deserialize=deserialize_series,
+    )
+
+    recursive_serde_register(
+        Timestamp,
+        serialize=lambda x: serialize(x.value, to_bytes=True),
+        deserialize=lambda x: Timestamp(deserialize(x, from_bytes=True)),
+    )
 
 
 recursive_serde_register(
@@ -117,12 +209,6 @@ recursive_serde_register(
     deserialize=lambda x: parser.parse(deserialize(x, from_bytes=True)).date(),
 )
 
-recursive_serde_register(
-    Timestamp,
-    serialize=lambda x: serialize(x.value, to_bytes=True),
-    deserialize=lambda x: Timestamp(deserialize(x, from_bytes=True)),
-)
-
 
 def serialize_bytes_io(io: BytesIO) -> bytes:
     io.seek(0)
@@ -135,30 +221,51 @@ recursive_serde_register(
     deserialize=lambda x: BytesIO(deserialize(x, from_bytes=True)),
 )
 
-try:
-    # third party
-    from IPython.display import Image
 
-    recursive_serde_register(Image)
+@recursive_serde_register_lazy("IPython")
+def register_ipython() -> None:
+    try:
+        # third party
+        from IPython.display import Image
+
+        recursive_serde_register(Image)
+
+    except Exception:  # nosec
+        pass
 
-except Exception:  # nosec
-    pass
 
 # jax
-recursive_serde_register(
-    DeviceArray,
-    serialize=lambda x: serialize(np.array(x), to_bytes=True),
-    deserialize=lambda x: jnp.array(deserialize(x, from_bytes=True)),
-)
+@recursive_serde_register_lazy("jax", "jaxlib")
+def register_jax() -> None:
+    # third party
+    from jax import numpy as jnp
+    from jaxlib.xla_extension import DeviceArray
 
+    recursive_serde_register(
+        DeviceArray,
+        serialize=lambda x: serialize(np.array(x), to_bytes=True),
+        deserialize=lambda x: jnp.array(deserialize(x, from_bytes=True)),
+    )
+
+
+@recursive_serde_register_lazy("flax")
+def register_flax() -> None:
+    # third party
+    import flax
+    from flax.core.frozen_dict import FrozenDict
+
+    recursive_serde_register(
+        FrozenDict,
+        serialize=lambda x: serialize(
+            flax.serialization.to_state_dict(x), to_bytes=True
+        ),
+        deserialize=lambda x: FrozenDict(
+            flax.serialization.from_state_dict(
+                FrozenDict, deserialize(x, from_bytes=True)
+            )
+        ),
+    )
 
-recursive_serde_register(
-    FrozenDict,
-    serialize=lambda x: serialize(flax.serialization.to_state_dict(x), to_bytes=True),
-    deserialize=lambda x: FrozenDict(
-        flax.serialization.from_state_dict(FrozenDict, deserialize(x, from_bytes=True))
-    ),
-)
 
 # how else do you import a relative file to execute it?
 NOTHING = None
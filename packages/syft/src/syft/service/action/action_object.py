@@ -9,6 +9,7 @@ from typing import Any
 from typing import Callable
 from typing import ClassVar
 from typing import Dict
+from typing import FrozenSet
 from typing import KeysView
 from typing import List
 from typing import Optional
@@ -246,16 +247,17 @@ def convert_to_pointers(
 
 
 def send_action_side_effect(context: PreHookContext, *args: Any, **kwargs: Any) -> Any:
+    if getattr(context.obj, "syft_node_uid", None) is None:
+        # fast path for local objects, skip building an action which can't be sent
+        return Err("send_action_side_effect failed, the object has no node_uid")
+
     try:
-        if context.op_name not in dont_make_side_effects and hasattr(
-            context.obj, "syft_node_uid"
-        ):
-            if getattr(context.obj, "syft_node_uid", None):
-                if context.action is not None:
-                    action = context.obj.syft_make_method_action(
-                        op=context.op_name, args=args, kwargs=kwargs
-                    )
-                    context.action = action
+        if context.op_name not in dont_make_side_effects:
+            if context.action is not None:
+                action = context.obj.syft_make_method_action(
+                    op=context.op_name, args=args, kwargs=kwargs
+                )
+                context.action = action
 
         result = make_action_side_effect(context, *args, **kwargs)
         if result.is_err():
@@ -296,11 +298,11 @@ def propagate_node_uid(
     ):
         return Ok(result)
 
-    try:
-        syft_node_uid = getattr(context.obj, "syft_node_uid", None)
-        if syft_node_uid is None:
-            raise RuntimeError("Can't proagate node_uid because parent doesnt have one")
+    syft_node_uid = getattr(context.obj, "syft_node_uid", None)
+    if syft_node_uid is None:
+        return Err("Can't propagate node_uid because parent doesnt have one")
 
+    try:
         if op not in context.obj._syft_dont_wrap_attrs():
             if hasattr(result, "syft_node_uid"):
                 setattr(result, "syft_node_uid", syft_node_uid)
@@ -351,6 +353,31 @@ class ActionObject(SyftObject):
     _syft_pre_hooks__: Dict[str, List] = {}
     _syft_post_hooks__: Dict[str, List] = {}
 
+    # dispatch table used by __getattribute__, see _syft_build_dispatch_table
+    _syft_passthrough_set: ClassVar[FrozenSet[str]] = frozenset()
+    _syft_dont_wrap_set: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._syft_build_dispatch_table()
+
+    @classmethod
+    def _syft_build_dispatch_table(cls) -> None:
+        """Merge the module and class level attr lists once per class."""
+
+        def class_default(name: str) -> List[str]:
+            field = cls.__fields__.get(name, None)
+            if field is not None:
+                return field.default or []
+            return getattr(cls, name, [])
+
+        cls._syft_passthrough_set = frozenset(
+            passthrough_attrs + class_default("syft_passthrough_attrs")
+        )
+        cls._syft_dont_wrap_set = frozenset(
+            dont_wrap_output_attrs + class_default("syft_dont_wrap_attrs")
+        )
+
     @property
     def syft_lineage_id(self) -> LineageID:
         """Compute the LineageID of the ActionObject, using the `id` and the `syft_history_hash` memebers"""
@@ -386,10 +413,7 @@ class ActionObject(SyftObject):
         return klass_method.__get__(obj)
 
     def syft_is_property(self, obj: Any, method: str) -> bool:
-        klass_method = getattr(type(obj), method, None)
-        return isinstance(klass_method, property) or inspect.isdatadescriptor(
-            klass_method
-        )
+        return _is_property(type(obj), method)
 
     def syft_execute_action(
         self, action: Action, sync: bool = True
@@ -706,13 +730,13 @@ class ActionObject(SyftObject):
 
         return result
 
-    def _syft_passthrough_attrs(self) -> List[str]:
+    def _syft_passthrough_attrs(self) -> FrozenSet[str]:
         """These attributes are forwarded to the `object` base class."""
-        return passthrough_attrs + getattr(self, "syft_passthrough_attrs", [])
+        return self._syft_passthrough_set
 
-    def _syft_dont_wrap_attrs(self) -> List[str]:
+    def _syft_dont_wrap_attrs(self) -> FrozenSet[str]:
         """The results from these attributes are ignored from UID patching."""
-        return dont_wrap_output_attrs + getattr(self, "syft_dont_wrap_attrs", [])
+        return self._syft_dont_wrap_set
 
     def _syft_get_attr_context(self, name: str) -> Any:
         """Find which instance - Syft ActionObject or the original object - has the requested attribute."""
@@ -843,14 +867,9 @@ class ActionObject(SyftObject):
 
         try:
             wrapper.__doc__ = original_func.__doc__
-            debug(
-                "Found original signature for ",
-                name,
-                inspect.signature(original_func),
-            )
-            wrapper.__ipython_inspector_signature_override__ = inspect.signature(
-                original_func
-            )
+            signature = _signature(type(self.syft_action_data), name, original_func)
+            if signature is not None:
+                wrapper.__ipython_inspector_signature_override__ = signature
         except Exception:
             debug("name", name, "has no signature")
 
@@ -875,7 +894,7 @@ class ActionObject(SyftObject):
         if name.startswith("_syft") or name.startswith("syft"):
             return object.__getattribute__(self, name)
 
-        if name in self._syft_passthrough_attrs():
+        if name in type(self)._syft_passthrough_set:
             return object.__getattribute__(self, name)
         context_self = self._syft_get_attr_context(name)
 
@@ -1079,6 +1098,33 @@ class AnyActionObject(ActionObject):
 
 
 action_types[Any] = AnyActionObject
+ActionObject._syft_build_dispatch_table()
+
+# (type, attr name) lookups on the wrapped data, these don't change per instance
+_property_cache: Dict[Tuple[type, str], bool] = {}
+_signature_cache: Dict[Tuple[type, str], Optional[inspect.Signature]] = {}
+
+
+def _is_property(klass: type, name: str) -> bool:
+    key = (klass, name)
+    if key not in _property_cache:
+        klass_method = getattr(klass, name, None)
+        _property_cache[key] = isinstance(
+            klass_method, property
+        ) or inspect.isdatadescriptor(klass_method)
+    return _property_cache[key]
+
+
+def _signature(klass: type, name: str, func: Callable) -> Optional[inspect.Signature]:
+    key = (klass, name)
+    if key not in _signature_cache:
+        try:
+            _signature_cache[key] = inspect.signature(func)
+            debug("Found original signature for ", name, _signature_cache[key])
+        except Exception:
+            _signature_cache[key] = None
+            debug("name", name, "has no signature")
+    return _signature_cache[key]
 
 
 def debug_original_func(name: str, func: Callable) -> None:
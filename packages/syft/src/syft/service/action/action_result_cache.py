@@ -0,0 +1,130 @@
+# stdlib
+from collections import OrderedDict
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+# relative
+from ...node.credentials import SyftVerifyKey
+from ...types.uid import UID
+from .action_object import Action
+
+# in place operators mutate `remote_self`, running them again is not a no-op
+INPLACE_OPS = {
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__imatmul__",
+    "__itruediv__",
+    "__ifloordiv__",
+    "__imod__",
+    "__ipow__",
+    "__ilshift__",
+    "__irshift__",
+    "__iand__",
+    "__ixor__",
+    "__ior__",
+    "__setitem__",
+    "__delitem__",
+}
+
+
+def action_cache_key(action: Action) -> Tuple[Hashable, ...]:
+    """Key an action by its op and the history of its inputs.
+
+    `Action.syft_history_hash` sums the hashes of its inputs so `a - b` and `b - a`
+    collide, the key keeps the position of each input instead.
+    """
+    remote_self_hash = (
+        action.remote_self.syft_history_hash if action.remote_self else None
+    )
+    return (
+        action.path,
+        action.op,
+        remote_self_hash,
+        tuple(arg.syft_history_hash for arg in action.args),
+        tuple(sorted((k, v.syft_history_hash) for k, v in action.kwargs.items())),
+    )
+
+
+def is_cacheable(action: Action) -> bool:
+    return action.op not in INPLACE_OPS
+
+
+class ActionResultCache:
+    """LRU + TTL cache of action results keyed by action history and credentials.
+
+    Only the id of the stored result is cached, results are looked up in the action
+    store with the credentials of the caller so permissions are still enforced.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._results: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, credentials: SyftVerifyKey, action: Action) -> Tuple[Any, ...]:
+        return (str(credentials), action_cache_key(action))
+
+    def get(self, credentials: SyftVerifyKey, action: Action) -> Optional[UID]:
+        key = self._key(credentials, action)
+        with self._lock:
+            cached = self._results.get(key, None)
+            if cached is not None:
+                result_id, expires_at = cached
+                if expires_at is None or expires_at > time.monotonic():
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return result_id
+                del self._results[key]
+                self.evictions += 1
+            self.misses += 1
+        return None
+
+    def set(self, credentials: SyftVerifyKey, action: Action, result_id: UID) -> None:
+        if self.max_size <= 0:
+            return
+        key = self._key(credentials, action)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._results[key] = (result_id, expires_at)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, credentials: SyftVerifyKey, action: Action) -> None:
+        with self._lock:
+            if self._results.pop(self._key(credentials, action), None) is not None:
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
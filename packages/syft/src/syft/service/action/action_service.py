@@ -1,9 +1,16 @@
 # stdlib
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from enum import Enum
+from functools import partial
 import importlib
+import threading
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -16,12 +23,15 @@ from result import Result
 from ...serde.serializable import serializable
 from ...types.twin_object import TwinObject
 from ...types.uid import UID
+from ...util.experimental_flags import flags
 from ..code.user_code import UserCode
 from ..code.user_code import execute_byte_code
 from ..context import AuthedServiceContext
 from ..response import SyftError
+from ..response import SyftException
 from ..response import SyftSuccess
 from ..service import AbstractService
+from ..service import LibConfigRegistry
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
 from ..service import UserLibConfigRegistry
@@ -31,11 +41,17 @@ from .action_object import Action
 from .action_object import ActionObject
 from .action_object import ActionObjectPointer
 from .action_object import AnyActionObject
+from .action_result_cache import ActionResultCache
+from .action_result_cache import is_cacheable
 from .action_store import ActionStore
 from .action_types import action_type_for_type
+from .chunked import chunked_method
+from .fused_ufunc import FusedUfuncExpression
 from .numpy import NumpyArrayObject
 from .pandas import PandasDataFrameObject  # noqa: F401
 from .pandas import PandasSeriesObject  # noqa: F401
+from .segmented import SegmentedArray  # noqa: F401
+from .segmented import SegmentedFrame  # noqa: F401
 
 
 @serializable()
@@ -45,10 +61,14 @@ class TwinMode(Enum):
     MOCK = 2
 
 
-@serializable()
+@serializable(attrs=["store"])
 class ActionService(AbstractService):
     def __init__(self, store: ActionStore) -> None:
         self.store = store
+        self.result_cache = ActionResultCache(
+            max_size=flags.ACTION_RESULT_CACHE_SIZE,
+            ttl=flags.ACTION_RESULT_CACHE_TTL,
+        )
 
     @service_method(path="action.np_array", name="np_array")
     def np_array(self, context: AuthedServiceContext, data: Any) -> Any:
@@ -109,20 +129,41 @@ class ActionService(AbstractService):
         # until permissions are fully integrated
         result = self.store.get(uid=uid, credentials=context.credentials)
         if result.is_ok():
-            obj = result.ok()
-            if isinstance(obj, TwinObject):
-                if twin_mode == TwinMode.PRIVATE:
-                    obj = obj.private
-                    obj.syft_point_to(context.node.id)
-                elif twin_mode == TwinMode.MOCK:
-                    obj = obj.mock
-                    obj.syft_point_to(context.node.id)
-                else:
-                    obj.mock.syft_point_to(context.node.id)
-                    obj.private.syft_point_to(context.node.id)
-            return Ok(obj)
+            return Ok(self._resolve_twin(context, result.ok(), twin_mode))
+        return result
+
+    def get_many(
+        self,
+        context: AuthedServiceContext,
+        uids: List[UID],
+        twin_mode: TwinMode = TwinMode.PRIVATE,
+    ) -> Result[Ok[List[ActionObject]], Err[str]]:
+        """Get several objects from the action store in one go"""
+        result = self.store.get_many(uids=uids, credentials=context.credentials)
+        if result.is_ok():
+            return Ok(
+                [self._resolve_twin(context, obj, twin_mode) for obj in result.ok()]
+            )
         return result
 
+    def _resolve_twin(
+        self,
+        context: AuthedServiceContext,
+        obj: Union[TwinObject, ActionObject],
+        twin_mode: TwinMode,
+    ) -> Union[TwinObject, ActionObject]:
+        if isinstance(obj, TwinObject):
+            if twin_mode == TwinMode.PRIVATE:
+                obj = obj.private
+                obj.syft_point_to(context.node.id)
+            elif twin_mode == TwinMode.MOCK:
+                obj = obj.mock
+                obj.syft_point_to(context.node.id)
+            else:
+                obj.mock.syft_point_to(context.node.id)
+                obj.private.syft_point_to(context.node.id)
+        return obj
+
     @service_method(
         path="action.get_pointer", name="get_pointer", roles=GUEST_ROLE_LEVEL
     )
@@ -173,18 +214,17 @@ class ActionService(AbstractService):
                 )
             else:
                 # twins
-                private_kwargs = filter_twin_kwargs(
-                    real_kwargs, twin_mode=TwinMode.PRIVATE
-                )
-                private_exec_result = execute_byte_code(code_item, private_kwargs)
-                result_action_object_private = wrap_result(
-                    code_item.id, result_id, private_exec_result.result
-                )
-
-                mock_kwargs = filter_twin_kwargs(real_kwargs, twin_mode=TwinMode.MOCK)
-                mock_exec_result = execute_byte_code(code_item, mock_kwargs)
-                result_action_object_mock = wrap_result(
-                    code_item.id, result_id, mock_exec_result.result
+                def execute_twin_side(twin_mode: TwinMode) -> ActionObject:
+                    twin_kwargs = filter_twin_kwargs(real_kwargs, twin_mode=twin_mode)
+                    exec_result = execute_byte_code(code_item, twin_kwargs)
+                    return wrap_result(code_item.id, result_id, exec_result.result)
+
+                (
+                    result_action_object_private,
+                    result_action_object_mock,
+                ) = execute_twin(
+                    partial(execute_twin_side, TwinMode.PRIVATE),
+                    partial(execute_twin_side, TwinMode.MOCK),
                 )
 
                 result_action_object = TwinObject(
@@ -210,7 +250,12 @@ class ActionService(AbstractService):
     ) -> Result[ActionObjectPointer, Err]:
         """Execute an operation on objects in the action store"""
 
-        if action.remote_self is None:
+        use_cache = flags.ACTION_RESULT_CACHE and is_cacheable(action)
+        cached_result = self._get_cached_result(context, action) if use_cache else None
+
+        if cached_result is not None:
+            result_action_object = cached_result
+        elif action.remote_self is None:
             _user_lib_config_registry = UserLibConfigRegistry.from_user(
                 context.credentials
             )
@@ -230,18 +275,26 @@ class ActionService(AbstractService):
             resolved_self = resolved_self.ok()
 
             if isinstance(resolved_self, TwinObject):
-                private_result = execute_object(
-                    self,
-                    context,
-                    resolved_self.private,
-                    action,
-                    twin_mode=TwinMode.PRIVATE,
+                private_result, mock_result = execute_twin(
+                    partial(
+                        execute_object,
+                        self,
+                        context,
+                        resolved_self.private,
+                        action,
+                        twin_mode=TwinMode.PRIVATE,
+                    ),
+                    partial(
+                        execute_object,
+                        self,
+                        context,
+                        resolved_self.mock,
+                        action,
+                        twin_mode=TwinMode.MOCK,
+                    ),
                 )
                 if private_result.is_err():
                     return private_result.err()
-                mock_result = execute_object(
-                    self, context, resolved_self.mock, action, twin_mode=TwinMode.MOCK
-                )
                 if mock_result.is_err():
                     return mock_result.err()
 
@@ -275,12 +328,107 @@ class ActionService(AbstractService):
         if set_result.is_err():
             return set_result.err()
 
+        if use_cache and cached_result is None:
+            self.result_cache.set(context.credentials, action, action.result_id)
+
+        if isinstance(result_action_object, TwinObject):
+            result_action_object = result_action_object.mock
+        result_action_object.syft_point_to(context.node.id)
+
+        return Ok(result_action_object)
+
+    def _get_cached_result(
+        self, context: AuthedServiceContext, action: Action
+    ) -> Optional[Ok[Union[TwinObject, ActionObject]]]:
+        """Copy the result of an identical earlier action to `action.result_id`"""
+        result_id = self.result_cache.get(context.credentials, action)
+        if result_id is None:
+            return None
+
+        cached = self.store.get(uid=result_id, credentials=context.credentials)
+        if cached.is_err():
+            # deleted or no longer readable
+            self.result_cache.invalidate(context.credentials, action)
+            return None
+        cached = cached.ok()
+
+        if isinstance(cached, TwinObject):
+            return Ok(
+                TwinObject(
+                    id=action.result_id,
+                    private_obj=wrap_result(
+                        action.id, action.result_id, cached.private.syft_action_data
+                    ),
+                    private_obj_id=action.result_id,
+                    mock_obj=wrap_result(
+                        action.id, action.result_id, cached.mock.syft_action_data
+                    ),
+                    mock_obj_id=action.result_id,
+                )
+            )
+        return Ok(wrap_result(action.id, action.result_id, cached.syft_action_data))
+
+    @service_method(
+        path="action.execute_fused", name="execute_fused", roles=GUEST_ROLE_LEVEL
+    )
+    def execute_fused(
+        self, context: AuthedServiceContext, expression: FusedUfuncExpression
+    ) -> Result[ActionObjectPointer, Err]:
+        """Evaluate a fused elementwise expression, only its result is stored"""
+        try:
+            expression.validate_steps()
+        except SyftException as e:
+            return SyftError(message=str(e))
+
+        inputs = self.get_many(
+            context=context, uids=expression.inputs, twin_mode=TwinMode.NONE
+        )
+        if inputs.is_err():
+            return inputs.err()
+        inputs = inputs.ok()
+
+        result_id = expression.result_id
+        try:
+            if any(isinstance(x, TwinObject) for x in inputs):
+                private_inputs = filter_twin_args(inputs, twin_mode=TwinMode.PRIVATE)
+                mock_inputs = filter_twin_args(inputs, twin_mode=TwinMode.MOCK)
+                private_result, mock_result = execute_twin(
+                    partial(expression.evaluate, private_inputs),
+                    partial(expression.evaluate, mock_inputs),
+                )
+                result_action_object = TwinObject(
+                    id=result_id,
+                    private_obj=wrap_result(expression.id, result_id, private_result),
+                    private_obj_id=result_id,
+                    mock_obj=wrap_result(expression.id, result_id, mock_result),
+                    mock_obj_id=result_id,
+                )
+            else:
+                inputs = filter_twin_args(inputs, twin_mode=TwinMode.NONE)
+                result = expression.evaluate(inputs)
+                result_action_object = wrap_result(expression.id, result_id, result)
+        except Exception as e:
+            return Err(f"Failed to evaluate the fused expression: {e}")
+
+        set_result = self.store.set(
+            uid=result_id,
+            credentials=context.credentials,
+            syft_object=result_action_object,
+        )
+        if set_result.is_err():
+            return set_result.err()
+
         if isinstance(result_action_object, TwinObject):
             result_action_object = result_action_object.mock
         result_action_object.syft_point_to(context.node.id)
 
         return Ok(result_action_object)
 
+    @service_method(path="action.cache_stats", name="cache_stats")
+    def cache_stats(self, context: AuthedServiceContext) -> Dict[str, Any]:
+        """Hit rate and size of the action result cache"""
+        return self.result_cache.stats()
+
     @service_method(path="action.exists", name="exists", roles=GUEST_ROLE_LEVEL)
     def exists(
         self, context: AuthedServiceContext, obj_id: UID
@@ -292,50 +440,109 @@ class ActionService(AbstractService):
             return SyftError(message=f"Object: {obj_id} does not exist")
 
 
-def execute_callable(
-    service: ActionService,
-    context: AuthedServiceContext,
-    action: Action,
-) -> Result[ActionObject, str]:
-    args = []
+_twin_executor: Optional[ThreadPoolExecutor] = None
+_twin_executor_lock = threading.Lock()
+_twin_executor_thread = threading.local()
 
-    if action.args:
-        for arg_id in action.args:
-            arg_value = service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
-            )
-            if arg_value.is_err():
-                return arg_value.err()
-            if isinstance(arg_value.ok(), TwinObject):
-                pass
-            args.append(arg_value.ok())
-
-    kwargs = {}
-    if action.kwargs:
-        for key, arg_id in action.kwargs.items():
-            kwarg_value = service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
+
+def get_twin_executor() -> Optional[ThreadPoolExecutor]:
+    workers = flags.TWIN_EXECUTOR_WORKERS
+    if workers <= 0:
+        return None
+
+    global _twin_executor
+    with _twin_executor_lock:
+        if _twin_executor is None or _twin_executor._max_workers != workers:
+            if _twin_executor is not None:
+                _twin_executor.shutdown(wait=False)
+            _twin_executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="syft-twin",
+                initializer=setattr,
+                initargs=(_twin_executor_thread, "active", True),
             )
-            if kwarg_value.is_err():
-                return kwarg_value.err()
-            if isinstance(kwarg_value.ok(), TwinObject):
-                pass
-            kwargs[key] = kwarg_value.ok()
+    return _twin_executor
 
-    # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
-    # is not bound to the original object or mutated
-    # stdlib
 
-    # TODO: get from CMPTree is probably safer
-    def _get_target_callable(path: str, op: str):
+def execute_twin(
+    private_func: Callable[[], Any], mock_func: Callable[[], Any]
+) -> Tuple[Any, Any]:
+    """Run the private and the mock side of a twin computation.
+
+    The mock side runs on the twin executor while the private side runs on the
+    calling thread, so code which releases the GIL (numpy, pandas) runs both sides
+    in parallel. Exceptions from either side are raised to the caller.
+    """
+    executor = get_twin_executor()
+    # nested twin computations run inline so they can't exhaust the executor
+    if executor is None or getattr(_twin_executor_thread, "active", False):
+        return private_func(), mock_func()
+
+    mock_future = executor.submit(mock_func)
+    try:
+        private_result = private_func()
+    except Exception:
+        # don't leave the mock side running after the call has failed
+        wait([mock_future])
+        raise
+    return private_result, mock_future.result()
+
+
+# absolute path -> resolved lib callable
+_lib_callable_cache: Dict[str, Callable] = {}
+
+
+def resolve_lib_callable(path: str, op: str) -> Callable:
+    """Import and cache the lib callable at `path.op` registered in the CMP tree"""
+    absolute_path = f"{path}.{op}"
+    if absolute_path not in _lib_callable_cache:
+        if not LibConfigRegistry.path_exists(absolute_path):
+            raise ValueError(f"{absolute_path} is not a registered lib path")
         path_elements = path.split(".")
         res = importlib.import_module(path_elements[0])
         for p in path_elements[1:]:
             res = getattr(res, p)
-        res = getattr(res, op)
-        return res
+        _lib_callable_cache[absolute_path] = getattr(res, op)
+    return _lib_callable_cache[absolute_path]
+
+
+def resolve_action_args(
+    service: ActionService,
+    context: AuthedServiceContext,
+    action: Action,
+) -> Result[Tuple[List[Any], Dict[str, Any]], str]:
+    """Get the args and kwargs of `action` with a single store lookup"""
+    kwarg_keys = list(action.kwargs.keys())
+    uids = [*action.args, *action.kwargs.values()]
+    if not uids:
+        return Ok(([], {}))
 
-    target_callable = _get_target_callable(action.path, action.op)
+    values = service.get_many(context=context, uids=uids, twin_mode=TwinMode.NONE)
+    if values.is_err():
+        return values
+    values = values.ok()
+
+    args = values[: len(action.args)]
+    kwargs = dict(zip(kwarg_keys, values[len(action.args) :]))
+    return Ok((args, kwargs))
+
+
+def execute_callable(
+    service: ActionService,
+    context: AuthedServiceContext,
+    action: Action,
+) -> Result[ActionObject, str]:
+    resolved_args = resolve_action_args(service, context, action)
+    if resolved_args.is_err():
+        return resolved_args.err()
+    args, kwargs = resolved_args.ok()
+
+    # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
+    # is not bound to the original object or mutated
+    try:
+        target_callable = resolve_lib_callable(action.path, action.op)
+    except Exception as e:
+        return Err(e)
 
     result = None
     try:
@@ -404,34 +611,19 @@ def execute_object(
     twin_mode: TwinMode = TwinMode.NONE,
 ) -> Result[Ok[Union[TwinObject, ActionObject]], Err[str]]:
     unboxed_resolved_self = resolved_self.syft_action_data
-    args = []
-    has_twin_inputs = False
-    if action.args:
-        for arg_id in action.args:
-            arg_value = service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
-            )
-            if arg_value.is_err():
-                return arg_value
-            if isinstance(arg_value.ok(), TwinObject):
-                has_twin_inputs = True
-            args.append(arg_value.ok())
-
-    kwargs = {}
-    if action.kwargs:
-        for key, arg_id in action.kwargs.items():
-            kwarg_value = service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
-            )
-            if kwarg_value.is_err():
-                return kwarg_value
-            if isinstance(kwarg_value.ok(), TwinObject):
-                has_twin_inputs = True
-            kwargs[key] = kwarg_value.ok()
+    resolved_args = resolve_action_args(service, context, action)
+    if resolved_args.is_err():
+        return resolved_args
+    args, kwargs = resolved_args.ok()
+    has_twin_inputs = any(
+        isinstance(arg, TwinObject) for arg in [*args, *kwargs.values()]
+    )
 
     # 🔵 TODO 10: Get proper code From old RunClassMethodAction to ensure the function
     # is not bound to the original object or mutated
     target_method = getattr(unboxed_resolved_self, action.op, None)
+    if target_method is not None:
+        target_method = chunked_method(unboxed_resolved_self, action.op, target_method)
     result = None
     try:
         if target_method:
@@ -447,14 +639,14 @@ def execute_object(
                 private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 private_result = target_method(*private_args, **private_kwargs)
                 result_action_object_private = wrap_result(
-                    action.parent_id, action.result_id, private_result
+                    action.id, action.result_id, private_result
                 )
 
                 mock_args = filter_twin_args(args, twin_mode=twin_mode)
                 mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 mock_result = target_method(*mock_args, **mock_kwargs)
                 result_action_object_mock = wrap_result(
-                    action.parent_id, action.result_id, mock_result
+                    action.id, action.result_id, mock_result
                 )
 
                 result_action_object = TwinObject(
@@ -467,18 +659,13 @@ def execute_object(
                 private_args = filter_twin_args(args, twin_mode=twin_mode)
                 private_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
                 result = target_method(*private_args, **private_kwargs)
-                result_action_object = wrap_result(
-                    action.parent_id, action.result_id, result
-                )
+                result_action_object = wrap_result(action.id, action.result_id, result)
             elif twin_mode == twin_mode.MOCK:  # type: ignore
                 # twin mock path
                 mock_args = filter_twin_args(args, twin_mode=twin_mode)
                 mock_kwargs = filter_twin_kwargs(kwargs, twin_mode=twin_mode)
-                target_method = getattr(unboxed_resolved_self, action.op, None)
                 result = target_method(*mock_args, **mock_kwargs)
-                result_action_object = wrap_result(
-                    action.parent_id, action.result_id, result
-                )
+                result_action_object = wrap_result(action.id, action.result_id, result)
             else:
                 raise Exception(
                     f"Bad combination of: twin_mode: {twin_mode} and has_twin_inputs: {has_twin_inputs}"
@@ -77,6 +77,27 @@ class KeyValueActionStore(ActionStore):
             return Ok(syft_object)
         return Err(f"Permission: {read_permission} denied")
 
+    def get_many(
+        self, uids: List[UID], credentials: SyftVerifyKey
+    ) -> Result[List[SyftObject], str]:
+        """Get several objects with one read of the permissions and the data"""
+        uids = [uid.id for uid in uids]  # We only need the UID from LineageID or UID
+        unique_uids = list(dict.fromkeys(uids))
+
+        # if you get something you need READ permission
+        if self.root_verify_key.verify != credentials.verify:
+            permissions = self.permissions.get_many(unique_uids)
+            for uid in unique_uids:
+                read_permission = ActionObjectREAD(uid=uid, credentials=credentials)
+                if read_permission.permission_string not in permissions.get(uid, ()):
+                    return Err(f"Permission: {read_permission} denied")
+
+        syft_objects = self.data.get_many(unique_uids)
+        for uid in unique_uids:
+            if uid not in syft_objects:
+                return Err(f"{uid} not in {type(self.data)}")
+        return Ok([syft_objects[uid] for uid in uids])
+
     def get_pointer(
         self, uid: UID, credentials: SyftVerifyKey, node_uid: UID
     ) -> Result[SyftObject, str]:
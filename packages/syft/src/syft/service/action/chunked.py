@@ -0,0 +1,176 @@
+# stdlib
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+import numpy as np
+import pandas as pd
+
+# relative
+from ...util.experimental_flags import flags
+
+# binary and unary operators which work row by row
+ELEMENTWISE_OPS = {
+    "__add__",
+    "__sub__",
+    "__mul__",
+    "__truediv__",
+    "__floordiv__",
+    "__mod__",
+    "__pow__",
+    "__radd__",
+    "__rsub__",
+    "__rmul__",
+    "__rtruediv__",
+    "__rfloordiv__",
+    "__rmod__",
+    "__rpow__",
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__and__",
+    "__or__",
+    "__xor__",
+    "__neg__",
+    "__pos__",
+    "__abs__",
+    "__invert__",
+}
+
+
+def _concat_columns(partials: List[pd.Series]) -> pd.DataFrame:
+    return pd.concat(partials, axis=1)
+
+
+def _mean_dtypes(dtype: np.dtype) -> Tuple[np.dtype, np.dtype]:
+    """The dtypes np.mean accumulates in and returns for an array of `dtype`"""
+    if np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.bool_):
+        return np.dtype(np.float64), np.dtype(np.float64)
+    if dtype == np.float16:
+        return np.dtype(np.float32), dtype
+    return dtype, dtype
+
+
+def _numpy_mean_partial(chunk: np.ndarray) -> Tuple[Any, int, np.dtype]:
+    accumulate, result = _mean_dtypes(chunk.dtype)
+    return chunk.sum(dtype=accumulate), chunk.size, result
+
+
+def _numpy_mean(partials: List[Any]) -> Any:
+    total = sum(total for total, _, _ in partials)
+    size = sum(size for _, size, _ in partials)
+    return partials[0][2].type(total / size)
+
+
+def _pandas_mean(partials: List[Any]) -> pd.Series:
+    totals = _concat_columns([total for total, _ in partials]).sum(axis=1)
+    counts = _concat_columns([count for _, count in partials]).sum(axis=1)
+    return totals / counts
+
+
+# op -> (partial result of a chunk, combine the partial results)
+NUMPY_REDUCTIONS: Dict[str, Tuple[Callable, Callable]] = {
+    "sum": (lambda chunk: chunk.sum(), np.sum),
+    "prod": (lambda chunk: chunk.prod(), np.prod),
+    "min": (lambda chunk: chunk.min(), np.min),
+    "max": (lambda chunk: chunk.max(), np.max),
+    "any": (lambda chunk: chunk.any(), np.any),
+    "all": (lambda chunk: chunk.all(), np.all),
+    "mean": (_numpy_mean_partial, _numpy_mean),
+}
+
+# column reductions of numeric DataFrames
+PANDAS_REDUCTIONS: Dict[str, Tuple[Callable, Callable]] = {
+    "sum": (lambda chunk: chunk.sum(), lambda p: _concat_columns(p).sum(axis=1)),
+    "count": (lambda chunk: chunk.count(), lambda p: _concat_columns(p).sum(axis=1)),
+    "min": (lambda chunk: chunk.min(), lambda p: _concat_columns(p).min(axis=1)),
+    "max": (lambda chunk: chunk.max(), lambda p: _concat_columns(p).max(axis=1)),
+    "mean": (lambda chunk: (chunk.sum(), chunk.count()), _pandas_mean),
+}
+
+
+def iter_row_chunks(data: Any, rows: int) -> Iterator[Any]:
+    for start in range(0, len(data), rows):
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            yield data.iloc[start : start + rows]
+        else:
+            yield data[start : start + rows]
+
+
+def _can_chunk(data: Any, rows: int) -> bool:
+    if rows <= 0 or not isinstance(data, (np.ndarray, pd.DataFrame, pd.Series)):
+        return False
+    return data.ndim > 0 and len(data) > rows
+
+
+def _split_operand(operand: Any, data: Any, rows: int) -> Optional[List[Any]]:
+    """Split an operand like the rows of `data`, None if it can't be split"""
+    n_chunks = -(-len(data) // rows)
+    if np.isscalar(operand):
+        return [operand] * n_chunks
+    same_type = isinstance(operand, type(data)) or isinstance(data, type(operand))
+    if same_type and operand.shape == data.shape:
+        if isinstance(data, (pd.DataFrame, pd.Series)) and not operand.index.equals(
+            data.index
+        ):
+            return None
+        return list(iter_row_chunks(operand, rows))
+    return None
+
+
+def _combine_elementwise(data: Any, results: List[Any]) -> Any:
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return pd.concat(results)
+    return np.concatenate(results)
+
+
+def chunked_method(data: Any, op: str, target_method: Callable) -> Callable:
+    """Wrap `target_method` to run over the rows of `data` chunk by chunk.
+
+    Only used when flags.CHUNKED_EXECUTION_ROWS is set and `data` has more rows
+    than that. Elementwise operators with scalar or same shaped operands and
+    reductions over the whole array (or over the columns of a DataFrame) are run
+    chunk by chunk and combined, anything else falls back to `target_method`.
+    This only bounds the temporaries of an op to a chunk. `data` is already in
+    memory and an elementwise result is as large as `data`, data larger than
+    memory is stored as a SegmentedArray or SegmentedFrame instead.
+    """
+    rows = flags.CHUNKED_EXECUTION_ROWS
+    if not _can_chunk(data, rows):
+        return target_method
+    is_pandas = isinstance(data, (pd.DataFrame, pd.Series))
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # slices of mixed type frames are copies, so only one is made at a time
+        chunks = iter_row_chunks(data, rows)
+        if op in ELEMENTWISE_OPS and not kwargs:
+            split_args = [_split_operand(arg, data, rows) for arg in args]
+            if all(split is not None for split in split_args):
+                results = [
+                    getattr(chunk, op)(*[split[i] for split in split_args])
+                    for i, chunk in enumerate(chunks)
+                ]
+                return _combine_elementwise(data, results)
+
+        reductions = PANDAS_REDUCTIONS if is_pandas else NUMPY_REDUCTIONS
+        if op in reductions and not args and not kwargs:
+            if is_pandas and (
+                isinstance(data, pd.Series)
+                or not all(pd.api.types.is_numeric_dtype(t) for t in data.dtypes)
+            ):
+                # mixed types and Series reductions don't combine per column
+                return target_method(*args, **kwargs)
+            partial, combine = reductions[op]
+            return combine([partial(chunk) for chunk in chunks])
+
+        return target_method(*args, **kwargs)
+
+    return wrapper
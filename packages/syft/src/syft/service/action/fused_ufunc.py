@@ -0,0 +1,225 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+import pydantic
+
+# relative
+from ...serde.serializable import serializable
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
+from ...types.uid import LineageID
+from ...types.uid import UID
+from ..response import SyftException
+from .action_object import ActionObject
+
+# elements evaluated at a time, bounds the size of the temporaries
+FUSED_CHUNK_SIZE = 2**16
+
+# operand kinds of a FusedUfuncExpression step
+INPUT = "input"
+CONSTANT = "constant"
+STEP = "step"
+
+Operand = Tuple[str, int]
+
+# the scalars an expression can use, anything else could run code on the node
+CONSTANT_TYPES = (bool, int, float, complex, np.number, np.bool_)
+
+
+def get_ufunc(name: str) -> np.ufunc:
+    ufunc = getattr(np, name, None)
+    # generalized ufuncs like matmul work on whole axes, chunks would change them
+    if not isinstance(ufunc, np.ufunc) or ufunc.nout != 1 or ufunc.signature:
+        raise SyftException(f"{name} is not an elementwise numpy ufunc")
+    return ufunc
+
+
+@serializable()
+class FusedUfuncExpression(SyftObject):
+    """Elementwise numpy expression which is evaluated by the node in one pass.
+
+    Parameters:
+        inputs: List[LineageID]
+            The arrays in the action store used by the expression
+        constants: List[Any]
+            The scalars used by the expression
+        steps: List[Tuple[str, List[Tuple[str, int]]]]
+            The ufuncs to apply in order, with their operands. An operand is
+            (INPUT, index), (CONSTANT, index) or (STEP, index of an earlier step).
+            The last step is the result.
+        result_id: Optional[LineageID]
+            Extended UID of the result
+    """
+
+    __canonical_name__ = "FusedUfuncExpression"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    inputs: List[LineageID]
+    constants: List[Any]
+    steps: List[Tuple[str, List[Operand]]]
+    result_id: Optional[LineageID]
+
+    @pydantic.validator("result_id", pre=True, always=True)
+    def make_result_id(cls, v: Optional[Union[UID, LineageID]]) -> LineageID:
+        """Generate or reuse a LineageID"""
+        return v if isinstance(v, LineageID) else LineageID(v)
+
+    @property
+    def syft_history_hash(self) -> int:
+        hashes = hash(tuple(step[0] for step in self.steps))
+        for input_id in self.inputs:
+            hashes += hash(input_id.syft_history_hash)
+        return hashes
+
+    def validate_steps(self) -> None:
+        if not self.steps:
+            raise SyftException("A fused expression needs at least one step")
+        for value in self.constants:
+            if not isinstance(value, CONSTANT_TYPES):
+                raise SyftException(f"Invalid constant of type {type(value)}")
+        for idx, (name, operands) in enumerate(self.steps):
+            ufunc = get_ufunc(name)
+            if len(operands) != ufunc.nin:
+                raise SyftException(f"{name} takes {ufunc.nin} operands")
+            for kind, operand_idx in operands:
+                bound = {
+                    INPUT: len(self.inputs),
+                    CONSTANT: len(self.constants),
+                    STEP: idx,
+                }.get(kind, 0)
+                if not 0 <= operand_idx < bound:
+                    raise SyftException(f"Invalid operand {(kind, operand_idx)}")
+
+    def _evaluate(self, inputs: List[Any]) -> Any:
+        results: List[Any] = []
+        for name, operands in self.steps:
+            values = []
+            for kind, idx in operands:
+                if kind == INPUT:
+                    values.append(inputs[idx])
+                elif kind == CONSTANT:
+                    values.append(self.constants[idx])
+                else:
+                    values.append(results[idx])
+            results.append(get_ufunc(name)(*values))
+        return results[-1]
+
+    def evaluate(self, inputs: List[Any], chunk_size: int = FUSED_CHUNK_SIZE) -> Any:
+        """Evaluate the expression over `inputs` chunk by chunk.
+
+        Inputs which all have the same shape are flattened and evaluated in slices
+        so the temporaries of the intermediate steps stay at `chunk_size`
+        elements. Inputs which need broadcasting are evaluated in one go.
+        """
+        self.validate_steps()
+        arrays = [np.asarray(x) for x in inputs]
+        shapes = {x.shape for x in arrays}
+        if len(shapes) != 1 or chunk_size <= 0:
+            return self._evaluate(arrays)
+
+        shape = shapes.pop()
+        flat = [x.reshape(-1) for x in arrays]
+        size = flat[0].size if flat else 0
+        if size <= chunk_size:
+            return self._evaluate(arrays)
+
+        out = None
+        for start in range(0, size, chunk_size):
+            chunk = self._evaluate([x[start : start + chunk_size] for x in flat])
+            if out is None:
+                out = np.empty(size, dtype=chunk.dtype)
+            out[start : start + chunk_size] = chunk
+        return out.reshape(shape)
+
+
+class _FusedSymbol(np.lib.mixins.NDArrayOperatorsMixin):
+    """Records the ufuncs applied to it while tracing a fused expression"""
+
+    def __init__(self, tracer: _FusedTracer, operand: Operand) -> None:
+        self.tracer = tracer
+        self.operand = operand
+
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
+    ) -> _FusedSymbol:
+        if method != "__call__" or kwargs or ufunc.nout != 1 or ufunc.signature:
+            raise SyftException(f"{ufunc.__name__}.{method} can't be fused")
+        return self.tracer.add_step(ufunc.__name__, inputs)
+
+
+class _FusedTracer:
+    def __init__(self) -> None:
+        self.inputs: List[LineageID] = []
+        self.constants: List[Any] = []
+        self.steps: List[Tuple[str, List[Operand]]] = []
+
+    def add_input(self, obj: ActionObject) -> _FusedSymbol:
+        self.inputs.append(obj.syft_lineage_id)
+        return _FusedSymbol(self, (INPUT, len(self.inputs) - 1))
+
+    def add_step(self, name: str, inputs: Tuple[Any, ...]) -> _FusedSymbol:
+        operands = []
+        for value in inputs:
+            if isinstance(value, _FusedSymbol):
+                operands.append(value.operand)
+            elif isinstance(value, CONSTANT_TYPES):
+                self.constants.append(value)
+                operands.append((CONSTANT, len(self.constants) - 1))
+            else:
+                raise SyftException(f"Can't fuse operand of type {type(value)}")
+        self.steps.append((name, operands))
+        return _FusedSymbol(self, (STEP, len(self.steps) - 1))
+
+
+def trace_fused(
+    func: Callable[..., Any], *operands: Union[ActionObject, Any]
+) -> FusedUfuncExpression:
+    """Trace `func` over `operands` into a FusedUfuncExpression.
+
+    `func` can only use numpy ufuncs and arithmetic operators on its arguments,
+    for example `lambda a, b, c: np.sqrt(a * b + c)`.
+    """
+    tracer = _FusedTracer()
+    symbols = [
+        tracer.add_input(x) if isinstance(x, ActionObject) else x for x in operands
+    ]
+    result = func(*symbols)
+    if not isinstance(result, _FusedSymbol) or result.operand[0] != STEP:
+        raise SyftException("The fused function has to apply at least one ufunc")
+    return FusedUfuncExpression(
+        inputs=tracer.inputs, constants=tracer.constants, steps=tracer.steps
+    )
+
+
+def fuse(func: Callable[..., Any], *operands: Union[ActionObject, Any]) -> Any:
+    """Run the elementwise `func` over the `operands` pointers in one action.
+
+    `np.sqrt(a * b + c)` on pointers sends three actions and stores two
+    temporaries on the node, `fuse(lambda a, b, c: np.sqrt(a * b + c), a, b, c)`
+    sends one and only stores the result.
+    """
+    expression = trace_fused(func, *operands)
+    pointers = [x for x in operands if isinstance(x, ActionObject)]
+    node_uids = {x.syft_node_uid for x in pointers}
+    if node_uids == {None}:
+        # local objects
+        result = expression.evaluate([x.syft_action_data for x in pointers])
+        return ActionObject.from_obj(result)
+    if len(node_uids) != 1:
+        raise SyftException("The fused pointers have to be on the same node")
+
+    # relative
+    from ...client.api import APIRegistry
+
+    api = APIRegistry.api_for(node_uid=node_uids.pop())
+    return api.services.action.execute_fused(expression)
@@ -0,0 +1,356 @@
+# stdlib
+import os
+import tempfile
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+# third party
+import numpy as np
+import pandas as pd
+from pyarrow import feather
+
+# relative
+from ...serde.serializable import serializable
+from ...util.experimental_flags import flags
+from ...util.util import get_spawn_process_pool
+from ..response import SyftException
+from .chunked import ELEMENTWISE_OPS
+from .chunked import NUMPY_REDUCTIONS
+from .chunked import PANDAS_REDUCTIONS
+from .chunked import iter_row_chunks
+
+ARRAY_SUFFIX = ".npy"
+FRAME_SUFFIX = ".arrow"
+
+# agg func -> the partial aggregations of a segment it is computed from
+GROUPBY_PARTIALS: Dict[str, Tuple[str, ...]] = {
+    "sum": ("sum",),
+    "count": ("count",),
+    "min": ("min",),
+    "max": ("max",),
+    "mean": ("sum", "count"),
+}
+
+# partial aggregation -> how the partials of all segments are combined
+GROUPBY_COMBINE: Dict[str, str] = {
+    "sum": "sum",
+    "count": "sum",
+    "min": "min",
+    "max": "max",
+}
+
+
+class _SegmentOperand(NamedTuple):
+    path: str
+
+
+def load_segment(path: str) -> Any:
+    if path.endswith(ARRAY_SUFFIX):
+        # memory mapped, only the pages an op touches are read
+        return np.load(path, mmap_mode="r")
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def save_segment(path: str, data: Any) -> None:
+    if path.endswith(ARRAY_SUFFIX):
+        np.save(path, np.asarray(data))
+    else:
+        # uncompressed so it can be memory mapped when it is read
+        feather.write_feather(data, path, compression="uncompressed")
+
+
+# the functions below run on the segment executor, so they take paths and not data
+
+
+def _reduce_segment(path: str, op: str) -> Any:
+    data = load_segment(path)
+    reductions = NUMPY_REDUCTIONS if isinstance(data, np.ndarray) else PANDAS_REDUCTIONS
+    return reductions[op][0](data)
+
+
+def _elementwise_segment(path: str, op: str, args: List[Any], out_path: str) -> str:
+    args = [
+        load_segment(arg.path) if isinstance(arg, _SegmentOperand) else arg
+        for arg in args
+    ]
+    save_segment(out_path, getattr(load_segment(path), op)(*args))
+    return out_path
+
+
+def _groupby_segment(
+    path: str, by: Union[str, List[str]], spec: Dict[str, List[str]]
+) -> pd.DataFrame:
+    return load_segment(path).groupby(by).agg(spec)
+
+
+def _segment_rows(path: str) -> int:
+    if path.endswith(ARRAY_SUFFIX):
+        return len(load_segment(path))
+    return feather.read_table(path, memory_map=True).num_rows
+
+
+def map_segments(func: Callable, *iterables: Iterable) -> List[Any]:
+    """map `func` on the segment executor when flags.SEGMENT_WORKERS is set"""
+    executor = get_spawn_process_pool("segment", flags.SEGMENT_WORKERS)
+    if executor is None:
+        return list(map(func, *iterables))
+    return list(executor.map(func, *iterables))
+
+
+class SegmentedData:
+    """Rows of data stored on disk as one file per segment.
+
+    Segments are loaded one at a time, so data larger than memory can be served.
+    Elementwise ops write their result as new segments next to these, and
+    reductions combine the partial result of every segment. Both run on the
+    segment executor when flags.SEGMENT_WORKERS is set.
+    """
+
+    suffix: ClassVar[str]
+    reductions: ClassVar[Dict[str, Tuple[Callable, Callable]]]
+    paths: List[str]
+
+    def __init__(self, paths: List[str]) -> None:
+        self.paths = list(paths)
+
+    @classmethod
+    def from_segments(cls, paths: List[str]) -> "SegmentedData":
+        if not paths:
+            raise SyftException(f"{cls.__name__} needs at least one segment")
+        for path in paths:
+            if not path.endswith(cls.suffix) or not os.path.isfile(path):
+                raise SyftException(f"{path} is not a {cls.suffix} segment")
+        return cls(paths)
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[Any], directory: Optional[str] = None
+    ) -> "SegmentedData":
+        """Write every chunk as a segment in `directory`, a new temporary
+        directory if it is None. `chunks` can be a generator, so the data
+        doesn't have to fit in memory."""
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="syft_segments_")
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for i, chunk in enumerate(chunks):
+            path = os.path.join(directory, f"{i:06d}{cls.suffix}")
+            save_segment(path, chunk)
+            paths.append(path)
+        return cls.from_segments(paths)
+
+    def segments(self) -> Iterator[Any]:
+        for path in self.paths:
+            yield load_segment(path)
+
+    def segment_rows(self) -> List[int]:
+        return map_segments(_segment_rows, self.paths)
+
+    def __len__(self) -> int:
+        return sum(self.segment_rows())
+
+    def _output_directory(self) -> str:
+        parent = os.path.dirname(os.path.dirname(self.paths[0]))
+        return tempfile.mkdtemp(prefix="syft_segments_", dir=parent)
+
+    def _elementwise(self, op: str, *args: Any) -> "SegmentedData":
+        segment_args: List[List[Any]] = [[] for _ in self.paths]
+        for arg in args:
+            if isinstance(arg, SegmentedData):
+                if type(arg) is not type(self) or (
+                    arg.segment_rows() != self.segment_rows()
+                ):
+                    raise SyftException(
+                        f"{op} needs a {type(self).__name__} with the same segments"
+                    )
+                for operands, path in zip(segment_args, arg.paths):
+                    operands.append(_SegmentOperand(path))
+            elif np.isscalar(arg):
+                for operands in segment_args:
+                    operands.append(arg)
+            else:
+                raise SyftException(
+                    f"{op} of a {type(self).__name__} and a {type(arg).__name__} "
+                    "is not supported"
+                )
+
+        directory = self._output_directory()
+        out_paths = [
+            os.path.join(directory, os.path.basename(path)) for path in self.paths
+        ]
+        paths = map_segments(
+            _elementwise_segment,
+            self.paths,
+            [op] * len(self.paths),
+            segment_args,
+            out_paths,
+        )
+        return type(self)(paths)
+
+    def _reduce(self, op: str) -> Any:
+        partials = map_segments(_reduce_segment, self.paths, [op] * len(self.paths))
+        return self.reductions[op][1](partials)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(segments={len(self.paths)})"
+
+
+def _elementwise_method(op: str) -> Callable:
+    def method(self: SegmentedData, *args: Any) -> SegmentedData:
+        return self._elementwise(op, *args)
+
+    method.__name__ = op
+    return method
+
+
+def _reduction_method(op: str) -> Callable:
+    def method(self: SegmentedData) -> Any:
+        return self._reduce(op)
+
+    method.__name__ = op
+    return method
+
+
+for _op in ELEMENTWISE_OPS:
+    setattr(SegmentedData, _op, _elementwise_method(_op))
+
+
+@serializable(attrs=["paths"])
+class SegmentedArray(SegmentedData):
+    """A numpy array stored as `.npy` segments of rows"""
+
+    suffix = ARRAY_SUFFIX
+    reductions = NUMPY_REDUCTIONS
+
+    @classmethod
+    def from_array(
+        cls, data: np.ndarray, rows: int, directory: Optional[str] = None
+    ) -> "SegmentedArray":
+        return cls.from_chunks(iter_row_chunks(data, rows), directory)
+
+    def to_numpy(self) -> np.ndarray:
+        return np.concatenate(list(self.segments()))
+
+    @property
+    def dtype(self) -> np.dtype:
+        return load_segment(self.paths[0]).dtype
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return (len(self), *load_segment(self.paths[0]).shape[1:])
+
+
+@serializable(attrs=["paths"])
+class SegmentedFrame(SegmentedData):
+    """A pandas DataFrame stored as Arrow IPC segments of rows"""
+
+    suffix = FRAME_SUFFIX
+    reductions = PANDAS_REDUCTIONS
+
+    @classmethod
+    def from_frame(
+        cls, data: pd.DataFrame, rows: int, directory: Optional[str] = None
+    ) -> "SegmentedFrame":
+        return cls.from_chunks(iter_row_chunks(data, rows), directory)
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.concat(list(self.segments()))
+
+    @property
+    def columns(self) -> List[str]:
+        schema = feather.read_table(self.paths[0], memory_map=True).schema
+        index = [
+            c for c in schema.pandas_metadata["index_columns"] if isinstance(c, str)
+        ]
+        return [name for name in schema.names if name not in index]
+
+    def groupby(self, by: Union[str, List[str]]) -> "SegmentedGroupBy":
+        return SegmentedGroupBy(frame=self, by=by)
+
+
+for _op in PANDAS_REDUCTIONS:
+    setattr(SegmentedFrame, _op, _reduction_method(_op))
+
+for _op in NUMPY_REDUCTIONS:
+    setattr(SegmentedArray, _op, _reduction_method(_op))
+
+
+@serializable(attrs=["frame", "by"])
+class SegmentedGroupBy:
+    """`SegmentedFrame.groupby`, `agg` combines the aggregations of every segment"""
+
+    def __init__(self, frame: SegmentedFrame, by: Union[str, List[str]]) -> None:
+        self.frame = frame
+        self.by = by
+
+    def _spec(self, func: Any) -> Tuple[Dict[str, List[str]], bool]:
+        """The agg funcs of every column and if the result has one column level"""
+        by = [self.by] if isinstance(self.by, str) else list(self.by)
+        if isinstance(func, str):
+            spec = {col: [func] for col in self.frame.columns if col not in by}
+            flat = True
+        elif isinstance(func, (list, tuple)):
+            spec = {col: list(func) for col in self.frame.columns if col not in by}
+            flat = False
+        elif isinstance(func, dict):
+            spec = {
+                col: [funcs] if isinstance(funcs, str) else list(funcs)
+                for col, funcs in func.items()
+            }
+            flat = all(isinstance(funcs, str) for funcs in func.values())
+        else:
+            raise SyftException(f"agg of {type(func).__name__} is not supported")
+
+        for funcs in spec.values():
+            for name in funcs:
+                if name not in GROUPBY_PARTIALS:
+                    raise SyftException(
+                        f"agg {name} is not supported, use one of "
+                        f"{list(GROUPBY_PARTIALS)}"
+                    )
+        return spec, flat
+
+    def agg(self, func: Any) -> pd.DataFrame:
+        spec, flat = self._spec(func)
+        partial_spec = {
+            col: sorted({p for name in funcs for p in GROUPBY_PARTIALS[name]})
+            for col, funcs in spec.items()
+        }
+        paths = self.frame.paths
+        partials = map_segments(
+            _groupby_segment,
+            paths,
+            [self.by] * len(paths),
+            [partial_spec] * len(paths),
+        )
+        levels = list(range(partials[0].index.nlevels))
+        combined = (
+            pd.concat(partials)
+            .groupby(level=levels)
+            .agg({key: GROUPBY_COMBINE[key[1]] for key in partials[0].columns})
+        )
+
+        columns = {}
+        for col, funcs in spec.items():
+            for name in funcs:
+                if name == "mean":
+                    columns[(col, name)] = (
+                        combined[(col, "sum")] / combined[(col, "count")]
+                    )
+                else:
+                    columns[(col, name)] = combined[(col, name)]
+        result = pd.DataFrame(columns)
+        if flat:
+            result.columns = [col for col, _ in result.columns]
+        return result
+
+    aggregate = agg
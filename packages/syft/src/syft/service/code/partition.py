@@ -0,0 +1,78 @@
+# stdlib
+from functools import reduce
+import operator
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# third party
+import numpy as np
+import pandas as pd
+
+# relative
+from ..response import SyftException
+
+
+def combine_concat(results: Dict[Any, Any]) -> Any:
+    values = list(results.values())
+    if all(isinstance(value, (pd.DataFrame, pd.Series)) for value in values):
+        return pd.concat(values)
+    if all(isinstance(value, np.ndarray) for value in values):
+        return np.concatenate(values)
+    if all(isinstance(value, (list, tuple)) for value in values):
+        return [item for value in values for item in value]
+    raise SyftException("concat can only combine frames, arrays or lists")
+
+
+def combine_sum(results: Dict[Any, Any]) -> Any:
+    return reduce(operator.add, results.values())
+
+
+def combine_dict(results: Dict[Any, Any]) -> Dict[Any, Any]:
+    return dict(results)
+
+
+# combine the results of the partitions, which are keyed by partition
+COMBINERS: Dict[str, Callable[[Dict[Any, Any]], Any]] = {
+    "concat": combine_concat,
+    "sum": combine_sum,
+    "dict": combine_dict,
+}
+
+
+def get_combiner(name: str) -> Callable[[Dict[Any, Any]], Any]:
+    if name not in COMBINERS:
+        raise SyftException(
+            f"Unknown combine function {name}, choose one of {list(COMBINERS)}"
+        )
+    return COMBINERS[name]
+
+
+def split_partitions(
+    kwargs: Dict[str, Any], partition_key: str
+) -> List[Tuple[Any, Dict[str, Any]]]:
+    """Split the DataFrame inputs with a `partition_key` column by its values.
+
+    Returns the kwargs of each partition in the order the keys are first seen.
+    Inputs without the column are passed whole to every partition, and a
+    partitioned input which lacks a key gets an empty frame for it. Rows with a
+    missing key are dropped, like in `DataFrame.groupby`.
+    """
+    groups: Dict[str, Dict[Any, pd.DataFrame]] = {}
+    for name, value in kwargs.items():
+        if isinstance(value, pd.DataFrame) and partition_key in value.columns:
+            groups[name] = dict(list(value.groupby(partition_key, sort=False)))
+    if not groups:
+        raise SyftException(f"No input has the partition key {partition_key}")
+
+    keys = list(dict.fromkeys(key for group in groups.values() for key in group))
+    partitions = []
+    for key in keys:
+        partition_kwargs = dict(kwargs)
+        for name, group in groups.items():
+            empty = kwargs[name].iloc[0:0]
+            partition_kwargs[name] = group.get(key, empty)
+        partitions.append((key, partition_kwargs))
+    return partitions
@@ -3,16 +3,21 @@ from __future__ import annotations
 
 # stdlib
 import ast
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
 import hashlib
 import inspect
 from io import StringIO
 import sys
+import threading
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -29,12 +34,18 @@ from ...serde.deserialize import _deserialize
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize
 from ...store.document_store import PartitionKey
+from ...types.syft_migration import migrate
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SYFT_OBJECT_VERSION_2
 from ...types.syft_object import SyftObject
 from ...types.transforms import TransformContext
+from ...types.transforms import drop
 from ...types.transforms import generate_id
+from ...types.transforms import make_set_default
 from ...types.transforms import transform
 from ...types.uid import UID
+from ...util.experimental_flags import flags
+from ...util.util import get_spawn_process_pool
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
 from ..metadata.node_metadata import EnclaveMetadata
@@ -49,6 +60,8 @@ from ..policy.policy import init_policy
 from ..policy.policy_service import PolicyService
 from ..response import SyftError
 from .code_parse import GlobalsVisitor
+from .partition import get_combiner
+from .partition import split_partitions
 from .unparse import unparse
 
 UserVerifyKeyPartitionKey = PartitionKey(key="user_verify_key", type_=SyftVerifyKey)
@@ -158,7 +171,7 @@ class UserCodeStatusContext:
 
 
 @serializable()
-class UserCode(SyftObject):
+class UserCodeV1(SyftObject):
     # version
     __canonical_name__ = "UserCode"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -185,6 +198,38 @@ class UserCode(SyftObject):
 
     __attr_searchable__ = ["user_verify_key", "status", "service_func_name"]
     __attr_unique__ = ["code_hash", "user_unique_func_name"]
+
+
+@serializable()
+class UserCode(SyftObject):
+    # version
+    __canonical_name__ = "UserCode"
+    __version__ = SYFT_OBJECT_VERSION_2
+
+    id: UID
+    node_uid: Optional[UID]
+    user_verify_key: SyftVerifyKey
+    raw_code: str
+    input_policy_type: Union[Type[InputPolicy], UserPolicy]
+    input_policy_init_kwargs: Optional[Dict[Any, Any]] = None
+    input_policy_state: bytes = b""
+    output_policy_type: Union[Type[OutputPolicy], UserPolicy]
+    output_policy_init_kwargs: Optional[Dict[Any, Any]] = None
+    output_policy_state: bytes = b""
+    parsed_code: str
+    service_func_name: str
+    unique_func_name: str
+    user_unique_func_name: str
+    code_hash: str
+    signature: inspect.Signature
+    status: UserCodeStatusContext
+    input_kwargs: List[str]
+    enclave_metadata: Optional[EnclaveMetadata] = None
+    partition_key: Optional[str] = None
+    combine: Optional[str] = None
+
+    __attr_searchable__ = ["user_verify_key", "status", "service_func_name"]
+    __attr_unique__ = ["code_hash", "user_unique_func_name"]
     __attr_repr_cols__ = ["status", "service_func_name"]
 
     def __setattr__(self, key: str, value: Any) -> None:
@@ -343,8 +388,21 @@ class UserCode(SyftObject):
         return self.raw_code
 
 
+@migrate(UserCodeV1, UserCode)
+def upgrade_user_code_v1_to_v2():
+    return [
+        make_set_default("partition_key", None),
+        make_set_default("combine", None),
+    ]
+
+
+@migrate(UserCode, UserCodeV1)
+def downgrade_user_code_v2_to_v1():
+    return [drop(["partition_key", "combine"])]
+
+
 @serializable(without=["local_function"])
-class SubmitUserCode(SyftObject):
+class SubmitUserCodeV1(SyftObject):
     # version
     __canonical_name__ = "SubmitUserCode"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -361,6 +419,27 @@ class SubmitUserCode(SyftObject):
     input_kwargs: List[str]
     enclave_metadata: Optional[EnclaveMetadata] = None
 
+
+@serializable(without=["local_function"])
+class SubmitUserCode(SyftObject):
+    # version
+    __canonical_name__ = "SubmitUserCode"
+    __version__ = SYFT_OBJECT_VERSION_2
+
+    id: Optional[UID]
+    code: str
+    func_name: str
+    signature: inspect.Signature
+    input_policy_type: Union[SubmitUserPolicy, UID, Type[InputPolicy]]
+    input_policy_init_kwargs: Optional[Dict[Any, Any]] = {}
+    output_policy_type: Union[SubmitUserPolicy, UID, Type[OutputPolicy]]
+    output_policy_init_kwargs: Optional[Dict[Any, Any]] = {}
+    local_function: Optional[Callable]
+    input_kwargs: List[str]
+    enclave_metadata: Optional[EnclaveMetadata] = None
+    partition_key: Optional[str] = None
+    combine: Optional[str] = None
+
     @property
     def kwargs(self) -> List[str]:
         return self.input_policy_init_kwargs
@@ -380,6 +459,19 @@ class SubmitUserCode(SyftObject):
             raise NotImplementedError
 
 
+@migrate(SubmitUserCodeV1, SubmitUserCode)
+def upgrade_submit_user_code_v1_to_v2():
+    return [
+        make_set_default("partition_key", None),
+        make_set_default("combine", None),
+    ]
+
+
+@migrate(SubmitUserCode, SubmitUserCodeV1)
+def downgrade_submit_user_code_v2_to_v1():
+    return [drop(["partition_key", "combine"])]
+
+
 def debox_asset(arg: Any) -> Any:
     deboxed_arg = arg
     if isinstance(deboxed_arg, Asset):
@@ -392,7 +484,19 @@ def debox_asset(arg: Any) -> Any:
 def syft_function(
     input_policy: Union[InputPolicy, UID],
     output_policy: Union[OutputPolicy, UID],
+    partition_key: Optional[str] = None,
+    combine: str = "dict",
 ) -> SubmitUserCode:
+    """Submit a function to run on the node under the input and output policy.
+
+    With a `partition_key` the node splits the DataFrame inputs by the values of
+    that column, runs the function on every partition (in parallel with
+    flags.PARTITION_WORKERS processes) and merges the results of the partitions
+    with `combine`, which is "dict" (key -> result), "concat" or "sum".
+    """
+    if partition_key is not None:
+        get_combiner(combine)
+
     if isinstance(input_policy, CustomInputPolicy):
         input_policy_type = SubmitUserPolicy.from_obj(input_policy)
     else:
@@ -414,6 +518,8 @@ def syft_function(
             output_policy_init_kwargs=output_policy.init_kwargs,
             local_function=f,
             input_kwargs=f.__code__.co_varnames[: f.__code__.co_argcount],
+            partition_key=partition_key,
+            combine=combine if partition_key is not None else None,
         )
 
     return decorator
@@ -604,28 +710,136 @@ class UserCodeExecutionResult(SyftObject):
     result: Any
 
 
-def execute_byte_code(code_item: UserCode, kwargs: Dict[str, Any]) -> Any:
-    stdout_ = sys.stdout
-    stderr_ = sys.stderr
+class ThreadLocalStream:
+    """Proxy for sys.stdout / sys.stderr which writes to the stream redirected for
+    the current thread, so concurrent executions each capture their own output.
+    """
+
+    def __init__(self, stream: Any, name: str) -> None:
+        self._stream = stream
+        self._name = name
 
+    @property
+    def target(self) -> Any:
+        stream = getattr(_thread_streams, self._name, None)
+        return self._stream if stream is None else stream
+
+    def write(self, data: str) -> int:
+        return self.target.write(data)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.target, name)
+
+
+_thread_streams = threading.local()
+_thread_streams_lock = threading.Lock()
+# redirects which haven't exited yet, the last one puts back the original streams
+_thread_streams_count = 0
+
+
+def _restore_stream(name: str) -> None:
+    stream = getattr(sys, name)
+    # only undo our own proxy, the stream may have been replaced since
+    if isinstance(stream, ThreadLocalStream):
+        setattr(sys, name, stream._stream)
+
+
+@contextmanager
+def redirect_thread_output(stdout: StringIO, stderr: StringIO) -> Iterator[None]:
+    global _thread_streams_count
+    with _thread_streams_lock:
+        if not isinstance(sys.stdout, ThreadLocalStream):
+            sys.stdout = ThreadLocalStream(sys.stdout, "stdout")
+        if not isinstance(sys.stderr, ThreadLocalStream):
+            sys.stderr = ThreadLocalStream(sys.stderr, "stderr")
+        _thread_streams_count += 1
+
+    # nested redirects in the same thread go back to the outer streams
+    previous = (
+        getattr(_thread_streams, "stdout", None),
+        getattr(_thread_streams, "stderr", None),
+    )
+    _thread_streams.stdout = stdout
+    _thread_streams.stderr = stderr
     try:
-        stdout = StringIO()
-        stderr = StringIO()
+        yield
+    finally:
+        _thread_streams.stdout, _thread_streams.stderr = previous
+        with _thread_streams_lock:
+            _thread_streams_count -= 1
+            if _thread_streams_count == 0:
+                _restore_stream("stdout")
+                _restore_stream("stderr")
+
+
+def execute_partition(
+    parsed_code: str, func_name: str, kwargs: Dict[str, Any]
+) -> Tuple[Any, str, str]:
+    stdout = StringIO()
+    stderr = StringIO()
+    with redirect_thread_output(stdout, stderr):
+        namespace: Dict[str, Any] = {}
+        exec(compile_byte_code(parsed_code), namespace)  # nosec
+        result = namespace[func_name](**kwargs)
+    return result, stdout.getvalue(), stderr.getvalue()
+
+
+def get_partition_executor() -> Optional[ProcessPoolExecutor]:
+    return get_spawn_process_pool("partition", flags.PARTITION_WORKERS)
+
+
+def execute_partitioned_byte_code(
+    code_item: UserCode, kwargs: Dict[str, Any]
+) -> UserCodeExecutionResult:
+    """Run the code on every partition of the inputs and combine the results.
+
+    The partitions run on the partition executor when flags.PARTITION_WORKERS is
+    set, otherwise one after the other. Errors are handled by execute_byte_code.
+    """
+    partitions = split_partitions(kwargs, code_item.partition_key)
+    if not partitions:
+        # empty inputs, the function decides what that means
+        partitions = [(None, kwargs)]
+    combiner = get_combiner(code_item.combine)
+
+    args = [
+        (code_item.parsed_code, code_item.unique_func_name, partition_kwargs)
+        for _, partition_kwargs in partitions
+    ]
+    executor = get_partition_executor()
+    if executor is None or len(partitions) == 1:
+        outputs = [execute_partition(*arg) for arg in args]
+    else:
+        outputs = list(executor.map(execute_partition, *zip(*args)))
+
+    results = {key: output[0] for (key, _), output in zip(partitions, outputs)}
+    return UserCodeExecutionResult(
+        user_code_id=code_item.id,
+        stdout="".join(output[1] for output in outputs),
+        stderr="".join(output[2] for output in outputs),
+        result=combiner(results),
+    )
 
-        sys.stdout = stdout
-        sys.stderr = stderr
 
-        # statisfy lint checker
-        result = None
+def execute_byte_code(code_item: UserCode, kwargs: Dict[str, Any]) -> Any:
+    stdout = StringIO()
+    stderr = StringIO()
 
-        exec(code_item.byte_code)  # nosec
+    try:
+        if code_item.partition_key is not None:
+            return execute_partitioned_byte_code(code_item, kwargs)
 
-        evil_string = f"{code_item.unique_func_name}(**kwargs)"
-        result = eval(evil_string, None, locals())  # nosec
+        with redirect_thread_output(stdout, stderr):
+            # statisfy lint checker
+            result = None
 
-        # restore stdout and stderr
-        sys.stdout = stdout_
-        sys.stderr = stderr_
+            exec(code_item.byte_code)  # nosec
+
+            evil_string = f"{code_item.unique_func_name}(**kwargs)"
+            result = eval(evil_string, None, locals())  # nosec
 
         return UserCodeExecutionResult(
             user_code_id=code_item.id,
@@ -635,7 +849,6 @@ def execute_byte_code(code_item: UserCode, kwargs: Dict[str, Any]) -> Any:
         )
 
     except Exception as e:
-        print("execute_byte_code failed", e, file=stderr_)
-    finally:
-        sys.stdout = stdout_
-        sys.stderr = stderr_
+        print("execute_byte_code failed", e, file=sys.stderr)
+        # the caller turns it into the error of the call
+        raise
@@ -191,6 +191,8 @@ class UserCodeService(AbstractService):
             )
             if isinstance(result, str):
                 return SyftError(message=result)
+            if result.is_err():
+                return SyftError(message=result.err())
 
             # Apply Output Policy to the results and update the OutputPolicyState
             final_results = result.ok()
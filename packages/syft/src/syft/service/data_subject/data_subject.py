@@ -4,6 +4,7 @@ from typing import List
 from typing import Optional
 from typing import Set
 from typing import Tuple
+import uuid
 
 # third party
 from typing_extensions import Self
@@ -15,7 +16,6 @@ from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SyftObject
 from ...types.transforms import TransformContext
 from ...types.transforms import add_node_uid_for_key
-from ...types.transforms import generate_id
 from ...types.transforms import transform
 from ...types.uid import UID
 from ..response import SyftError
@@ -111,6 +111,17 @@ class DataSubjectCreate(SyftObject):
         return "```python\n" + _repr_str + "\n```"
 
 
+def data_subject_uid(name: str) -> UID:
+    # names are unique, so DataSubjects with known names are read by id
+    return UID(uuid.uuid5(uuid.NAMESPACE_OID, f"DataSubject/{name}"))
+
+
+def generate_data_subject_id(context: TransformContext) -> TransformContext:
+    if not isinstance(context.output.get("id", None), UID):
+        context.output["id"] = data_subject_uid(context.output["name"])
+    return context
+
+
 def remove_members_list(context: TransformContext) -> TransformContext:
     context.output.pop("members", [])
     return context
@@ -118,4 +129,8 @@ def remove_members_list(context: TransformContext) -> TransformContext:
 
 @transform(DataSubjectCreate, DataSubject)
 def create_data_subject_to_data_subject():
-    return [generate_id, remove_members_list, add_node_uid_for_key("node_uid")]
+    return [
+        generate_data_subject_id,
+        remove_members_list,
+        add_node_uid_for_key("node_uid"),
+    ]
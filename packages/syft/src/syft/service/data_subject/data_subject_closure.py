@@ -0,0 +1,209 @@
+# stdlib
+from contextlib import contextmanager
+import json
+import threading
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+import uuid
+
+# third party
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ...node.credentials import SyftVerifyKey
+from ...serde.serializable import serializable
+from ...store.document_store import BaseUIDStoreStash
+from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionSettings
+from ...store.locks import SyftLock
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
+from ...types.uid import UID
+from ...util.telemetry import instrument
+
+
+def closure_uid(name: str) -> UID:
+    # one row per DataSubject name, so rows are read by id instead of queried
+    return UID(uuid.uuid5(uuid.NAMESPACE_OID, f"DataSubjectClosure/{name}"))
+
+
+@serializable()
+class DataSubjectClosure(SyftObject):
+    """The transitive closure of the member relationships of a DataSubject"""
+
+    # version
+    __canonical_name__ = "DataSubjectClosure"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    id: UID
+    name: str
+    # the names of the DataSubjects above and below it, by their shortest distance
+    ancestors: Dict[str, int] = {}
+    descendants: Dict[str, int] = {}
+
+    # the root has a row with the whole hierarchy, encoded in one string field
+    __serde_overrides__: Dict[str, Sequence[Callable]] = {
+        "ancestors": (json.dumps, json.loads),
+        "descendants": (json.dumps, json.loads),
+    }
+
+    @classmethod
+    def for_name(cls, name: str) -> "DataSubjectClosure":
+        return cls(id=closure_uid(name), name=name)
+
+
+@instrument
+@serializable()
+class DataSubjectClosureStash(BaseUIDStoreStash):
+    object_type = DataSubjectClosure
+    settings: PartitionSettings = PartitionSettings(
+        name=DataSubjectClosure.__canonical_name__, object_type=DataSubjectClosure
+    )
+
+    # the rows are read, changed and written back as a whole, so two adds at
+    # once would drop each other's edges without it. shared by the stashes in
+    # this process, the store lock covers the other processes of the node
+    _update_lock = threading.Lock()
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+        locking_config = self.partition.store_config.locking_config.copy(
+            update={"lock_name": f"{self.settings.name}_update"}
+        )
+        self._store_lock = SyftLock(locking_config)
+
+    @contextmanager
+    def update_lock(self) -> Iterator[bool]:
+        """Held from reading the rows of an add until they are saved, yields
+        False if the store lock timed out"""
+        with self._update_lock:
+            locked = self._store_lock.acquire(blocking=True)
+            try:
+                yield locked
+            finally:
+                if locked:
+                    self._store_lock.release()
+
+    def get_by_name(
+        self, credentials: SyftVerifyKey, name: str
+    ) -> Result[DataSubjectClosure, str]:
+        rows = self.get_many(credentials, [name])
+        if rows.is_err():
+            return rows
+        # a DataSubject without members has no row yet
+        return Ok(rows.ok().get(name, DataSubjectClosure.for_name(name)))
+
+    def get_many(
+        self, credentials: SyftVerifyKey, names: Iterable[str]
+    ) -> Result[Dict[str, DataSubjectClosure], str]:
+        qks = self.partition.store_query_keys([closure_uid(name) for name in names])
+        result = self.partition.get_all_from_store(credentials=credentials, qks=qks)
+        if result.is_err():
+            return result
+        return Ok({row.name: row for row in result.ok()})
+
+    def _load(
+        self,
+        credentials: SyftVerifyKey,
+        rows: Dict[str, DataSubjectClosure],
+        created: Set[str],
+        names: Iterable[str],
+    ) -> Result[None, str]:
+        missing = [name for name in names if name not in rows]
+        if not missing:
+            return Ok(None)
+        found = self.get_many(credentials, missing)
+        if found.is_err():
+            return found
+        found = found.ok()
+        for name in missing:
+            if name in found:
+                # a copy, nothing changes in memory stores until it's written
+                rows[name] = found[name].copy(deep=True)
+            else:
+                rows[name] = DataSubjectClosure.for_name(name)
+                created.add(name)
+        return Ok(None)
+
+    def closure_rows(
+        self, credentials: SyftVerifyKey, edges: List[Tuple[str, str]]
+    ) -> Result[Tuple[List[DataSubjectClosure], List[DataSubjectClosure]], str]:
+        """The rows which adding parent -> child edges creates and changes.
+        Called under update_lock until the rows are saved.
+
+        Every parent and its ancestors get the child and its descendants as
+        descendants, and the other way around. The rows are read once for the
+        whole batch and nothing is written, edges making a cycle are an error.
+        """
+        rows: Dict[str, DataSubjectClosure] = {}
+        created: Set[str] = set()
+        changed: Set[str] = set()
+        # one query for the rows of every DataSubject in the batch
+        loaded = self._load(credentials, rows, created, {n for e in edges for n in e})
+        if loaded.is_err():
+            return loaded
+
+        for parent, child in edges:
+            if parent == child or child in rows[parent].ancestors:
+                return Err(f"DataSubject {parent} is a member of {child}")
+
+            ancestors = {**rows[parent].ancestors, parent: 0}
+            descendants = {**rows[child].descendants, child: 0}
+            loaded = self._load(credentials, rows, created, [*ancestors, *descendants])
+            if loaded.is_err():
+                return loaded
+
+            for ancestor, above in ancestors.items():
+                ancestor_row = rows[ancestor]
+                for descendant, below in descendants.items():
+                    depth = above + below + 1
+                    if ancestor_row.descendants.get(descendant, depth + 1) > depth:
+                        ancestor_row.descendants[descendant] = depth
+                        rows[descendant].ancestors[ancestor] = depth
+                        changed.add(ancestor)
+                        changed.add(descendant)
+
+        return Ok(
+            (
+                [rows[name] for name in changed & created],
+                [rows[name] for name in changed - created],
+            )
+        )
+
+    def save_rows(
+        self,
+        credentials: SyftVerifyKey,
+        new_rows: List[DataSubjectClosure],
+        changed_rows: List[DataSubjectClosure],
+    ) -> Result[int, str]:
+        if new_rows:
+            result = self.set_many(credentials, new_rows)
+            if result.is_err():
+                return result
+        for row in changed_rows:
+            result = self.update(credentials, row)
+            if result.is_err():
+                return result
+        return Ok(len(new_rows) + len(changed_rows))
+
+    def add_edges(
+        self, credentials: SyftVerifyKey, edges: List[Tuple[str, str]]
+    ) -> Result[int, str]:
+        """Add parent -> child edges to the closure, in one read and one write of
+        the rows for the whole batch, so large hierarchies are imported in one call.
+        """
+        with self.update_lock() as locked:
+            if not locked:
+                return Err("Failed to acquire the lock of the DataSubject closure")
+            rows = self.closure_rows(credentials, edges)
+            if rows.is_err():
+                return rows
+            return self.save_rows(credentials, *rows.ok())
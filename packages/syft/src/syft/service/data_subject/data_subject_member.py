@@ -1,13 +1,22 @@
+# stdlib
+import uuid
+
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import PartitionKey
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SyftObject
+from ...types.uid import UID
 
 ParentPartitionKey = PartitionKey(key="parent", type_=str)
 ChildPartitionKey = PartitionKey(key="child", type_=str)
 
 
+def member_relationship_uid(parent: str, child: str) -> UID:
+    # a parent has many children and a child many parents, only the pair is unique
+    return UID(uuid.uuid5(uuid.NAMESPACE_OID, f"DataSubjectMember/{parent}/{child}"))
+
+
 @serializable()
 class DataSubjectMemberRelationship(SyftObject):
     __canonical_name__ = "DataSubjectMemberRelationship"
@@ -17,7 +26,7 @@ class DataSubjectMemberRelationship(SyftObject):
     child: str
 
     __attr_searchable__ = ["parent", "child"]
-    __attr_unique__ = ["parent", "child"]
+    __attr_unique__ = []
 
     def __hash__(self) -> int:
         return hash(self.parent + self.child)
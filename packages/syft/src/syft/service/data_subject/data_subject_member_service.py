@@ -1,9 +1,12 @@
 # stdlib
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
+from result import Ok
 from result import Result
 
 # relative
@@ -20,9 +23,11 @@ from ..response import SyftSuccess
 from ..service import AbstractService
 from ..service import SERVICE_TO_TYPES
 from ..service import TYPE_TO_SERVICE
+from .data_subject_closure import DataSubjectClosureStash
 from .data_subject_member import ChildPartitionKey
 from .data_subject_member import DataSubjectMemberRelationship
 from .data_subject_member import ParentPartitionKey
+from .data_subject_member import member_relationship_uid
 
 
 @instrument
@@ -59,17 +64,104 @@ class DataSubjectMemberService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = DataSubjectMemberStash(store=store)
+        self.closure_stash = DataSubjectClosureStash(store=store)
+        self._closure_backfilled = False
+
+    def backfill_closure(self) -> Result[int, str]:
+        """Build the closure from the relationships stored before it existed.
+
+        Only done while the closure is empty, adding edges which are already in
+        it changes nothing, so a backfill running twice is harmless.
+        """
+        if self._closure_backfilled:
+            return Ok(0)
+        credentials = self.closure_stash.partition.root_verify_key
+        added = 0
+        if len(self.closure_stash) == 0 and len(self.stash) > 0:
+            relations = self.stash.get_all(credentials)
+            if relations.is_err():
+                return relations
+            edges = [(relation.parent, relation.child) for relation in relations.ok()]
+            result = self.closure_stash.add_edges(credentials, edges)
+            if result.is_err():
+                return result
+            added = result.ok()
+        self._closure_backfilled = True
+        return Ok(added)
 
     def add(
         self, context: AuthedServiceContext, parent: str, child: str
     ) -> Union[SyftSuccess, SyftError]:
         """Register relationship between data subject and it's member."""
-        relation = DataSubjectMemberRelationship(parent=parent, child=child)
-        result = self.stash.set(context.credentials, relation, ignore_duplicates=True)
-        if result.is_err():
-            return SyftError(result.err())
+        result = self.add_many(context, [(parent, child)])
+        if isinstance(result, SyftError):
+            return result
         return SyftSuccess(message=f"Relationship added for: {parent} -> {child}")
 
+    def add_many(
+        self, context: AuthedServiceContext, edges: List[Tuple[str, str]]
+    ) -> Union[SyftSuccess, SyftError]:
+        """Register parent -> child relationships and update their closure."""
+        backfilled = self.backfill_closure()
+        if backfilled.is_err():
+            return SyftError(message=backfilled.err())
+        # the closure is node data, maintained with the root key
+        credentials = self.closure_stash.partition.root_verify_key
+        with self.closure_stash.update_lock() as locked:
+            if not locked:
+                return SyftError(
+                    message="Failed to acquire the lock of the DataSubject closure"
+                )
+            # rejects cycles before anything is written
+            rows = self.closure_stash.closure_rows(credentials, edges)
+            if rows.is_err():
+                return SyftError(message=rows.err())
+
+            # the relationships first, the closure can be rebuilt from them
+            relations = [
+                DataSubjectMemberRelationship(
+                    id=member_relationship_uid(parent, child),
+                    parent=parent,
+                    child=child,
+                )
+                for parent, child in edges
+            ]
+            result = self.stash.set_many(
+                context.credentials, relations, ignore_duplicates=True
+            )
+            if result.is_err():
+                return SyftError(message=result.err())
+            result = self.closure_stash.save_rows(credentials, *rows.ok())
+            if result.is_err():
+                return SyftError(message=result.err())
+        return SyftSuccess(message=f"{len(edges)} Relationships added")
+
+    def get_descendants(
+        self, context: AuthedServiceContext, data_subject_name: str
+    ) -> Union[Dict[str, int], SyftError]:
+        """Names of all the members of a data subject, by their depth."""
+        backfilled = self.backfill_closure()
+        if backfilled.is_err():
+            return SyftError(message=backfilled.err())
+        credentials = self.closure_stash.partition.root_verify_key
+        result = self.closure_stash.get_by_name(credentials, data_subject_name)
+        if result.is_err():
+            return SyftError(message=result.err())
+        return result.ok().descendants
+
+    def get_ancestors(
+        self, context: AuthedServiceContext, data_subject_name: str
+    ) -> Union[Dict[str, int], SyftError]:
+        """Names of all the data subjects a data subject is a member of, by depth."""
+        backfilled = self.backfill_closure()
+        if backfilled.is_err():
+            return SyftError(message=backfilled.err())
+        credentials = self.closure_stash.partition.root_verify_key
+        result = self.closure_stash.get_by_name(credentials, data_subject_name)
+        if result.is_err():
+            return SyftError(message=result.err())
+        return result.ok().ancestors
+
     def get_relatives(
         self, context: AuthedServiceContext, data_subject_name: str
     ) -> Union[List[str], SyftError]:
@@ -1,9 +1,12 @@
 # stdlib
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
 
 # third party
+from result import Ok
 from result import Result
 
 # relative
@@ -24,6 +27,7 @@ from ..service import service_method
 from .data_subject import DataSubject
 from .data_subject import DataSubjectCreate
 from .data_subject import NamePartitionKey
+from .data_subject import data_subject_uid
 from .data_subject_member_service import DataSubjectMemberService
 
 
@@ -44,6 +48,27 @@ class DataSubjectStash(BaseUIDStoreStash):
         qks = QueryKeys(qks=[NamePartitionKey.with_obj(name)])
         return self.query_one(credentials, qks=qks)
 
+    def get_many_by_name(
+        self, credentials: SyftVerifyKey, names: Iterable[str]
+    ) -> Result[Dict[str, DataSubject], str]:
+        names = list(names)
+        qks = self.partition.store_query_keys([data_subject_uid(n) for n in names])
+        result = self.partition.get_all_from_store(credentials=credentials, qks=qks)
+        if result.is_err():
+            return result
+        data_subjects = {
+            data_subject.name: data_subject for data_subject in result.ok()
+        }
+        # DataSubjects stored before their ids were derived from their names
+        for name in names:
+            if name not in data_subjects:
+                result = self.get_by_name(credentials, name=name)
+                if result.is_err():
+                    return result
+                if result.ok() is not None:
+                    data_subjects[name] = result.ok()
+        return Ok(data_subjects)
+
     def update(
         self, credentials: SyftVerifyKey, data_subject: DataSubject
     ) -> Result[DataSubject, str]:
@@ -69,29 +94,39 @@ class DataSubjectService(AbstractService):
         self, context: AuthedServiceContext, data_subject: DataSubjectCreate
     ) -> Union[SyftSuccess, SyftError]:
         """Register a data subject."""
+        return self.add_many(context=context, data_subjects=[data_subject])
+
+    @service_method(path="data_subject.add_many", name="add_many")
+    def add_many(
+        self, context: AuthedServiceContext, data_subjects: List[DataSubjectCreate]
+    ) -> Union[SyftSuccess, SyftError]:
+        """Register data subjects and their members, in one write for each."""
+        member_relationships_add = context.node.get_service_method(
+            DataSubjectMemberService.add_many
+        )
 
-        member_relationship_add = context.node.get_service_method(
-            DataSubjectMemberService.add
+        subjects = {}
+        edges = []
+        for data_subject in data_subjects:
+            subjects.setdefault(data_subject.name, data_subject)
+            for parent_ds, child_ds in data_subject.member_relationships:
+                subjects.setdefault(child_ds.name, child_ds)
+                edges.append((parent_ds.name, child_ds.name))
+
+        result = self.stash.set_many(
+            context.credentials,
+            [ds.to(DataSubject, context=context) for ds in subjects.values()],
+            ignore_duplicates=True,
         )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
 
-        member_relationships = data_subject.member_relationships
-        for member_relationship in member_relationships:
-            parent_ds, child_ds = member_relationship
-            for ds in [parent_ds, child_ds]:
-                result = self.stash.set(
-                    context.credentials,
-                    ds.to(DataSubject, context=context),
-                    ignore_duplicates=True,
-                )
-                if result.is_err():
-                    return SyftError(message=str(result.err()))
-            result = member_relationship_add(context, parent_ds.name, child_ds.name)
+        if edges:
+            result = member_relationships_add(context, edges)
             if isinstance(result, SyftError):
                 return result
 
-        return SyftSuccess(
-            message=f"{len(member_relationships)+1} Data Subjects Registered"
-        )
+        return SyftSuccess(message=f"{len(subjects)} Data Subjects Registered")
 
     @service_method(path="data_subject.get_all", name="get_all")
     def get_all(
@@ -104,27 +139,51 @@ class DataSubjectService(AbstractService):
             return data_subjects
         return SyftError(message=result.err())
 
+    def _get_by_depth(
+        self, context: AuthedServiceContext, relatives: Union[Dict[str, int], SyftError]
+    ) -> Union[List[DataSubject], SyftError]:
+        if isinstance(relatives, SyftError):
+            return relatives
+        result = self.stash.get_many_by_name(context.credentials, relatives.keys())
+        if result.is_err():
+            return SyftError(message=result.err())
+        data_subjects = result.ok()
+        # the closest first
+        names = sorted(relatives, key=relatives.__getitem__)
+        return [data_subjects[name] for name in names if name in data_subjects]
+
     @service_method(path="data_subject.get_members", name="members_for")
     def get_members(
         self, context: AuthedServiceContext, data_subject_name: str
     ) -> Union[List[DataSubject], SyftError]:
-        get_relatives = context.node.get_service_method(
-            DataSubjectMemberService.get_relatives
+        get_descendants = context.node.get_service_method(
+            DataSubjectMemberService.get_descendants
         )
+        descendants = get_descendants(context, data_subject_name)
+        if isinstance(descendants, SyftError):
+            return descendants
+        members = {name: depth for name, depth in descendants.items() if depth == 1}
+        return self._get_by_depth(context, members)
+
+    @service_method(path="data_subject.get_all_descendants", name="get_all_descendants")
+    def get_all_descendants(
+        self, context: AuthedServiceContext, data_subject_name: str
+    ) -> Union[List[DataSubject], SyftError]:
+        """Get the members of a data subject and all of their members."""
+        get_descendants = context.node.get_service_method(
+            DataSubjectMemberService.get_descendants
+        )
+        return self._get_by_depth(context, get_descendants(context, data_subject_name))
 
-        relatives = get_relatives(context, data_subject_name)
-
-        if isinstance(relatives, SyftError):
-            return relatives
-
-        members = []
-        for relative in relatives:
-            result = self.get_by_name(context=context, name=relative.child)
-            if isinstance(result, SyftError):
-                return result
-            members.append(result)
-
-        return members
+    @service_method(path="data_subject.get_all_ancestors", name="get_all_ancestors")
+    def get_all_ancestors(
+        self, context: AuthedServiceContext, data_subject_name: str
+    ) -> Union[List[DataSubject], SyftError]:
+        """Get the data subjects a data subject is a member of, directly or not."""
+        get_ancestors = context.node.get_service_method(
+            DataSubjectMemberService.get_ancestors
+        )
+        return self._get_by_depth(context, get_ancestors(context, data_subject_name))
 
     @service_method(path="data_subject.get_by_name", name="get_by_name")
     def get_by_name(
@@ -18,6 +18,7 @@ from result import Result
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import PartitionKey
+from ...store.document_store import Projection
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SyftObject
 from ...types.transforms import TransformContext
@@ -247,6 +248,31 @@ class Dataset(SyftObject):
         return client
 
 
+@serializable()
+class DatasetView(SyftObject):
+    """A row of a table of Datasets, built without deserializing their Assets"""
+
+    # version
+    __canonical_name__ = "DatasetView"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    id: UID
+    name: str
+    node_uid: Optional[UID]
+    asset_count: int = 0
+    mb_size: Optional[int]
+    updated_at: Optional[str]
+
+    __attr_repr_cols__ = ["name", "asset_count", "mb_size", "updated_at"]
+
+
+DatasetViewProjection = Projection(
+    DatasetView,
+    fields=["id", "name", "mb_size", "updated_at"],
+    counts={"asset_count": "asset_list"},
+)
+
+
 @serializable()
 class CreateDataset(Dataset):
     # version
@@ -0,0 +1,314 @@
+# stdlib
+from bisect import bisect_left
+from bisect import insort
+from collections import Counter
+from operator import itemgetter
+import re
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ...node.credentials import SyftVerifyKey
+from ...serde.serializable import serializable
+from ...store.document_store import BaseUIDStoreStash
+from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionSettings
+from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
+from ...types.uid import UID
+from ...util.telemetry import instrument
+from .dataset import Dataset
+from .dataset_stash import DatasetStash
+
+TOKEN_REGEX = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return TOKEN_REGEX.findall(text.lower()) if text else []
+
+
+def dataset_terms(dataset: Dataset) -> Dict[str, int]:
+    """Term frequencies of the name, description and asset names of a Dataset"""
+    tokens = tokenize(dataset.name) + tokenize(dataset.description)
+    for asset in dataset.asset_list:
+        tokens += tokenize(asset.name)
+    return dict(Counter(tokens))
+
+
+class InvertedIndex:
+    """Term -> document -> term frequency postings, with prefix and AND queries.
+
+    The terms are also kept sorted so the terms starting with a prefix are a
+    contiguous slice found by bisection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self.postings: Dict[str, Dict[UID, int]] = {}
+        self.terms: List[str] = []
+        self.documents: Dict[UID, Dict[str, int]] = {}
+
+    def add(self, doc_id: UID, terms: Dict[str, int]) -> None:
+        with self._lock:
+            self.remove(doc_id)
+            for term, count in terms.items():
+                postings = self.postings.get(term, None)
+                if postings is None:
+                    postings = self.postings[term] = {}
+                    insort(self.terms, term)
+                postings[doc_id] = count
+            self.documents[doc_id] = terms
+
+    def remove(self, doc_id: UID) -> None:
+        with self._lock:
+            terms = self.documents.pop(doc_id, None)
+            if terms is None:
+                return
+            for term in terms:
+                postings = self.postings[term]
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+                    del self.terms[bisect_left(self.terms, term)]
+
+    def prefix_terms(self, prefix: str) -> List[str]:
+        start = bisect_left(self.terms, prefix)
+        end = start
+        while end < len(self.terms) and self.terms[end].startswith(prefix):
+            end += 1
+        return self.terms[start:end]
+
+    def search(self, query: str) -> List[Tuple[UID, int]]:
+        """Documents with a term starting with each word of the `query`, ranked by
+        the frequency of the matching terms"""
+        with self._lock:
+            prefixes = [self.prefix_terms(prefix) for prefix in set(tokenize(query))]
+            # the most selective words first, the others only score its matches
+            prefixes.sort(key=lambda terms: sum(len(self.postings[t]) for t in terms))
+            scores: Optional[Dict[UID, int]] = None
+            for terms in prefixes:
+                postings = [self.postings[term] for term in terms]
+                if scores is None:
+                    scores = self._union(postings)
+                elif len(scores) * len(postings) < sum(map(len, postings)):
+                    scores = self._lookup(scores, postings)
+                else:
+                    scores = self._scan(scores, postings)
+                if not scores:
+                    return []
+        if scores is None:
+            return []
+        return sorted(scores.items(), key=itemgetter(1), reverse=True)
+
+    @staticmethod
+    def _union(postings: List[Dict[UID, int]]) -> Dict[UID, int]:
+        if len(postings) == 1:
+            return dict(postings[0])
+        scores: Dict[UID, int] = {}
+        for term_postings in postings:
+            for doc_id, count in term_postings.items():
+                scores[doc_id] = scores.get(doc_id, 0) + count
+        return scores
+
+    @staticmethod
+    def _lookup(
+        scores: Dict[UID, int], postings: List[Dict[UID, int]]
+    ) -> Dict[UID, int]:
+        # few candidates, look them up in the postings of each term
+        matches: Dict[UID, int] = {}
+        for doc_id, score in scores.items():
+            counts = [p[doc_id] for p in postings if doc_id in p]
+            if counts:
+                matches[doc_id] = score + sum(counts)
+        return matches
+
+    @staticmethod
+    def _scan(scores: Dict[UID, int], postings: List[Dict[UID, int]]) -> Dict[UID, int]:
+        # few postings, keep the ones of the candidates
+        matches: Dict[UID, int] = {}
+        for term_postings in postings:
+            for doc_id, count in term_postings.items():
+                if doc_id in scores:
+                    matches[doc_id] = matches.get(doc_id, scores[doc_id]) + count
+        return matches
+
+    def clear(self) -> None:
+        with self._lock:
+            self.postings.clear()
+            self.terms.clear()
+            self.documents.clear()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+
+@serializable()
+class DatasetSearchEntry(SyftObject):
+    # version
+    __canonical_name__ = "DatasetSearchEntry"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # the id of the indexed Dataset
+    id: UID
+    terms: Dict[str, int]
+
+
+@instrument
+@serializable()
+class DatasetSearchEntryStash(BaseUIDStoreStash):
+    object_type = DatasetSearchEntry
+    settings: PartitionSettings = PartitionSettings(
+        name=DatasetSearchEntry.__canonical_name__, object_type=DatasetSearchEntry
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+
+# the id of the only DatasetSearchGeneration of a node
+GENERATION_UID = UID("7d1b2ae3c0a54a5e9b1c6f0d8e4a2b91")
+
+
+@serializable()
+class DatasetSearchGeneration(SyftObject):
+    # version
+    __canonical_name__ = "DatasetSearchGeneration"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    id: UID
+    # a new one for every change of the entries
+    generation: UID
+
+
+@instrument
+@serializable()
+class DatasetSearchGenerationStash(BaseUIDStoreStash):
+    object_type = DatasetSearchGeneration
+    settings: PartitionSettings = PartitionSettings(
+        name=DatasetSearchGeneration.__canonical_name__,
+        object_type=DatasetSearchGeneration,
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+    def get_generation(self, credentials: SyftVerifyKey) -> Result[Optional[UID], str]:
+        result = self.get_by_uid(credentials=credentials, uid=GENERATION_UID)
+        if result.is_err():
+            return result
+        return Ok(None if result.ok() is None else result.ok().generation)
+
+    def bump(
+        self, credentials: SyftVerifyKey
+    ) -> Result[Tuple[Optional[UID], UID], str]:
+        """Store a new generation, returns the previous one and the new one"""
+        row = DatasetSearchGeneration(id=GENERATION_UID, generation=UID())
+        exists = self.get_by_uid(credentials=credentials, uid=GENERATION_UID)
+        if exists.is_err():
+            return exists
+        if exists.ok() is None:
+            previous = None
+            result = self.set(credentials=credentials, obj=row)
+        else:
+            previous = exists.ok().generation
+            result = self.update(credentials=credentials, obj=row)
+        return Ok((previous, row.generation)) if result.is_ok() else result
+
+
+class DatasetSearchIndex:
+    """Full text index of the Datasets of a node.
+
+    The terms of each Dataset are stored in their own partition and loaded into an
+    in memory `InvertedIndex`. Every change of the entries stores a new generation,
+    the index is loaded again when another process of the node changed it, like
+    when that process adds or removes a Dataset. The changes made through this
+    index are already in memory and keep it up to date.
+    Searches only return ids, Datasets are read with the permissions of the caller.
+    """
+
+    def __init__(self, store: DocumentStore, dataset_stash: DatasetStash) -> None:
+        self.stash = DatasetSearchEntryStash(store=store)
+        self.generation_stash = DatasetSearchGenerationStash(store=store)
+        self.dataset_stash = dataset_stash
+        self.credentials = dataset_stash.partition.root_verify_key
+        self.index = InvertedIndex()
+        # reentrant, loading adds the Datasets which aren't indexed yet
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._generation: Optional[UID] = None
+
+    def load(self) -> Result[int, str]:
+        # read first, a change while loading is picked up by the next refresh
+        generation = self.generation_stash.get_generation(self.credentials)
+        if generation.is_err():
+            return generation
+        entries = self.stash.get_all(self.credentials)
+        if entries.is_err():
+            return entries
+        datasets = self.dataset_stash.get_all(self.credentials)
+        if datasets.is_err():
+            return datasets
+
+        self.index.clear()
+        for entry in entries.ok():
+            self.index.add(entry.id, entry.terms)
+        self._generation = generation.ok()
+        # Datasets added before the index existed
+        for dataset in datasets.ok():
+            if dataset.id not in self.index.documents:
+                added = self.add(dataset)
+                if added.is_err():
+                    return added
+        self._loaded = True
+        return Ok(len(self.index))
+
+    def refresh(self) -> Result[int, str]:
+        with self._lock:
+            generation = self.generation_stash.get_generation(self.credentials)
+            if generation.is_err():
+                return generation
+            if self._loaded and generation.ok() == self._generation:
+                return Ok(len(self.index))
+            return self.load()
+
+    def add(self, dataset: Dataset) -> Result[DatasetSearchEntry, str]:
+        entry = DatasetSearchEntry(id=dataset.id, terms=dataset_terms(dataset))
+        result = self.stash.set(self.credentials, entry, ignore_duplicates=True)
+        if result.is_err():
+            return result
+        self.index.add(entry.id, entry.terms)
+        bumped = self._bump()
+        return result if bumped.is_ok() else bumped
+
+    def remove(self, uid: UID) -> Result[None, str]:
+        self.index.remove(uid)
+        result = self.stash.delete_by_uid(self.credentials, uid)
+        if result.is_err():
+            return Err(result.err())
+        bumped = self._bump()
+        return Ok(None) if bumped.is_ok() else bumped
+
+    def _bump(self) -> Result[UID, str]:
+        with self._lock:
+            bumped = self.generation_stash.bump(self.credentials)
+            if bumped.is_err():
+                return bumped
+            previous, generation = bumped.ok()
+            # only our own change since the index was up to date, it is in memory
+            if previous == self._generation:
+                self._generation = generation
+            return Ok(generation)
+
+    def search(self, query: str) -> Result[List[Tuple[UID, int]], str]:
+        refreshed = self.refresh()
+        if refreshed.is_err():
+            return refreshed
+        return Ok(self.index.search(query))
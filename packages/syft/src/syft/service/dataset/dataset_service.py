@@ -1,10 +1,13 @@
 # stdlib
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Union
 
 # relative
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.document_store import Projection
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -21,9 +24,20 @@ from ..user.user_roles import GUEST_ROLE_LEVEL
 from .dataset import Asset
 from .dataset import CreateDataset
 from .dataset import Dataset
+from .dataset import DatasetView
+from .dataset import DatasetViewProjection
+from .dataset_search import DatasetSearchIndex
+from .dataset_search import tokenize
 from .dataset_stash import DatasetStash
 
 
+def _paginate(items: Sequence, page_size: Optional[int], page_index: int) -> Sequence:
+    if page_size is None or page_size <= 0:
+        return items
+    start = page_index * page_size
+    return items[start : start + page_size]
+
+
 @instrument
 @serializable()
 class DatasetService(AbstractService):
@@ -33,6 +47,7 @@ class DatasetService(AbstractService):
     def __init__(self, store: DocumentStore) -> None:
         self.store = store
         self.stash = DatasetStash(store=store)
+        self.search_index = DatasetSearchIndex(store=store, dataset_stash=self.stash)
 
     @service_method(path="dataset.add", name="add", roles=DATA_OWNER_ROLE_LEVEL)
     def add(
@@ -51,6 +66,9 @@ class DatasetService(AbstractService):
         )
         if result.is_err():
             return SyftError(message=str(result.err()))
+        indexed = self.search_index.add(result.ok())
+        if indexed.is_err():
+            return SyftError(message=str(indexed.err()))
         return SyftSuccess(message="Dataset Added")
 
     @service_method(path="dataset.get_all", name="get_all", roles=GUEST_ROLE_LEVEL)
@@ -66,18 +84,72 @@ class DatasetService(AbstractService):
             return results
         return SyftError(message=result.err())
 
+    def _search(
+        self,
+        context: AuthedServiceContext,
+        query: str,
+        projection: Optional[Projection] = None,
+    ) -> Union[List[Union[Dataset, DatasetView]], SyftError]:
+        ranked = self.search_index.search(query)
+        if ranked.is_err():
+            return SyftError(message=ranked.err())
+        ranks = {uid: rank for rank, (uid, _) in enumerate(ranked.ok())}
+        # only the Datasets the user can read
+        result = self.stash.get_many(
+            context.credentials, uids=list(ranks), projection=projection
+        )
+        if result.is_err():
+            return SyftError(message=result.err())
+        results = sorted(result.ok(), key=lambda dataset: ranks[dataset.id])
+        for dataset in results:
+            dataset.node_uid = context.node.id
+        return results
+
     @service_method(path="dataset.search", name="search")
     def search(
         self, context: AuthedServiceContext, name: str
     ) -> Union[List[Dataset], SyftError]:
-        """Search a Dataset by name"""
-        results = self.get_all(context)
+        """Search Datasets by the words of their name, description and asset names,
+        every word of `name` matches the words it is a prefix of"""
+        if not tokenize(name):
+            return self.get_all(context)
+        return self._search(context, name)
 
-        return (
-            results
-            if isinstance(results, SyftError)
-            else [dataset for dataset in results if name in dataset.name]
-        )
+    @service_method(
+        path="dataset.get_all_views", name="get_all_views", roles=GUEST_ROLE_LEVEL
+    )
+    def get_all_views(
+        self,
+        context: AuthedServiceContext,
+        page_size: Optional[int] = None,
+        page_index: int = 0,
+    ) -> Union[List[DatasetView], SyftError]:
+        """Get a page of Dataset views, sorted by name"""
+        result = self.stash.get_all_views(context.credentials)
+        if result.is_err():
+            return SyftError(message=result.err())
+        views = sorted(result.ok(), key=lambda view: view.name)
+        for view in views:
+            view.node_uid = context.node.id
+        return _paginate(views, page_size, page_index)
+
+    @service_method(
+        path="dataset.search_views", name="search_views", roles=GUEST_ROLE_LEVEL
+    )
+    def search_views(
+        self,
+        context: AuthedServiceContext,
+        name: str,
+        page_size: Optional[int] = None,
+        page_index: int = 0,
+    ) -> Union[List[DatasetView], SyftError]:
+        """Search a page of Dataset views, like `search`"""
+        if not tokenize(name):
+            return self.get_all_views(context, page_size, page_index)
+        views = self._search(context, name, projection=DatasetViewProjection)
+        if isinstance(views, SyftError):
+            return views
+        return _paginate(views, page_size, page_index)
 
     @service_method(path="dataset.get_by_id", name="get_by_id")
     def get_by_id(
@@ -127,6 +199,9 @@ class DatasetService(AbstractService):
     def delete_dataset(self, context: AuthedServiceContext, uid: UID):
         result = self.stash.delete_by_uid(context.credentials, uid)
         if result.is_ok():
+            removed = self.search_index.remove(uid)
+            if removed.is_err():
+                return SyftError(message=removed.err())
             return result.ok()
         else:
             return SyftError(message=result.err())
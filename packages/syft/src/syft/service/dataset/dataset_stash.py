@@ -12,11 +12,14 @@ from ...store.document_store import BaseUIDStoreStash
 from ...store.document_store import DocumentStore
 from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
+from ...store.document_store import Projection
 from ...store.document_store import QueryKeys
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from .dataset import Dataset
 from .dataset import DatasetUpdate
+from .dataset import DatasetView
+from .dataset import DatasetViewProjection
 
 NamePartitionKey = PartitionKey(key="name", type_=str)
 ActionIDsPartitionKey = PartitionKey(key="action_ids", type_=List[UID])
@@ -53,3 +56,20 @@ class DatasetStash(BaseUIDStoreStash):
     ) -> Result[List[Dataset], str]:
         qks = QueryKeys(qks=[ActionIDsPartitionKey.with_obj(uid)])
         return self.query_all(credentials=credentials, qks=qks)
+
+    def get_all_views(
+        self, credentials: SyftVerifyKey
+    ) -> Result[List[DatasetView], str]:
+        return self.get_all(credentials=credentials, projection=DatasetViewProjection)
+
+    def get_many(
+        self,
+        credentials: SyftVerifyKey,
+        uids: List[UID],
+        projection: Optional[Projection] = None,
+    ) -> Result[List[Dataset], str]:
+        """Get the Datasets of `uids` which the `credentials` can read"""
+        qks = self.partition.store_query_keys(uids)
+        return self.partition.get_all_from_store(
+            credentials=credentials, qks=qks, projection=projection
+        )
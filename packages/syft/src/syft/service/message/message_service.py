@@ -94,6 +94,19 @@ class MessageService(AbstractService):
 
         return result.ok()
 
+    @service_method(path="messages.mark_all_as_delivered", name="mark_all_as_delivered")
+    def mark_all_as_delivered(
+        self, context: AuthedServiceContext
+    ) -> Union[SyftSuccess, SyftError]:
+        result = self.stash.update_all_status_for_verify_key(
+            context.credentials,
+            verify_key=context.credentials,
+            status=MessageStatus.DELIVERED,
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return SyftSuccess(message=f"{result.ok()} messages marked as delivered")
+
     @service_method(path="messages.resolve_object", name="resolve_object")
     def resolve_object(
         self, context: AuthedServiceContext, linked_obj: LinkedObject
@@ -92,19 +92,22 @@ class MessageStash(BaseUIDStoreStash):
         message.status = status
         return self.update(credentials, obj=message)
 
+    def update_all_status_for_verify_key(
+        self,
+        credentials: SyftVerifyKey,
+        verify_key: SyftVerifyKey,
+        status: MessageStatus,
+    ) -> Result[int, str]:
+        qks = QueryKeys(qks=[ToUserVerifyKeyPartitionKey.with_obj(verify_key)])
+        return self.update_where(credentials, qks=qks, changes={"status": status})
+
     def delete_all_for_verify_key(
         self, credentials: SyftVerifyKey, verify_key: SyftVerifyKey
     ) -> Result[bool, str]:
-        result = self.get_all_inbox_for_verify_key(credentials, verify_key=verify_key)
+        qks = QueryKeys(qks=[ToUserVerifyKeyPartitionKey.with_obj(verify_key)])
+        # one operation for the whole inbox
+        result = self.delete_where(credentials, qks=qks)
         # If result is an error then return the error
         if result.is_err():
             return result
-
-        # get the list of messages
-        messages = result.ok()
-
-        for message in messages:
-            result = self.delete_by_uid(credentials, uid=message.id)
-            if result.is_err():
-                return result
         return Ok(True)
@@ -199,13 +199,14 @@ def retrieve_from_db(
     code_inputs = {}
 
     if context.node.node_type == NodeType.DOMAIN:
-        for var_name, arg_id in allowed_inputs.items():
-            kwarg_value = action_service.get(
-                context=context, uid=arg_id, twin_mode=TwinMode.NONE
-            )
-            if kwarg_value.is_err():
-                return kwarg_value
-            code_inputs[var_name] = kwarg_value.ok()
+        kwarg_values = action_service.get_many(
+            context=context,
+            uids=list(allowed_inputs.values()),
+            twin_mode=TwinMode.NONE,
+        )
+        if kwarg_values.is_err():
+            return kwarg_values
+        code_inputs = dict(zip(allowed_inputs.keys(), kwarg_values.ok()))
 
     elif context.node.node_type == NodeType.ENCLAVE:
         # TODO 🟣 Temporarily added skip permission arguments for enclave
@@ -0,0 +1,302 @@
+# future
+from __future__ import annotations
+
+# stdlib
+import heapq
+import itertools
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+# third party
+from pydantic import BaseModel
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ...abstract_node import AbstractNode
+from ...client.api import SignedSyftAPICall
+from ...serde.serializable import serializable
+from ...types.uid import UID
+from ..action.action_permissions import ActionObjectPermission
+from ..action.action_permissions import ActionPermission
+from ..response import SyftError
+from ..user.user_roles import ServiceRole
+from .queue_stash import QueueItem
+from .queue_stash import QueueStash
+from .queue_stash import Status
+
+if TYPE_CHECKING:
+    # relative
+    from ...client.api import SyftAPIData
+
+# lower runs first
+DEFAULT_ROLE_PRIORITIES = {
+    ServiceRole.ADMIN: 0,
+    ServiceRole.DATA_OWNER: 1,
+    ServiceRole.DATA_SCIENTIST: 2,
+    ServiceRole.GUEST: 3,
+    ServiceRole.NONE: 4,
+}
+
+
+@serializable()
+class QueueConfig(BaseModel):
+    """
+    Queue config
+
+    Args:
+        max_concurrency: Optional[int]
+            Jobs running at the same time, defaults to the node processes
+        max_backlog: int
+            Jobs waiting to run before new ones are rejected
+        max_retries: int
+            Times a job is run again when its worker process dies
+        role_priorities: Dict[ServiceRole, int]
+            Priority of the jobs submitted by each role, lower runs first
+    """
+
+    max_concurrency: Optional[int] = None
+    max_backlog: int = 100
+    max_retries: int = 0
+    role_priorities: Dict[ServiceRole, int] = DEFAULT_ROLE_PRIORITIES
+
+    def priority_for_role(self, role: ServiceRole) -> int:
+        return self.role_priorities.get(role, max(self.role_priorities.values()))
+
+
+class QueueManager:
+    """Admits, prioritizes and runs the api calls which are sent to worker processes.
+
+    Non-blocking jobs are persisted as QueueItems in the queue stash so they can be
+    recovered when the node restarts, blocking jobs only live until their caller
+    gets the result.
+    """
+
+    def __init__(
+        self,
+        node: AbstractNode,
+        stash: QueueStash,
+        task: Callable,
+        config: Optional[QueueConfig] = None,
+    ) -> None:
+        self.node = node
+        self.stash = stash
+        self.task = task
+        self.config = config if config is not None else QueueConfig()
+        self.max_concurrency = self.config.max_concurrency or max(node.processes, 1)
+
+        self._lock = threading.RLock()
+        self._counter = itertools.count()
+        self._pending: List[Tuple[int, int, UID]] = []
+        self._running: Dict[UID, Any] = {}
+        self._items: Dict[UID, QueueItem] = {}
+        self._api_calls: Dict[UID, SignedSyftAPICall] = {}
+        self._results: Dict[UID, Any] = {}
+
+    @property
+    def credentials(self):
+        return self.node.signing_key.verify_key
+
+    @property
+    def backlog(self) -> int:
+        # cancelled jobs stay in the heap until they are popped
+        return sum(item.status is Status.CREATED for item in self._items.values())
+
+    def submit(
+        self, api_call: SignedSyftAPICall, role: ServiceRole
+    ) -> Result[QueueItem, str]:
+        # third party
+        from gevent.event import AsyncResult
+
+        blocking = api_call.message.blocking
+        with self._lock:
+            if self.backlog >= self.config.max_backlog:
+                return Err(
+                    f"The node has {self.backlog} queued jobs, "
+                    "please try again later."
+                )
+
+            item = QueueItem(
+                id=UID(),
+                node_uid=self.node.id,
+                priority=self.config.priority_for_role(role),
+                api_call=None if blocking else api_call,
+            )
+            if blocking:
+                self._results[item.id] = AsyncResult()
+            else:
+                # the caller has to be able to read the result of their job
+                read_permission = ActionObjectPermission(
+                    uid=item.id,
+                    permission=ActionPermission.READ,
+                    credentials=api_call.credentials,
+                )
+                result = self.stash.set_placeholder(
+                    self.credentials, item, add_permissions=[read_permission]
+                )
+                if isinstance(result, SyftError):
+                    return Err(result.message)
+                if result.is_err():
+                    return result
+            self._enqueue(item, api_call)
+
+        self.dispatch()
+        return Ok(item.copy(update={"api_call": None}))
+
+    def wait(self, uid: UID) -> Optional[SyftAPIData]:
+        """Block until the blocking job `uid` is done and return its result."""
+        result = self._results[uid].get()
+        with self._lock:
+            del self._results[uid]
+        return result
+
+    def cancel(self, uid: UID) -> Result[QueueItem, str]:
+        with self._lock:
+            item = self._items.get(uid, None)
+            if item is None:
+                return Err(f"No queued or running job with id: {uid}")
+
+            if item.status is Status.PROCESSING:
+                greenlet = self._running.get(uid, None)
+                if greenlet is not None:
+                    greenlet.kill(block=False)
+            self._finish(
+                item,
+                status=Status.INTERRUPTED,
+                result=SyftError(message=f"Job {uid} was cancelled"),
+            )
+        return Ok(item)
+
+    def recover(self) -> Result[int, str]:
+        """Queue the jobs left over from a previous run of the node again."""
+        unfinished = []
+        for status in [Status.PROCESSING, Status.CREATED]:
+            items = self.stash.get_by_status(self.credentials, status=status)
+            if items.is_err():
+                return items
+            unfinished += items.ok()
+
+        recovered = 0
+        for item in unfinished:
+            if item.api_call is None:
+                continue
+            with self._lock:
+                if item.status is Status.PROCESSING:
+                    # the node stopped while it was running, maybe because of the
+                    # job, so the run counts as an attempt
+                    item.attempts = max(item.attempts, 1)
+                    if item.attempts > self.config.max_retries:
+                        self._items[item.id] = item
+                        self._finish(
+                            item,
+                            status=Status.ERRORED,
+                            result=SyftError(
+                                message=f"Job {item.id} was interrupted after "
+                                f"{item.attempts} attempts"
+                            ),
+                        )
+                        continue
+                item.status = Status.CREATED
+                self._enqueue(item, item.api_call)
+            recovered += 1
+        self.dispatch()
+        return Ok(recovered)
+
+    def dispatch(self) -> None:
+        # third party
+        import gevent
+
+        with self._lock:
+            while self._pending and len(self._running) < self.max_concurrency:
+                _, _, uid = heapq.heappop(self._pending)
+                item = self._items.get(uid, None)
+                if item is None or item.status is not Status.CREATED:
+                    # cancelled while it was waiting
+                    continue
+                item.status = Status.PROCESSING
+                item.attempts += 1
+                self._save(item)
+                self._running[uid] = gevent.spawn(self._run, item)
+
+    def _enqueue(self, item: QueueItem, api_call: SignedSyftAPICall) -> None:
+        self._items[item.id] = item
+        self._api_calls[item.id] = api_call
+        heapq.heappush(self._pending, (item.priority, next(self._counter), item.id))
+
+    def _run(self, item: QueueItem) -> None:
+        # third party
+        import gevent
+
+        # relative
+        from ...node.worker_settings import WorkerSettings
+
+        api_call = self._api_calls[item.id]
+        blocking = api_call.message.blocking
+        api_data = None
+        try:
+            api_data = self.task(
+                api_call, WorkerSettings.from_node(self.node), item.id, blocking
+            )
+        except gevent.GreenletExit:
+            # cancelled, the job is already marked as interrupted
+            pass
+        finally:
+            with self._lock:
+                self._running.pop(item.id, None)
+                if item.status is Status.PROCESSING:
+                    self._complete(item, api_data)
+            self.stash.notify_result()
+            self.dispatch()
+
+    def _complete(self, item: QueueItem, api_data: Optional[SyftAPIData]) -> None:
+        if item.api_call is None:
+            done = api_data is not None
+        else:
+            # non-blocking workers write the result to the stash themselves
+            stored = self.stash.get_by_uid(self.credentials, uid=item.id)
+            done = stored.is_ok() and stored.ok() is not None and stored.ok().resolved
+
+        if done:
+            self._finish(item, status=Status.COMPLETED, api_data=api_data)
+        elif item.attempts <= self.config.max_retries:
+            # the worker process died, try again
+            item.status = Status.CREATED
+            self._save(item)
+            heapq.heappush(self._pending, (item.priority, next(self._counter), item.id))
+        else:
+            self._finish(
+                item,
+                status=Status.ERRORED,
+                result=SyftError(
+                    message=f"Job {item.id} failed after {item.attempts} attempts"
+                ),
+            )
+
+    def _finish(
+        self,
+        item: QueueItem,
+        status: Status,
+        result: Optional[Any] = None,
+        api_data: Optional[SyftAPIData] = None,
+    ) -> None:
+        item.status = status
+        if item.api_call is None:
+            if item.id in self._results:
+                self._results[item.id].set(api_data)
+        elif status is not Status.COMPLETED:
+            item.resolved = True
+            item.result = result
+            self._save(item)
+        self._items.pop(item.id, None)
+        self._api_calls.pop(item.id, None)
+
+    def _save(self, item: QueueItem) -> None:
+        if item.api_call is not None or item.resolved:
+            self.stash.update(self.credentials, item)
@@ -0,0 +1,69 @@
+# stdlib
+from typing import List
+from typing import Union
+
+# relative
+from ...serde.serializable import serializable
+from ...store.document_store import DocumentStore
+from ...types.uid import UID
+from ...util.telemetry import instrument
+from ..context import AuthedServiceContext
+from ..response import SyftError
+from ..response import SyftSuccess
+from ..service import AbstractService
+from ..service import service_method
+from ..user.user_roles import GUEST_ROLE_LEVEL
+from .queue_stash import QueueItem
+from .queue_stash import QueueStash
+from .queue_stash import Status
+
+
+@instrument
+@serializable()
+class QueueService(AbstractService):
+    store: DocumentStore
+    stash: QueueStash
+
+    def __init__(self, store: DocumentStore) -> None:
+        self.store = store
+        self.stash = QueueStash(store=store)
+
+    @service_method(path="queue.get_all", name="get_all", roles=GUEST_ROLE_LEVEL)
+    def get_all(
+        self, context: AuthedServiceContext
+    ) -> Union[List[QueueItem], SyftError]:
+        """Get the jobs you can see"""
+        result = self.stash.get_all(context.credentials)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return result.ok()
+
+    @service_method(
+        path="queue.get_all_for_status",
+        name="get_all_for_status",
+        roles=GUEST_ROLE_LEVEL,
+    )
+    def get_all_for_status(
+        self, context: AuthedServiceContext, status: Status
+    ) -> Union[List[QueueItem], SyftError]:
+        result = self.stash.get_by_status(context.credentials, status=status)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return result.ok()
+
+    @service_method(path="queue.cancel", name="cancel", roles=GUEST_ROLE_LEVEL)
+    def cancel(
+        self, context: AuthedServiceContext, uid: UID
+    ) -> Union[SyftSuccess, SyftError]:
+        """Cancel a queued or running job"""
+        # only the submitter of the job or an admin can read it
+        item = self.stash.get_by_uid(context.credentials, uid=uid)
+        if item.is_err():
+            return SyftError(message=str(item.err()))
+        if item.ok() is None:
+            return SyftError(message=f"No job with id: {uid}")
+
+        result = context.node.queue_manager.cancel(uid)
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        return SyftSuccess(message=f"Job {uid} cancelled")
@@ -1,4 +1,8 @@
 # stdlib
+from enum import Enum
+import sys
+import threading
+import time
 from typing import Any
 from typing import List
 from typing import Optional
@@ -10,16 +14,23 @@ from result import Result
 
 # relative
 from ...client.api import APIRegistry
+from ...client.api import SignedSyftAPICall
 from ...client.api import SyftAPICall
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...store.document_store import BaseStash
 from ...store.document_store import DocumentStore
+from ...store.document_store import PartitionKey
 from ...store.document_store import PartitionSettings
 from ...store.document_store import QueryKeys
 from ...store.document_store import UIDPartitionKey
+from ...types.syft_migration import migrate
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SYFT_OBJECT_VERSION_2
 from ...types.syft_object import SyftObject
+from ...types.transforms import TransformContext
+from ...types.transforms import drop
+from ...types.transforms import make_set_default
 from ...types.uid import UID
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
@@ -27,9 +38,25 @@ from ..response import SyftError
 from ..response import SyftNotReady
 from ..response import SyftSuccess
 
+# longest time a single queue wait call blocks on the node
+QUEUE_WAIT_TIMEOUT_MAX = 30.0
+
+# results written by worker processes can't notify waiters in this process
+# so the store is checked again at least this often (seconds)
+QUEUE_WAIT_POLL_INTERVAL = 0.5
+
 
 @serializable()
-class QueueItem(SyftObject):
+class Status(Enum):
+    CREATED = "created"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    ERRORED = "errored"
+    INTERRUPTED = "interrupted"
+
+
+@serializable()
+class QueueItemV1(SyftObject):
     __canonical_name__ = "QueueItem"
     __version__ = SYFT_OBJECT_VERSION_1
 
@@ -38,13 +65,35 @@ class QueueItem(SyftObject):
     result: Optional[Any]
     resolved: bool = False
 
-    def fetch(self) -> None:
+
+@serializable()
+class QueueItem(SyftObject):
+    __canonical_name__ = "QueueItem"
+    __version__ = SYFT_OBJECT_VERSION_2
+
+    id: UID
+    node_uid: UID
+    result: Optional[Any]
+    resolved: bool = False
+    status: Status = Status.CREATED
+    priority: int = 0
+    attempts: int = 0
+    # the call to run for non-blocking jobs so they can be recovered
+    api_call: Optional[SignedSyftAPICall]
+
+    __attr_searchable__ = ["status"]
+    __attr_repr_cols__ = ["status", "priority", "attempts"]
+
+    def fetch(self, timeout: Optional[float] = None) -> None:
         api = APIRegistry.api_for(node_uid=self.node_uid)
+        kwargs = {"uid": self.id}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
         call = SyftAPICall(
             node_uid=self.node_uid,
             path="queue",
             args=[],
-            kwargs={"uid": self.id},
+            kwargs=kwargs,
             blocking=True,
         )
         result = api.make_call(call)
@@ -61,6 +110,46 @@ class QueueItem(SyftObject):
             return self.result.message
         return SyftNotReady(message=f"{self.id} not ready yet.")
 
+    def wait(self, timeout: Optional[float] = None) -> Union[Any, SyftNotReady]:
+        """Block until the result is ready or `timeout` seconds have passed.
+
+        Each request is held open by the node until the worker sets the result,
+        so this doesn't busy-poll the node.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.resolved:
+            wait_timeout = QUEUE_WAIT_TIMEOUT_MAX
+            if deadline is not None:
+                wait_timeout = min(wait_timeout, deadline - time.monotonic())
+                if wait_timeout <= 0:
+                    break
+            self.fetch(timeout=wait_timeout)
+        return self.resolve
+
+
+def status_from_resolved(context: TransformContext) -> TransformContext:
+    context.output["status"] = (
+        Status.COMPLETED if context.obj.resolved else Status.CREATED
+    )
+    return context
+
+
+@migrate(QueueItemV1, QueueItem)
+def upgrade_queue_item_v1_to_v2():
+    return [
+        status_from_resolved,
+        make_set_default("priority", 0),
+        make_set_default("attempts", 0),
+    ]
+
+
+@migrate(QueueItem, QueueItemV1)
+def downgrade_queue_item_v2_to_v1():
+    return [drop(["status", "priority", "attempts", "api_call"])]
+
+
+StatusPartitionKey = PartitionKey(key="status", type_=Status)
+
 
 @instrument
 @serializable()
@@ -70,6 +159,9 @@ class QueueStash(BaseStash):
         name=QueueItem.__canonical_name__, object_type=QueueItem
     )
 
+    # shared by the stashes in this process, waiters always re-check the store
+    _result_condition = threading.Condition()
+
     def __init__(self, store: DocumentStore) -> None:
         super().__init__(store=store)
 
@@ -83,9 +175,50 @@ class QueueStash(BaseStash):
             valid = self.check_type(item, self.object_type)
             if valid.is_err():
                 return SyftError(message=valid.err())
-            return super().set(credentials, item, add_permissions)
+
+            exists = self.get_by_uid(credentials=credentials, uid=item.id)
+            if exists.is_ok() and exists.ok() is not None:
+                result = super().update(credentials, item)
+                if result.is_ok() and add_permissions is not None:
+                    self.partition.add_permissions(add_permissions)
+            else:
+                result = super().set(credentials, item, add_permissions)
+            self.notify_result()
+            return result
         return None
 
+    def notify_result(self) -> None:
+        """Wake up the waiters in this process so they check the store again."""
+        with self._result_condition:
+            self._result_condition.notify_all()
+
+    def wait_for_result(
+        self,
+        credentials: SyftVerifyKey,
+        uid: UID,
+        timeout: float,
+        poll_interval: float = QUEUE_WAIT_POLL_INTERVAL,
+    ) -> Result[Optional[QueueItem], str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            item = self.get_by_uid(credentials=credentials, uid=uid)
+            if item.is_err() or (item.ok() is not None and item.ok().resolved):
+                return item
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return item
+
+            if "gevent" in sys.modules:
+                # third party
+                import gevent
+
+                # the jobs are greenlets on this thread so let them start
+                gevent.sleep(0)
+
+            with self._result_condition:
+                self._result_condition.wait(min(remaining, poll_interval))
+
     def set_placeholder(
         self,
         credentials: SyftVerifyKey,
@@ -94,7 +227,7 @@ class QueueStash(BaseStash):
     ) -> Result[QueueItem, str]:
         # 🟡 TODO 36: Needs distributed lock
         if not item.resolved:
-            exists = self.get_by_uid(item.id)
+            exists = self.get_by_uid(credentials=credentials, uid=item.id)
             if exists.is_ok() and exists.ok() is None:
                 valid = self.check_type(item, self.object_type)
                 if valid.is_err():
@@ -109,11 +242,20 @@ class QueueStash(BaseStash):
         item = self.query_one(credentials=credentials, qks=qks)
         return item
 
+    def get_by_status(
+        self, credentials: SyftVerifyKey, status: Status
+    ) -> Result[List[QueueItem], str]:
+        qks = QueryKeys(qks=[StatusPartitionKey.with_obj(status)])
+        return self.query_all(credentials=credentials, qks=qks)
+
     def pop(
         self, credentials: SyftVerifyKey, uid: UID
     ) -> Result[Optional[QueueItem], str]:
         item = self.get_by_uid(credentials=credentials, uid=uid)
-        self.delete_by_uid(credentials=credentials, uid=uid)
+        # unresolved items are placeholders for tasks which are still running
+        if item.is_ok() and item.ok() is not None and item.ok().resolved:
+            # the caller could read it, but only the node may delete it
+            self.delete_by_uid(credentials=self.partition.root_verify_key, uid=uid)
         return item
 
     def delete_by_uid(
@@ -94,12 +94,17 @@ class LibConfig(BaseConfig):
 
     def has_permission(self, credentials: SyftVerifyKey):
         # TODO: implement user level permissions
+        return self.permission_level == CMPCRUDPermission.ALL_EXECUTE
+
+    @property
+    def permission_level(self) -> Optional[CMPCRUDPermission]:
         for p in self.permissions:
-            if p.permission_string == CMPCRUDPermission.ALL_EXECUTE.name:
-                return True
-            if p.permission_string == CMPCRUDPermission.NONE_EXECUTE.name:
-                return False
-        return False
+            if p.permission_string in (
+                CMPCRUDPermission.ALL_EXECUTE.name,
+                CMPCRUDPermission.NONE_EXECUTE.name,
+            ):
+                return CMPCRUDPermission[p.permission_string]
+        return None
 
 
 class ServiceConfigRegistry:
@@ -123,11 +128,27 @@ class ServiceConfigRegistry:
 
 class LibConfigRegistry:
     __service_config_registry__: Dict[str, ServiceConfig] = {}
+    # permission level -> configs with that level, rebuilt after a register
+    __permission_level_registry__: Dict[
+        Optional[CMPCRUDPermission], Dict[str, LibConfig]
+    ] = {}
 
     @classmethod
     def register(cls, config: ServiceConfig) -> None:
         if not cls.path_exists(config.public_path):
             cls.__service_config_registry__[config.public_path] = config
+            cls.__permission_level_registry__ = {}
+
+    @classmethod
+    def get_configs_for_permission_level(
+        cls, permission_level: Optional[CMPCRUDPermission]
+    ) -> Dict[str, LibConfig]:
+        if not cls.__permission_level_registry__:
+            registry: Dict[Optional[CMPCRUDPermission], Dict[str, LibConfig]] = {}
+            for path, lib_config in cls.__service_config_registry__.items():
+                registry.setdefault(lib_config.permission_level, {})[path] = lib_config
+            cls.__permission_level_registry__ = registry
+        return cls.__permission_level_registry__.get(permission_level, {})
 
     @classmethod
     def get_registered_configs(cls) -> Dict[str, ServiceConfig]:
@@ -144,12 +165,12 @@ class UserLibConfigRegistry:
 
     @classmethod
     def from_user(cls, credentials: SyftVerifyKey):
+        # TODO: implement user level permissions, until then every user can
+        # execute the ALL_EXECUTE paths, see LibConfig.has_permission
         return cls(
-            {
-                k: lib_config
-                for k, lib_config in LibConfigRegistry.get_registered_configs().items()
-                if lib_config.has_permission(credentials)
-            }
+            LibConfigRegistry.get_configs_for_permission_level(
+                CMPCRUDPermission.ALL_EXECUTE
+            )
         )
 
     def __contains__(self, path: str):
@@ -1,4 +1,5 @@
 # stdlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable
 from typing import List
 from typing import Optional
@@ -15,6 +16,7 @@ from pydantic.networks import EmailStr
 from ...node.credentials import SyftSigningKey
 from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
+from ...store.document_store import Projection
 from ...types.syft_object import PartialSyftObject
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
 from ...types.syft_object import SyftObject
@@ -26,6 +28,8 @@ from ...types.transforms import make_set_default
 from ...types.transforms import transform
 from ...types.transforms import validate_email
 from ...types.uid import UID
+from ...util.experimental_flags import flags
+from ...util.util import get_spawn_process_pool
 from .user_roles import ServiceRole
 
 
@@ -67,7 +71,9 @@ def hash_password(context: TransformContext) -> TransformContext:
     if context.output["password"] is not None and (
         context.output["password"] == context.output["password_verify"]
     ):
-        salt, hashed = salt_and_hash_password(context.output["password"], 12)
+        salt, hashed = salt_and_hash_password(
+            context.output["password"], flags.PASSWORD_HASH_ROUNDS
+        )
         context.output["hashed_password"] = hashed
         context.output["salt"] = salt
     return context
@@ -89,6 +95,33 @@ def salt_and_hash_password(password: str, rounds: int) -> Tuple[str, str]:
     return salt_bytes, hashed_bytes
 
 
+def get_password_hash_executor() -> Optional[ProcessPoolExecutor]:
+    return get_spawn_process_pool("password_hash", flags.PASSWORD_HASH_WORKERS)
+
+
+def salt_and_hash_passwords(passwords: List[str], rounds: int) -> List[Tuple[str, str]]:
+    """`salt_and_hash_password` for many passwords, on the password hash executor
+    when flags.PASSWORD_HASH_WORKERS is set"""
+    salts = [gensalt(rounds=rounds) for _ in passwords]
+    bytes_passes = [password.encode("UTF-8") for password in passwords]
+    executor = get_password_hash_executor()
+    if executor is None or len(passwords) <= 1:
+        hashes = list(map(hashpw, bytes_passes, salts))
+    else:
+        # the workers only import bcrypt, hashpw is sent by reference
+        chunksize = max(1, len(passwords) // (executor._max_workers * 4))
+        hashes = list(executor.map(hashpw, bytes_passes, salts, chunksize=chunksize))
+    return [
+        (salt.decode("UTF-8"), hashed.decode("UTF-8"))
+        for salt, hashed in zip(salts, hashes)
+    ]
+
+
+def password_hash_rounds(hashed_password: str) -> int:
+    # bcrypt hashes look like $2b$<rounds>$<salt and hash>
+    return int(hashed_password.split("$")[2])
+
+
 def check_pwd(password: str, hashed_password: str) -> bool:
     return checkpw(
         password=password.encode("utf-8"),
@@ -157,6 +190,11 @@ class UserView(SyftObject):
     __attr_repr_cols__ = ["name", "email"]
 
 
+UserViewProjection = Projection(
+    UserView, fields=["id", "email", "name", "role", "institution", "website"]
+)
+
+
 @transform(UserUpdate, User)
 def user_update_to_user() -> List[Callable]:
     return [
@@ -11,6 +11,7 @@ from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
 from ...types.syft_metaclass import Empty
 from ...types.uid import UID
+from ...util.experimental_flags import flags
 from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
 from ..action.action_permissions import ActionPermission
@@ -30,7 +31,9 @@ from .user import UserSearch
 from .user import UserUpdate
 from .user import UserView
 from .user import check_pwd
+from .user import password_hash_rounds
 from .user import salt_and_hash_password
+from .user import salt_and_hash_passwords
 from .user_roles import DATA_OWNER_ROLE_LEVEL
 from .user_roles import GUEST_ROLE_LEVEL
 from .user_roles import ServiceRole
@@ -77,6 +80,82 @@ class UserService(AbstractService):
         user = result.ok()
         return user.to(UserView)
 
+    @service_method(path="user.create_many", name="create_many")
+    def create_many(
+        self, context: AuthedServiceContext, user_creates: List[UserCreate]
+    ) -> Union[List[Union[UserView, SyftError]], SyftError]:
+        """Create many users, with the result of each at its index.
+
+        The passwords are hashed on the password hash processes and the users are
+        written to the store at once, or one by one when writing them at once
+        fails. A row with an error doesn't stop the others.
+        """
+        # every email is taken, also the ones of users the caller can't read
+        result = self.stash.get_all_emails(
+            credentials=self.stash.partition.root_verify_key
+        )
+        if result.is_err():
+            return SyftError(message=str(result.err()))
+        emails = result.ok()
+
+        results: List[Union[UserView, SyftError]] = [None] * len(user_creates)
+        valid = []
+        for idx, user_create in enumerate(user_creates):
+            if user_create.email in emails:
+                results[idx] = SyftError(
+                    message=f"User already exists with email: {user_create.email}"
+                )
+            elif user_create.password != user_create.password_verify:
+                results[idx] = SyftError(
+                    message=f"Passwords don't match for email: {user_create.email}"
+                )
+            else:
+                emails.add(user_create.email)
+                valid.append(idx)
+
+        hashes = salt_and_hash_passwords(
+            [user_creates[idx].password for idx in valid], flags.PASSWORD_HASH_ROUNDS
+        )
+        users = []
+        for idx, (salt, hashed) in zip(valid, hashes):
+            # the password is already hashed, the transform would hash it again
+            user = (
+                user_creates[idx]
+                .copy(update={"password": None, "password_verify": None})
+                .to(User)
+            )
+            user.salt = salt
+            user.hashed_password = hashed
+            users.append(user)
+
+        result = self.stash.set_many(
+            credentials=context.credentials,
+            objs=users,
+            add_permissions=[
+                ActionObjectPermission(
+                    uid=user.id, permission=ActionPermission.ALL_READ
+                )
+                for user in users
+            ],
+        )
+        for idx, user in zip(valid, users):
+            if result.is_err():
+                # find the rows which failed, the others are still created
+                user_result = self.stash.set(
+                    credentials=context.credentials,
+                    user=user,
+                    add_permissions=[
+                        ActionObjectPermission(
+                            uid=user.id, permission=ActionPermission.ALL_READ
+                        ),
+                    ],
+                )
+                if user_result.is_err():
+                    results[idx] = SyftError(message=str(user_result.err()))
+                    continue
+            results[idx] = user.to(UserView)
+        return results
+
     @service_method(path="user.view", name="view")
     def view(
         self, context: AuthedServiceContext, uid: UID
@@ -200,7 +279,7 @@ class UserService(AbstractService):
         # for the current values found in user obj.
         for name, value in user_update.to_dict(exclude_empty=True).items():
             if name == "password" and value:
-                salt, hashed = salt_and_hash_password(value, 12)
+                salt, hashed = salt_and_hash_password(value, flags.PASSWORD_HASH_ROUNDS)
                 user.hashed_password = hashed
                 user.salt = salt
             elif not name.startswith("__") and value is not None:
@@ -275,6 +354,11 @@ class UserService(AbstractService):
                 context.login_credentials.password,
                 user.hashed_password,
             ):
+                if password_hash_rounds(user.hashed_password) != (
+                    flags.PASSWORD_HASH_ROUNDS
+                ):
+                    # the work factor changed, the password is only known now
+                    self.rehash_password(user, context.login_credentials.password)
                 return user.to(UserPrivateKey)
 
             return SyftError(
@@ -287,6 +371,15 @@ class UserService(AbstractService):
             f"{context.login_credentials.email} with error: {result.err()}"
         )
 
+    def rehash_password(self, user: User, password: str) -> None:
+        salt, hashed = salt_and_hash_password(password, flags.PASSWORD_HASH_ROUNDS)
+        user.salt = salt
+        user.hashed_password = hashed
+        # the login goes on with the old hash if the update fails
+        self.stash.update(
+            credentials=self.admin_verify_key(), user=user, has_permission=True
+        )
+
     def admin_verify_key(self) -> Union[SyftVerifyKey, SyftError]:
         try:
             result = self.stash.admin_verify_key()
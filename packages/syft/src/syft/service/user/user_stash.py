@@ -1,6 +1,7 @@
 # stdlib
 from typing import List
 from typing import Optional
+from typing import Set
 
 # third party
 from result import Ok
@@ -21,6 +22,7 @@ from ...util.telemetry import instrument
 from ..action.action_permissions import ActionObjectPermission
 from ..response import SyftSuccess
 from .user import User
+from .user import UserViewProjection
 from .user_roles import ServiceRole
 
 # 🟡 TODO 27: it would be nice if these could be defined closer to the User
@@ -71,6 +73,13 @@ class UserStash(BaseStash):
         qks = QueryKeys(qks=[EmailPartitionKey.with_obj(email)])
         return self.query_one(credentials=credentials, qks=qks)
 
+    def get_all_emails(self, credentials: SyftVerifyKey) -> Result[Set[str], str]:
+        # only the fields of the views are read
+        result = self.get_all(credentials, projection=UserViewProjection)
+        if result.is_err():
+            return result
+        return Ok({user.email for user in result.ok()})
+
     def get_by_role(
         self, credentials: SyftVerifyKey, role: ServiceRole
     ) -> Result[Optional[User], str]:
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 # stdlib
 from typing import Any
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Type
 
@@ -34,6 +36,9 @@ class DictBackingStore(dict, KeyValueBackingStore):
                 return self._ddtype()
             raise e
 
+    def get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        return {key: dict.__getitem__(self, key) for key in keys if key in self}
+
 
 @serializable()
 class DictStorePartition(KeyValueStorePartition):
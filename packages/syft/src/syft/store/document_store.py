@@ -8,6 +8,7 @@ import typing
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -24,6 +25,7 @@ from typeguard import check_type
 # relative
 from ..node.credentials import SyftSigningKey
 from ..node.credentials import SyftVerifyKey
+from ..serde.recursive import rs_bytes2fields
 from ..serde.serializable import serializable
 from ..service.action.action_permissions import ActionObjectPermission
 from ..service.response import SyftSuccess
@@ -164,6 +166,10 @@ class QueryKey(PartitionKey):
         else:
             if isinstance(obj, pk_type):
                 pk_value = obj
+            elif isinstance(obj, SyftObject) and not hasattr(obj, pk_key):
+                # objects of another type stored in the partition don't have
+                # every key, they are stored under None like the other empty keys
+                pk_value = None
             else:
                 pk_value = getattr(obj, pk_key)
                 # object has a method for getting these types
@@ -220,7 +226,8 @@ class QueryKeys(SyftBaseModel):
         for partition_key in partition_keys.all:
             pk_key = partition_key.key
             pk_type = partition_key.type_
-            pk_value = getattr(obj, pk_key)
+            # see QueryKey.from_obj
+            pk_value = getattr(obj, pk_key, None)
             # object has a method for getting these types
             # we can't use properties because we don't seem to be able to get the
             # return types
@@ -278,11 +285,54 @@ class QueryKeys(SyftBaseModel):
             if qk.type_list:
                 # We want to search inside the list of values
                 qk_dict[qk_key] = {"$in": qk_value}
+            elif qk_key in qk_dict:
+                # like the key value stores, many values of a key match any of them
+                previous = qk_dict[qk_key]
+                values = previous["$in"] if isinstance(previous, dict) else [previous]
+                qk_dict[qk_key] = {"$in": values + [qk_value]}
             else:
                 qk_dict[qk_key] = qk_value
         return qk_dict
 
 
+class Projection:
+    """Build lightweight views of the objects of a partition.
+
+    Parameters:
+        view_type: Type[SyftObject]
+            The type of the views
+        fields: List[str]
+            Fields copied from the stored objects to their views
+        counts: Dict[str, str]
+            Fields of the views holding the number of items of a collection field
+            of the stored objects, the items themselves are never deserialized
+    """
+
+    def __init__(
+        self,
+        view_type: Type[SyftObject],
+        fields: List[str],
+        counts: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.view_type = view_type
+        self.fields = fields
+        self.counts = counts if counts is not None else {}
+
+    def from_object(self, obj: SyftObject) -> SyftObject:
+        kwargs = {field: getattr(obj, field) for field in self.fields}
+        for view_field, field in self.counts.items():
+            value = getattr(obj, field)
+            kwargs[view_field] = 0 if value is None else len(value)
+        return self.view_type(**kwargs)
+
+    def from_bytes(self, blob: bytes) -> SyftObject:
+        values = rs_bytes2fields(blob, fields=self.fields, lengths=self.counts.values())
+        kwargs = {field: values[field] for field in self.fields if field in values}
+        for view_field, field in self.counts.items():
+            kwargs[view_field] = values.get(field, 0)
+        return self.view_type(**kwargs)
+
+
 UIDPartitionKey = PartitionKey(key="id", type_=UID)
 
 
@@ -379,6 +429,21 @@ class StorePartition:
             ignore_duplicates=ignore_duplicates,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        return self._thread_safe_cbk(
+            self._set_many,
+            credentials=credentials,
+            objs=objs,
+            add_permissions=add_permissions,
+            ignore_duplicates=ignore_duplicates,
+        )
+
     def get(
         self,
         credentials: SyftVerifyKey,
@@ -391,13 +456,18 @@ class StorePartition:
         )
 
     def find_index_or_search_keys(
-        self, credentials: SyftVerifyKey, index_qks: QueryKeys, search_qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
         return self._thread_safe_cbk(
             self._find_index_or_search_keys,
             credentials,
             index_qks=index_qks,
             search_qks=search_qks,
+            projection=projection,
         )
 
     def remove_keys(
@@ -427,9 +497,14 @@ class StorePartition:
         )
 
     def get_all_from_store(
-        self, credentials: SyftVerifyKey, qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
-        return self._thread_safe_cbk(self._get_all_from_store, credentials, qks)
+        return self._thread_safe_cbk(
+            self._get_all_from_store, credentials, qks, projection=projection
+        )
 
     def delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission=False
@@ -438,10 +513,76 @@ class StorePartition:
             self._delete, credentials, qk, has_permission=has_permission
         )
 
+    def delete_where(
+        self, credentials: SyftVerifyKey, qks: QueryKeys, has_permission=False
+    ) -> Result[int, str]:
+        """Delete all the objects matching `qks` in one locked operation.
+
+        Query keys of the same key match any of their values, query keys of
+        different keys all have to match. Nothing is deleted if the credentials
+        can't write one of the objects. Returns the number of deleted objects.
+        """
+        valid = self._validate_where(qks)
+        if valid.is_err():
+            return valid
+        return self._thread_safe_cbk(
+            self._delete_where, credentials, qks, has_permission=has_permission
+        )
+
+    def update_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        changes: Dict[str, Any],
+        has_permission=False,
+    ) -> Result[int, str]:
+        """Set the `changes` fields of all the objects matching `qks`, like
+        `delete_where`. Returns the number of updated objects."""
+        valid = self._validate_where(qks, changes)
+        if valid.is_err():
+            return valid
+        return self._thread_safe_cbk(
+            self._update_where,
+            credentials,
+            qks,
+            changes,
+            has_permission=has_permission,
+        )
+
+    def _validate_where(
+        self, qks: QueryKeys, changes: Optional[Dict[str, Any]] = None
+    ) -> Result[None, str]:
+        if len(qks.all) == 0:
+            return Err("At least one query key is needed")
+        for qk in qks.all:
+            pk = qk.partition_key
+            if not (self.matches_unique_cks(pk) or self.matches_searchable_cks(pk)):
+                return Err(f"{qk} not in {type(self)} unique or searchable keys")
+        unique_keys = {pk.key for pk in self.unique_cks}
+        for key in changes or {}:
+            if key in unique_keys:
+                return Err(f"Unique key {key} can't be updated for many objects")
+        return Ok(None)
+
+    @staticmethod
+    def _check_changes(
+        objs: Iterable[SyftObject], changes: Dict[str, Any]
+    ) -> Result[None, str]:
+        # before any object is changed, the ones of memory stores are live
+        for obj in objs:
+            for key in changes:
+                if key not in obj.__fields__:
+                    return Err(f"{type(obj)} has no field {key}")
+        return Ok(None)
+
     def all(
-        self, credentials: SyftVerifyKey
+        self, credentials: SyftVerifyKey, projection: Optional[Projection] = None
     ) -> Result[List[BaseStash.object_type], str]:
-        return self._thread_safe_cbk(self._all, credentials)
+        return self._thread_safe_cbk(self._all, credentials, projection=projection)
+
+    def all_uids(self, credentials: SyftVerifyKey) -> Result[List[UID], str]:
+        """The ids of the objects readable with `credentials`, without the objects"""
+        return self._thread_safe_cbk(self._all_uids, credentials)
 
     # Potentially thread-unsafe methods.
     # CAUTION:
@@ -455,18 +596,49 @@ class StorePartition:
     ) -> Result[SyftObject, str]:
         raise NotImplementedError
 
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        raise NotImplementedError
+
     def _update(self, qk: QueryKey, obj: SyftObject) -> Result[SyftObject, str]:
         raise NotImplementedError
 
     def _get_all_from_store(
-        self, credentials: SyftVerifyKey, qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
         raise NotImplementedError
 
     def _delete(self, qk: QueryKey) -> Result[SyftSuccess, Err]:
         raise NotImplementedError
 
-    def _all(self) -> Result[List[BaseStash.object_type], str]:
+    def _delete_where(
+        self, credentials: SyftVerifyKey, qks: QueryKeys, has_permission=False
+    ) -> Result[int, str]:
+        raise NotImplementedError
+
+    def _update_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        changes: Dict[str, Any],
+        has_permission=False,
+    ) -> Result[int, str]:
+        raise NotImplementedError
+
+    def _all(
+        self, credentials: SyftVerifyKey, projection: Optional[Projection] = None
+    ) -> Result[List[BaseStash.object_type], str]:
+        raise NotImplementedError
+
+    def _all_uids(self, credentials: SyftVerifyKey) -> Result[List[UID], str]:
         raise NotImplementedError
 
 
@@ -519,10 +691,35 @@ class BaseStash:
             else Err(f"{type(obj)} does not match required type: {type_}")
         )
 
+    def migrate(self, obj: Any) -> Any:
+        """Upgrade an object stored by another version of `object_type`"""
+        object_type = getattr(type(self), "object_type", None)
+        if (
+            object_type is None
+            or not isinstance(obj, SyftObject)
+            or obj.__canonical_name__ != object_type.__canonical_name__
+            or obj.__version__ == object_type.__version__
+        ):
+            return obj
+        return obj.migrate_to(object_type.__version__)
+
+    def migrate_result(self, result: Result) -> Result:
+        if result.is_err():
+            return result
+        try:
+            value = result.ok()
+            if isinstance(value, list):
+                return Ok([self.migrate(obj) for obj in value])
+            return Ok(self.migrate(value))
+        except Exception as e:
+            return Err(f"Failed to migrate {type(self).__name__} objects: {e}")
+
     def get_all(
-        self, credentials: SyftVerifyKey
+        self, credentials: SyftVerifyKey, projection: Optional[Projection] = None
     ) -> Result[List[BaseStash.object_type], str]:
-        return self.partition.all(credentials)
+        return self.migrate_result(
+            self.partition.all(credentials, projection=projection)
+        )
 
     def __len__(self) -> int:
         return len(self.partition)
@@ -541,8 +738,25 @@ class BaseStash:
             add_permissions=add_permissions,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[BaseStash.object_type],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[BaseStash.object_type], str]:
+        return self.partition.set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+        )
+
     def query_all(
-        self, credentials: SyftVerifyKey, qks: Union[QueryKey, QueryKeys]
+        self,
+        credentials: SyftVerifyKey,
+        qks: Union[QueryKey, QueryKeys],
+        projection: Optional[Projection] = None,
     ) -> Result[List[BaseStash.object_type], str]:
         if isinstance(qks, QueryKey):
             qks = QueryKeys(qks=qks)
@@ -564,8 +778,15 @@ class BaseStash:
         index_qks = QueryKeys(qks=unique_keys)
         search_qks = QueryKeys(qks=searchable_keys)
 
-        return self.partition.find_index_or_search_keys(
-            credentials=credentials, index_qks=index_qks, search_qks=search_qks
+        # only pass a projection when there is one, partitions may not take it
+        kwargs = {} if projection is None else {"projection": projection}
+        return self.migrate_result(
+            self.partition.find_index_or_search_keys(
+                credentials=credentials,
+                index_qks=index_qks,
+                search_qks=search_qks,
+                **kwargs,
+            )
         )
 
     def query_all_kwargs(
@@ -617,6 +838,34 @@ class BaseStash:
             credentials=credentials, qk=qk, has_permission=has_permission
         )
 
+    def delete_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: Union[QueryKey, QueryKeys],
+        has_permission=False,
+    ) -> Result[int, str]:
+        if isinstance(qks, QueryKey):
+            qks = QueryKeys(qks=qks)
+        return self.partition.delete_where(
+            credentials=credentials, qks=qks, has_permission=has_permission
+        )
+
+    def update_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: Union[QueryKey, QueryKeys],
+        changes: Dict[str, Any],
+        has_permission=False,
+    ) -> Result[int, str]:
+        if isinstance(qks, QueryKey):
+            qks = QueryKeys(qks=qks)
+        return self.partition.update_where(
+            credentials=credentials,
+            qks=qks,
+            changes=changes,
+            has_permission=has_permission,
+        )
+
     def update(
         self,
         credentials: SyftVerifyKey,
@@ -5,9 +5,11 @@ from __future__ import annotations
 from collections import defaultdict
 from enum import Enum
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 
 # third party
 from result import Err
@@ -29,12 +31,24 @@ from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from .document_store import BaseStash
 from .document_store import PartitionSettings
+from .document_store import Projection
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
 
 
+def _query_key_values(qks: QueryKeys) -> List[Tuple[str, Any]]:
+    return [(qk.key, qk.value) for qk in qks.all]
+
+
+def _search_value(qk: QueryKey) -> Any:
+    if qk.type_list:
+        # lists are a single key, the objects coerced to strings
+        return " ".join([str(obj) for obj in qk.value])
+    return qk.value
+
+
 @serializable()
 class UniqueKeyCheck(Enum):
     EMPTY = 0
@@ -87,6 +101,27 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        """Get the values of the `keys` which are in the store"""
+        return {key: self[key] for key in keys if key in self}
+
+    def project_many(self, keys: List[Any], projection: Projection) -> Dict[Any, Any]:
+        """Get views of the values of the `keys` which are in the store"""
+        return {
+            key: projection.from_object(value)
+            for key, value in self.get_many(keys).items()
+        }
+
+    def set_many(self, items: Dict[Any, Any]) -> None:
+        """Set the values of many keys, backends can write them in one go"""
+        for key, value in items.items():
+            self[key] = value
+
+    def delete_many(self, keys: List[Any]) -> None:
+        """Delete many keys, backends can delete them in one go"""
+        for key in keys:
+            del self[key]
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -187,7 +222,9 @@ class KeyValueStorePartition(StorePartition):
             if not store_key_exists and ck_check == UniqueKeyCheck.EMPTY:
                 # attempt to claim it for writing
                 ownership_result = self.take_ownership(uid=uid, credentials=credentials)
-                can_write = True if ownership_result.is_ok() else False
+                # the permissions of a deleted object are kept, so its writers can
+                # store it again
+                can_write = can_write or ownership_result.is_ok()
             elif not ignore_duplicates:
                 return Err(f"Duplication Key Error: {obj}")
             else:
@@ -218,6 +255,85 @@ class KeyValueStorePartition(StorePartition):
         except Exception as e:
             return Err(f"Failed to write obj {obj}. {e}")
 
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        """Set many new objects, reading and writing each key column only once.
+
+        Unlike calling `_set` for each object, which rewrites the unique and
+        searchable key columns every time, this is linear in the number of objects.
+        Nothing is written if an object is a duplicate and duplicates aren't ignored.
+        """
+        try:
+            for obj in objs:
+                if obj.id is None:
+                    obj.id = UID()
+            uids = [self.settings.store_key.with_obj(obj).value for obj in objs]
+            owned = self.permissions.get_many(uids)
+            unique_cols = {pk.key: self.unique_keys[pk.key] for pk in self.unique_cks}
+            search_cols = {
+                pk.key: self.searchable_keys[pk.key] for pk in self.searchable_cks
+            }
+
+            # check every object first, the columns of memory stores are live
+            added = []
+            new_objs = []
+            batch_cols: Dict[str, Set[Any]] = {pk.key: set() for pk in self.unique_cks}
+            for uid, obj in zip(uids, objs):
+                unique_query_keys = self.settings.unique_keys.with_obj(obj).all
+                if uid in owned or any(
+                    qk.value in unique_cols[qk.key] or qk.value in batch_cols[qk.key]
+                    for qk in unique_query_keys
+                ):
+                    if not ignore_duplicates:
+                        return Err(f"Duplication Key Error: {obj}")
+                else:
+                    for qk in unique_query_keys:
+                        batch_cols[qk.key].add(qk.value)
+                    new_objs.append((uid, obj, unique_query_keys))
+                added.append(obj)
+
+            data = {}
+            permissions = {}
+            for uid, obj, unique_query_keys in new_objs:
+                for qk in unique_query_keys:
+                    unique_cols[qk.key][qk.value] = uid
+                for qk in self.settings.searchable_keys.with_obj(obj).all:
+                    pk_value = qk.value
+                    if qk.type_list:
+                        # coerce the list of objects to strings for a single key
+                        pk_value = " ".join([str(obj) for obj in pk_value])
+                    search_cols[qk.key][pk_value].append(uid)
+
+                data[uid] = obj
+                permissions[uid] = {
+                    permission.permission_string
+                    for permission in [
+                        ActionObjectOWNER(uid=uid, credentials=credentials),
+                        ActionObjectWRITE(uid=uid, credentials=credentials),
+                        ActionObjectREAD(uid=uid, credentials=credentials),
+                        ActionObjectEXECUTE(uid=uid, credentials=credentials),
+                    ]
+                }
+                if add_permissions is not None:
+                    # each object only gets the permissions for its own uid
+                    permissions[uid].update(
+                        [x.permission_string for x in add_permissions if x.uid == uid]
+                    )
+
+            if data:
+                self.permissions.set_many(permissions)
+                self.data.set_many(data)
+                self.unique_keys.set_many(unique_cols)
+                self.searchable_keys.set_many(search_cols)
+            return Ok(added)
+        except Exception as e:
+            return Err(f"Failed to write {len(objs)} objs. {e}")
+
     def take_ownership(
         self, uid: UID, credentials: SyftVerifyKey
     ) -> Result[SyftSuccess, str]:
@@ -283,14 +399,29 @@ class KeyValueStorePartition(StorePartition):
         return False
 
     def _all(
-        self, credentials: SyftVerifyKey
+        self, credentials: SyftVerifyKey, projection: Optional[Projection] = None
     ) -> Result[List[BaseStash.object_type], str]:
+        if projection is not None:
+            qks = self.store_query_keys(self.data.keys())
+            return self._get_all_from_store(credentials, qks, projection=projection)
         # this checks permissions
         res = [self._get(uid, credentials) for uid in self.data.keys()]
         return Ok([x.ok() for x in res if x.is_ok()])
 
+    def _all_uids(self, credentials: SyftVerifyKey) -> Result[List[UID], str]:
+        return Ok(
+            [
+                uid
+                for uid in self.data.keys()
+                if self.has_permission(
+                    ActionObjectREAD(uid=uid, credentials=credentials)
+                )
+            ]
+        )
+
     def _remove_keys(
         self,
+        uid: UID,
         unique_query_keys: QueryKeys,
         searchable_query_keys: QueryKeys,
     ) -> None:
@@ -299,15 +430,45 @@ class KeyValueStorePartition(StorePartition):
             pk_key, pk_value = qk.key, qk.value
             ck_col = self.unique_keys[pk_key]
             ck_col.pop(pk_value, None)
+            self.unique_keys[pk_key] = ck_col
 
         sqks = searchable_query_keys.all
         for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
+            pk_key, pk_value = qk.key, _search_value(qk)
             ck_col = self.searchable_keys[pk_key]
-            ck_col.pop(pk_value, None)
+            # other objects can have the same value
+            uids = [key for key in ck_col.get(pk_value, []) if key != uid]
+            if uids:
+                ck_col[pk_value] = uids
+            else:
+                ck_col.pop(pk_value, None)
+            self.searchable_keys[pk_key] = ck_col
+
+    def _remove_all_keys_for(self, uid: UID) -> None:
+        """Remove `uid` from every key column, for objects which were changed in
+        place so their previous keys can't be read from them anymore"""
+        for pk in self.unique_cks:
+            ck_col = self.unique_keys[pk.key]
+            for pk_value in [value for value, key in ck_col.items() if key == uid]:
+                ck_col.pop(pk_value)
+            self.unique_keys[pk.key] = ck_col
+
+        for pk in self.searchable_cks:
+            ck_col = self.searchable_keys[pk.key]
+            for pk_value in list(ck_col.keys()):
+                uids = [key for key in ck_col[pk_value] if key != uid]
+                if uids:
+                    ck_col[pk_value] = uids
+                else:
+                    ck_col.pop(pk_value)
+            self.searchable_keys[pk.key] = ck_col
 
     def _find_index_or_search_keys(
-        self, credentials: SyftVerifyKey, index_qks: QueryKeys, search_qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
         ids: Optional[Set] = None
         errors = []
@@ -339,7 +500,9 @@ class KeyValueStorePartition(StorePartition):
             return Ok([])
 
         qks: QueryKeys = self.store_query_keys(ids)
-        return self._get_all_from_store(credentials=credentials, qks=qks)
+        return self._get_all_from_store(
+            credentials=credentials, qks=qks, projection=projection
+        )
 
     def remove_keys(
         self,
@@ -373,6 +536,8 @@ class KeyValueStorePartition(StorePartition):
                 ActionObjectWRITE(uid=qk.value, credentials=credentials)
             ):
                 _original_obj = self.data[qk.value]
+                # the stored object itself was changed and passed back
+                changed_in_place = _original_obj is obj
                 _original_unique_keys = self.settings.unique_keys.with_obj(
                     _original_obj
                 )
@@ -380,29 +545,49 @@ class KeyValueStorePartition(StorePartition):
                     _original_obj
                 )
 
-                # remove old keys
-                self._remove_keys(
-                    unique_query_keys=_original_unique_keys,
-                    searchable_query_keys=_original_searchable_keys,
-                )
-
-                # update the object with new data
-                for key, value in obj.to_dict(exclude_none=True).items():
-                    if key == "id":
-                        # protected field
-                        continue
-                    setattr(_original_obj, key, value)
-
-                # update data and keys
-                self._set_data_and_keys(
-                    store_query_key=qk,
-                    unique_query_keys=self.settings.unique_keys.with_obj(_original_obj),
-                    searchable_query_keys=self.settings.searchable_keys.with_obj(
-                        _original_obj
-                    ),
-                    # has been updated
-                    obj=_original_obj,
+                if _original_obj.__version__ != obj.__version__:
+                    # a migrated object replaces the one of the old version
+                    _original_obj = obj
+                else:
+                    # update the object with new data
+                    for key, value in obj.to_dict(exclude_none=True).items():
+                        if key == "id":
+                            # protected field
+                            continue
+                        setattr(_original_obj, key, value)
+
+                unique_query_keys = self.settings.unique_keys.with_obj(_original_obj)
+                searchable_query_keys = self.settings.searchable_keys.with_obj(
+                    _original_obj
                 )
+                if (
+                    not changed_in_place
+                    and _query_key_values(unique_query_keys)
+                    == _query_key_values(_original_unique_keys)
+                    and _query_key_values(searchable_query_keys)
+                    == _query_key_values(_original_searchable_keys)
+                ):
+                    # the key columns are the same, only the object is written
+                    self.data[qk.value] = _original_obj
+                else:
+                    # remove old keys
+                    if changed_in_place:
+                        self._remove_all_keys_for(qk.value)
+                    else:
+                        self._remove_keys(
+                            uid=qk.value,
+                            unique_query_keys=_original_unique_keys,
+                            searchable_query_keys=_original_searchable_keys,
+                        )
+
+                    # update data and keys
+                    self._set_data_and_keys(
+                        store_query_key=qk,
+                        unique_query_keys=unique_query_keys,
+                        searchable_query_keys=searchable_query_keys,
+                        # has been updated
+                        obj=_original_obj,
+                    )
 
                 # 🟡 TODO 28: Add locking in this transaction
 
@@ -421,16 +606,29 @@ class KeyValueStorePartition(StorePartition):
             return Err(f"Failed to update obj {obj} with error: {e}")
 
     def _get_all_from_store(
-        self, credentials: SyftVerifyKey, qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
-        matches = []
-        for qk in qks.all:
-            if qk.value in self.data:
+        if projection is not None:
+            uids = [
+                qk.value
+                for qk in qks.all
                 if self.has_permission(
                     ActionObjectREAD(uid=qk.value, credentials=credentials)
-                ):
-                    matches.append(self.data[qk.value])
-        return Ok(matches)
+                )
+            ]
+            return Ok(list(self.data.project_many(uids, projection).values()))
+
+        uids = [
+            qk.value
+            for qk in qks.all
+            if self.has_permission(
+                ActionObjectREAD(uid=qk.value, credentials=credentials)
+            )
+        ]
+        return Ok(list(self.data.get_many(uids).values()))
 
     def create(self, obj: SyftObject) -> Result[SyftObject, str]:
         pass
@@ -453,16 +651,189 @@ class KeyValueStorePartition(StorePartition):
         except Exception as e:
             return Err(f"Failed to delete with query key {qk} with error: {e}")
 
+    def _find_uids_where(self, qks: QueryKeys) -> Result[Set[UID], str]:
+        # the same key matches any of its values, different keys all of theirs
+        qks_by_key: Dict[str, List[QueryKey]] = defaultdict(list)
+        for qk in qks.all:
+            qks_by_key[qk.key].append(qk)
+
+        uids: Optional[Set[UID]] = None
+        for key, key_qks in qks_by_key.items():
+            partition_key = key_qks[0].partition_key
+            if partition_key == self.settings.store_key:
+                # missing objects are skipped when they are read
+                matches = {qk.value for qk in key_qks}
+            elif self.matches_unique_cks(partition_key):
+                ck_col = self.unique_keys[key]
+                matches = {ck_col[qk.value] for qk in key_qks if qk.value in ck_col}
+            elif any(qk.type_list for qk in key_qks):
+                matches = set()
+                for qk in key_qks:
+                    result = self._find_keys_search(QueryKeys(qks=[qk]))
+                    if result.is_err():
+                        return result
+                    matches.update(result.ok())
+            else:
+                ck_col = self.searchable_keys[key]
+                matches = set()
+                for qk in key_qks:
+                    matches.update(ck_col.get(qk.value, []))
+            uids = matches if uids is None else uids & matches
+        return Ok(uids or set())
+
+    def _denied_permissions(
+        self, credentials: SyftVerifyKey, uids: List[UID], permission: ActionPermission
+    ) -> List[UID]:
+        # the permissions of all the objects are read at once
+        if self.root_verify_key.verify == credentials.verify:
+            return []
+        stored = self.permissions.get_many(uids)
+        return [
+            uid
+            for uid in uids
+            if ActionObjectPermission(uid, permission, credentials).permission_string
+            not in stored.get(uid, set())
+        ]
+
+    def _delete_where(
+        self, credentials: SyftVerifyKey, qks: QueryKeys, has_permission=False
+    ) -> Result[int, str]:
+        try:
+            uids = self._find_uids_where(qks)
+            if uids.is_err():
+                return uids
+            objs = self.data.get_many(list(uids.ok()))
+            if not has_permission:
+                denied = self._denied_permissions(
+                    credentials, list(objs), ActionPermission.WRITE
+                )
+                if denied:
+                    return Err(
+                        f"Failed to delete with {qks}, you have no permission for "
+                        f"{len(denied)} objects"
+                    )
+
+            self._update_keys_many(removed=objs)
+            self.data.delete_many(list(objs))
+            return Ok(len(objs))
+        except Exception as e:
+            return Err(f"Failed to delete with {qks} with error: {e}")
+
+    def _update_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        changes: Dict[str, Any],
+        has_permission=False,
+    ) -> Result[int, str]:
+        try:
+            uids = self._find_uids_where(qks)
+            if uids.is_err():
+                return uids
+            objs = self.data.get_many(list(uids.ok()))
+            if not has_permission:
+                denied = self._denied_permissions(
+                    credentials, list(objs), ActionPermission.WRITE
+                )
+                if denied:
+                    return Err(
+                        f"Failed to update with {qks}, you have no permission for "
+                        f"{len(denied)} objects"
+                    )
+
+            checked = self._check_changes(objs.values(), changes)
+            if checked.is_err():
+                return checked
+
+            # only the searchable keys can change, the unique ones are rejected
+            pks = [pk for pk in self.searchable_cks if pk.key in changes]
+            removed = {
+                uid: QueryKeys(qks=[pk.with_obj(obj) for pk in pks])
+                for uid, obj in objs.items()
+            }
+            for obj in objs.values():
+                for key, value in changes.items():
+                    setattr(obj, key, value)
+            added = {
+                uid: QueryKeys(qks=[pk.with_obj(obj) for pk in pks])
+                for uid, obj in objs.items()
+            }
+
+            self._update_search_keys_many(removed, added)
+            self.data.set_many(objs)
+            return Ok(len(objs))
+        except Exception as e:
+            return Err(f"Failed to update with {qks} with error: {e}")
+
+    def _update_keys_many(self, removed: Dict[UID, SyftObject]) -> None:
+        # each key column is read and written once for all the objects
+        for pk in self.unique_cks:
+            ck_col = self.unique_keys[pk.key]
+            for obj in removed.values():
+                ck_col.pop(pk.with_obj(obj).value, None)
+            self.unique_keys[pk.key] = ck_col
+
+        self._update_search_keys_many(
+            removed={
+                uid: QueryKeys(qks=[pk.with_obj(obj) for pk in self.searchable_cks])
+                for uid, obj in removed.items()
+            }
+        )
+
+    def _update_search_keys_many(
+        self,
+        removed: Dict[UID, QueryKeys],
+        added: Optional[Dict[UID, QueryKeys]] = None,
+    ) -> None:
+        removals: Dict[str, Dict[Any, Set[UID]]] = defaultdict(lambda: defaultdict(set))
+        for uid, qks in removed.items():
+            for qk in qks.all:
+                removals[qk.key][_search_value(qk)].add(uid)
+        additions: Dict[str, Dict[Any, List[UID]]] = defaultdict(
+            lambda: defaultdict(list)
+        )
+        for uid, qks in (added or {}).items():
+            for qk in qks.all:
+                additions[qk.key][_search_value(qk)].append(uid)
+
+        for key in set(removals) | set(additions):
+            ck_col = self.searchable_keys[key]
+            for pk_value, uids in removals[key].items():
+                # other objects can have the same value
+                remaining = [uid for uid in ck_col.get(pk_value, []) if uid not in uids]
+                if remaining:
+                    ck_col[pk_value] = remaining
+                else:
+                    ck_col.pop(pk_value, None)
+            for pk_value, uids in additions[key].items():
+                ck_col[pk_value] = ck_col.get(pk_value, []) + uids
+            self.searchable_keys[key] = ck_col
+
     def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
         for _unique_ck in self.unique_cks:
             qk = _unique_ck.with_obj(obj)
-            self.unique_keys[qk.key].pop(qk.value, None)
+            # written back, the column of a sqlite store is a copy
+            ck_col = self.unique_keys[qk.key]
+            ck_col.pop(qk.value, None)
+            self.unique_keys[qk.key] = ck_col
         return Ok(SyftSuccess(message="Deleted"))
 
     def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
+        uid = self.settings.store_key.with_obj(obj).value
         for _search_ck in self.searchable_cks:
             qk = _search_ck.with_obj(obj)
-            self.searchable_keys[qk.key].pop(qk.value, None)
+            pk_value = qk.value
+            if qk.type_list:
+                # lists are a single key, like in _set_data_and_keys
+                pk_value = " ".join([str(obj) for obj in pk_value])
+            # other objects can have the same value
+            ck_col = self.searchable_keys[qk.key]
+            uids = [key for key in ck_col.get(pk_value, []) if key != uid]
+            if uids:
+                ck_col[pk_value] = uids
+            else:
+                ck_col.pop(pk_value, None)
+            self.searchable_keys[qk.key] = ck_col
         return Ok(SyftSuccess(message="Deleted"))
 
     def _get_keys_index(self, qks: QueryKeys) -> Result[Set[Any], str]:
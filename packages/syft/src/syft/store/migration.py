@@ -0,0 +1,189 @@
+# stdlib
+import threading
+from typing import List
+from typing import Optional
+
+# third party
+from result import Err
+from result import Ok
+from result import Result
+
+# relative
+from ..node.credentials import SyftVerifyKey
+from ..serde.serializable import serializable
+from ..types.syft_object import SYFT_OBJECT_VERSION_1
+from ..types.syft_object import SyftObject
+from ..types.uid import UID
+from ..util.telemetry import instrument
+from .document_store import BaseStash
+from .document_store import BaseUIDStoreStash
+from .document_store import DocumentStore
+from .document_store import PartitionKey
+from .document_store import PartitionSettings
+
+MIGRATION_CHUNK_SIZE = 1000
+
+
+@serializable()
+class MigrationProgress(SyftObject):
+    __canonical_name__ = "MigrationProgress"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    partition: str
+    version: int
+    # objects are migrated in the order of their ids
+    last_uid: Optional[UID]
+    migrated: int = 0
+    completed: bool = False
+
+    __attr_unique__ = ["partition"]
+    __attr_repr_cols__ = ["partition", "version", "migrated", "completed"]
+
+
+PartitionNamePartitionKey = PartitionKey(key="partition", type_=str)
+
+
+@instrument
+@serializable()
+class MigrationProgressStash(BaseUIDStoreStash):
+    object_type = MigrationProgress
+    settings: PartitionSettings = PartitionSettings(
+        name=MigrationProgress.__canonical_name__, object_type=MigrationProgress
+    )
+
+    def __init__(self, store: DocumentStore) -> None:
+        super().__init__(store=store)
+
+    def get_by_partition(
+        self, credentials: SyftVerifyKey, partition: str
+    ) -> Result[Optional[MigrationProgress], str]:
+        qks = PartitionNamePartitionKey.with_obj(partition)
+        return self.query_one(credentials=credentials, qks=qks)
+
+    def save(
+        self, credentials: SyftVerifyKey, progress: MigrationProgress
+    ) -> Result[MigrationProgress, str]:
+        exists = self.get_by_uid(credentials=credentials, uid=progress.id)
+        if exists.is_err():
+            return exists
+        if exists.ok() is None:
+            return self.set(credentials=credentials, obj=progress)
+        return self.update(credentials=credentials, obj=progress)
+
+
+class PartitionMigrator:
+    """Rewrite the objects of a stash stored by other versions of its object type.
+
+    Stashes upgrade old objects every time they are read, this writes the
+    upgraded objects back in chunks of `chunk_size`. The progress is saved after
+    each chunk, so a migration which was interrupted resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        stash: BaseStash,
+        progress_stash: MigrationProgressStash,
+        chunk_size: int = MIGRATION_CHUNK_SIZE,
+    ) -> None:
+        self.stash = stash
+        self.progress_stash = progress_stash
+        self.chunk_size = chunk_size
+        self.credentials = stash.partition.root_verify_key
+
+    @property
+    def partition_name(self) -> str:
+        return self.stash.partition.settings.name
+
+    def load_progress(self) -> Result[MigrationProgress, str]:
+        version = self.stash.object_type.__version__
+        progress = self.progress_stash.get_by_partition(
+            credentials=self.credentials, partition=self.partition_name
+        )
+        if progress.is_err():
+            return progress
+        progress = progress.ok()
+        if progress is None:
+            return Ok(
+                MigrationProgress(
+                    partition=self.partition_name, version=version, last_uid=None
+                )
+            )
+        if progress.version != version:
+            # a new migration, to another version
+            progress.version = version
+            progress.last_uid = None
+            progress.migrated = 0
+            progress.completed = False
+        return Ok(progress)
+
+    def pending(self, progress: MigrationProgress) -> Result[List[UID], str]:
+        uids = self.stash.partition.all_uids(self.credentials)
+        if uids.is_err():
+            return uids
+        pending = sorted(uids.ok())
+        if progress.last_uid is not None:
+            pending = [uid for uid in pending if progress.last_uid < uid]
+        return Ok(pending)
+
+    def load_chunk(self, uids: List[UID]) -> Result[List[SyftObject], str]:
+        qks = self.stash.partition.store_query_keys(uids)
+        objs = self.stash.partition.get_all_from_store(self.credentials, qks)
+        if objs.is_err():
+            return objs
+        return Ok(sorted(objs.ok(), key=lambda obj: obj.id))
+
+    def migrate_chunk(self, objs: List[SyftObject]) -> Result[int, str]:
+        migrated = 0
+        for obj in objs:
+            try:
+                upgraded = self.stash.migrate(obj)
+            except Exception as e:
+                return Err(f"Failed to migrate {obj.id}: {e}")
+            if upgraded is obj:
+                continue
+            qk = self.stash.partition.store_query_key(upgraded)
+            res = self.stash.partition.update(
+                credentials=self.credentials,
+                qk=qk,
+                obj=upgraded,
+                has_permission=True,
+            )
+            if res.is_err():
+                return res
+            migrated += 1
+        return Ok(migrated)
+
+    def run(self) -> Result[MigrationProgress, str]:
+        progress = self.load_progress()
+        if progress.is_err() or progress.ok().completed:
+            return progress
+        progress = progress.ok()
+
+        pending = self.pending(progress)
+        if pending.is_err():
+            return pending
+        pending = pending.ok()
+
+        # only the ids are read at once, the objects are loaded chunk by chunk
+        for start in range(0, len(pending), self.chunk_size):
+            chunk = pending[start : start + self.chunk_size]
+            objs = self.load_chunk(chunk)
+            if objs.is_err():
+                return objs
+            migrated = self.migrate_chunk(objs.ok())
+            if migrated.is_err():
+                return migrated
+            progress.migrated += migrated.ok()
+            progress.last_uid = chunk[-1]
+            saved = self.progress_stash.save(self.credentials, progress)
+            if saved.is_err():
+                return saved
+
+        progress.completed = True
+        return self.progress_stash.save(self.credentials, progress)
+
+    def start(self) -> threading.Thread:
+        """Run the migration in a background thread"""
+        thread = threading.Thread(target=self.run, daemon=True)
+        thread.start()
+        return thread
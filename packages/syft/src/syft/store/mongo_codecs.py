@@ -7,6 +7,7 @@ from bson.codec_options import TypeRegistry
 
 # relative
 from ..serde.deserialize import _deserialize
+from ..serde.recursive import trusted_deserialize
 from ..serde.serialize import _serialize
 
 
@@ -19,7 +20,9 @@ class SyftMongoBinaryDecoder(TypeDecoder):
 
     def transform_bson(self, value):
         if value.subtype == USER_DEFINED_SUBTYPE:
-            return _deserialize(value, from_bytes=True)
+            # documents are only written by the node
+            with trusted_deserialize():
+                return _deserialize(value, from_bytes=True)
         return value
 
 
@@ -7,8 +7,10 @@ from typing import Type
 
 # third party
 from pymongo import ASCENDING
+from pymongo import UpdateOne
 from pymongo import WriteConcern
 from pymongo.collection import Collection as MongoCollection
+from pymongo.errors import BulkWriteError
 from pymongo.errors import DuplicateKeyError
 from result import Err
 from result import Ok
@@ -29,7 +31,9 @@ from ..types.syft_object import SyftObjectRegistry
 from ..types.transforms import TransformContext
 from ..types.transforms import transform
 from ..types.transforms import transform_method
+from ..types.uid import UID
 from .document_store import DocumentStore
+from .document_store import Projection
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
@@ -243,6 +247,35 @@ class MongoStorePartition(StorePartition):
         else:
             return Err(f"No permission to write object with id {obj.id}")
 
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: List[SyftObject],
+        add_permissions: Optional[List[ActionObjectPermission]] = None,
+        ignore_duplicates: bool = False,
+    ) -> Result[List[SyftObject], str]:
+        for obj in objs:
+            write_permission = ActionObjectWRITE(uid=obj.id, credentials=credentials)
+            if not self.has_permission(write_permission):
+                return Err(f"No permission to write object with id {obj.id}")
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        storage_objs = [obj.to(self.storage_type) for obj in objs]
+        try:
+            # unordered, so the objects after a duplicate are still inserted
+            collection.insert_many(storage_objs, ordered=False)
+        except BulkWriteError as e:
+            duplicates = all(
+                error["code"] == 11000 for error in e.details["writeErrors"]
+            )
+            if not (ignore_duplicates and duplicates):
+                return Err(f"Failed to write {len(objs)} objs: {e}")
+        return Ok(objs)
+
     def _update(
         self,
         credentials: SyftVerifyKey,
@@ -294,14 +327,23 @@ class MongoStorePartition(StorePartition):
             return Err(f"Failed to update obj {obj}, you have no permission")
 
     def _find_index_or_search_keys(
-        self, credentials: SyftVerifyKey, index_qks: QueryKeys, search_qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
         # TODO: pass index as hint to find method
         qks = QueryKeys(qks=(index_qks.all + search_qks.all))
-        return self._get_all_from_store(credentials=credentials, qks=qks)
+        return self._get_all_from_store(
+            credentials=credentials, qks=qks, projection=projection
+        )
 
     def _get_all_from_store(
-        self, credentials: SyftVerifyKey, qks: QueryKeys
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        projection: Optional[Projection] = None,
     ) -> Result[List[SyftObject], str]:
         collection_status = self.collection
         if collection_status.is_err():
@@ -319,7 +361,7 @@ class MongoStorePartition(StorePartition):
         res = []
         for s in syft_objs:
             if self.has_permission(ActionObjectREAD(uid=s.id, credentials=credentials)):
-                res.append(s)
+                res.append(s if projection is None else projection.from_object(s))
         return Ok(res)
 
     def _delete(
@@ -341,13 +383,87 @@ class MongoStorePartition(StorePartition):
 
         return Err(f"Failed to delete object with qk: {qk}")
 
+    def _delete_where(
+        self, credentials: SyftVerifyKey, qks: QueryKeys, has_permission=False
+    ) -> Result[int, str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        # permissions aren't stored for mongo partitions yet, see has_permission
+        try:
+            result = collection.delete_many(filter=qks.as_dict_mongo)
+        except Exception as e:
+            return Err(f"Failed to delete with {qks}. Error: {e}")
+        return Ok(result.deleted_count)
+
+    def _update_where(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        changes: Dict[str, Any],
+        has_permission=False,
+    ) -> Result[int, str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        objs = self._get_all_from_store(credentials, qks)
+        if objs.is_err():
+            return objs
+
+        checked = self._check_changes(objs.ok(), changes)
+        if checked.is_err():
+            return checked
+
+        # the fields are also encoded in __obj__, so the documents are replaced
+        updates = []
+        for obj in objs.ok():
+            for key, value in changes.items():
+                setattr(obj, key, value)
+            updates.append(
+                UpdateOne({"_id": obj.id}, {"$set": obj.to(self.storage_type)})
+            )
+        if not updates:
+            return Ok(0)
+        try:
+            collection.bulk_write(updates, ordered=False)
+        except Exception as e:
+            return Err(f"Failed to update with {qks}. Error: {e}")
+        return Ok(len(updates))
+
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         # TODO: implement
         return True
 
-    def _all(self, credentials: SyftVerifyKey):
+    def add_permissions(self, permissions: List[ActionObjectPermission]) -> None:
+        # TODO: update permissions
+        pass
+
+    def _all(self, credentials: SyftVerifyKey, projection: Optional[Projection] = None):
         qks = QueryKeys(qks=())
-        return self._get_all_from_store(credentials=credentials, qks=qks)
+        return self._get_all_from_store(
+            credentials=credentials, qks=qks, projection=projection
+        )
+
+    def _all_uids(self, credentials: SyftVerifyKey) -> Result[List[UID], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection = collection_status.ok()
+
+        uids = [doc["_id"] for doc in collection.find(filter={}, projection=["_id"])]
+        return Ok(
+            [
+                uid
+                for uid in uids
+                if self.has_permission(
+                    ActionObjectREAD(uid=uid, credentials=credentials)
+                )
+            ]
+        )
 
     def __len__(self):
         collection_status = self.collection
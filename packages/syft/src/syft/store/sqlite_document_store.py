@@ -22,11 +22,13 @@ from typing_extensions import Self
 
 # relative
 from ..serde.deserialize import _deserialize
+from ..serde.recursive import trusted_deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
 from ..types.uid import UID
 from .document_store import DocumentStore
 from .document_store import PartitionSettings
+from .document_store import Projection
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
@@ -34,6 +36,8 @@ from .kv_document_store import KeyValueStorePartition
 from .locks import FileLockingConfig
 from .locks import LockingConfig
 
+SQLITE_MAX_VARIABLES = 999
+
 
 def _repr_debug_(value: Any) -> str:
     if hasattr(value, "_repr_debug_"):
@@ -162,6 +166,34 @@ class SQLiteBackingStore(KeyValueBackingStore):
         if res.is_err():
             raise ValueError(res.err())
 
+    def _set_many(self, items: Dict[UID, Any]) -> None:
+        # one statement and one commit for all the rows
+        insert_sql = f"insert or replace into {self.table_name} (uid, repr, value) VALUES (?, ?, ?)"  # nosec
+        rows = [
+            (str(key), _repr_debug_(value), _serialize(value, to_bytes=True))
+            for key, value in items.items()
+        ]
+        try:
+            self.cur.executemany(insert_sql, rows)
+        except BaseException as e:
+            self.db.rollback()
+            raise ValueError(str(e))
+        self.db.commit()
+
+    def _delete_many(self, keys: List[UID]) -> None:
+        str_keys = [str(key) for key in keys]
+        try:
+            # stay under the default SQLITE_MAX_VARIABLE_NUMBER, in one transaction
+            for i in range(0, len(str_keys), SQLITE_MAX_VARIABLES):
+                chunk = str_keys[i : i + SQLITE_MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                delete_sql = f"delete from {self.table_name} where uid in ({placeholders})"  # nosec
+                self.cur.execute(delete_sql, chunk)
+        except BaseException as e:
+            self.db.rollback()
+            raise ValueError(str(e))
+        self.db.commit()
+
     def _get(self, key: UID) -> Any:
         select_sql = f"select * from {self.table_name} where uid = ?"  # nosec
         res = self._execute(select_sql, [str(key)])
@@ -173,7 +205,33 @@ class SQLiteBackingStore(KeyValueBackingStore):
         if row is None or len(row) == 0:
             raise KeyError(f"{key} not in {type(self)}")
         data = row[2]
-        return _deserialize(data, from_bytes=True)
+        with trusted_deserialize():
+            return _deserialize(data, from_bytes=True)
+
+    def _get_many(
+        self, keys: List[UID], projection: Optional[Projection] = None
+    ) -> Dict[UID, Any]:
+        values = {}
+        uids = {str(key): key for key in keys}
+        str_keys = list(uids.keys())
+        # stay under the default SQLITE_MAX_VARIABLE_NUMBER
+        for i in range(0, len(str_keys), SQLITE_MAX_VARIABLES):
+            chunk = str_keys[i : i + SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            select_sql = f"select uid, value from {self.table_name} where uid in ({placeholders})"  # nosec
+            res = self._execute(select_sql, chunk)
+            if res.is_err():
+                raise KeyError(f"Query {select_sql} failed")
+            rows = res.ok().fetchall()
+            if projection is not None:
+                # only the fields of the views are deserialized
+                for uid, data in rows:
+                    values[uids[uid]] = projection.from_bytes(data)
+                continue
+            with trusted_deserialize():
+                for uid, data in rows:
+                    values[uids[uid]] = _deserialize(data, from_bytes=True)
+        return values
 
     def _exists(self, key: UID) -> bool:
         select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
@@ -203,9 +261,10 @@ class SQLiteBackingStore(KeyValueBackingStore):
         if rows is None:
             return {}
 
-        for row in rows:
-            keys.append(UID(row[0]))
-            data.append(_deserialize(row[2], from_bytes=True))
+        with trusted_deserialize():
+            for row in rows:
+                keys.append(UID(row[0]))
+                data.append(_deserialize(row[2], from_bytes=True))
         return dict(zip(keys, data))
 
     def _get_all_keys(self) -> Any:
@@ -293,6 +352,18 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def __iter__(self) -> Any:
         return iter(self.keys())
 
+    def get_many(self, keys: List[Any]) -> Dict[Any, Any]:
+        return self._get_many(keys)
+
+    def project_many(self, keys: List[Any], projection: Projection) -> Dict[Any, Any]:
+        return self._get_many(keys, projection=projection)
+
+    def set_many(self, items: Dict[Any, Any]) -> None:
+        self._set_many(items)
+
+    def delete_many(self, keys: List[Any]) -> None:
+        self._delete_many(keys)
+
     def __del__(self):
         try:
             self._close()
@@ -0,0 +1,43 @@
+# stdlib
+from typing import Callable
+from typing import Type
+
+# relative
+from .syft_object import SyftMigrationRegistry
+from .syft_object import SyftObject
+from .transforms import generate_transform_wrapper
+
+
+def migrate(klass_from: Type[SyftObject], klass_to: Type[SyftObject]) -> Callable:
+    """Register the transforms returned by the decorated function as the migration
+    between two consecutive versions of the same canonical class.
+
+    .. code-block:: python
+
+        @migrate(MessageV1, Message)
+        def upgrade_message_v1_to_v2():
+            return [make_set_default("priority", 0)]
+    """
+    if klass_from.__canonical_name__ != klass_to.__canonical_name__:
+        raise ValueError(
+            "Migrations are between versions of the same class, not "
+            f"{klass_from.__canonical_name__} and {klass_to.__canonical_name__}"
+        )
+
+    def decorator(function: Callable) -> Callable:
+        transforms = function()
+
+        wrapper = generate_transform_wrapper(
+            klass_from=klass_from, klass_to=klass_to, transforms=transforms
+        )
+
+        SyftMigrationRegistry.register_transform(
+            klass_type_str=klass_from.__canonical_name__,
+            version_from=klass_from.__version__,
+            version_to=klass_to.__version__,
+            method=wrapper,
+        )
+
+        return function
+
+    return decorator
@@ -57,6 +57,8 @@ class Context(SyftBaseObject):
 class SyftObjectRegistry:
     __object_version_registry__: Dict[str, Type["SyftObject"]] = {}
     __object_transform_registry__: Dict[str, Callable] = {}
+    # (type_from, type_to) -> transform, resolved through the mro once
+    __object_transform_cache__: Dict[Tuple[type, type], Callable] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -99,10 +101,24 @@ class SyftObjectRegistry:
     ) -> None:
         mapping_string = f"{klass_from}_{version_from}_x_{klass_to}_{version_to}"
         cls.__object_transform_registry__[mapping_string] = method
+        # a new transform can take precedence over a cached one of a base class
+        cls.__object_transform_cache__.clear()
 
     @classmethod
     def get_transform(
         cls, type_from: Type["SyftObject"], type_to: Type["SyftObject"]
+    ) -> Callable:
+        try:
+            return cls.__object_transform_cache__[(type_from, type_to)]
+        except KeyError:
+            pass
+        transform = cls._find_transform(type_from, type_to)
+        cls.__object_transform_cache__[(type_from, type_to)] = transform
+        return transform
+
+    @classmethod
+    def _find_transform(
+        cls, type_from: Type["SyftObject"], type_to: Type["SyftObject"]
     ) -> Callable:
         for type_from_mro in type_from.mro():
             if issubclass(type_from_mro, SyftObject):
@@ -130,6 +146,47 @@ class SyftObjectRegistry:
         )
 
 
+class SyftMigrationRegistry:
+    # canonical name -> "{version_from}x{version_to}" -> migration
+    __migration_transform_registry__: Dict[str, Dict[str, Callable]] = {}
+
+    @classmethod
+    def register_transform(
+        cls,
+        klass_type_str: str,
+        version_from: int,
+        version_to: int,
+        method: Callable,
+    ) -> None:
+        if abs(version_to - version_from) != 1:
+            raise ValueError(
+                f"Migrations of {klass_type_str} must be between consecutive versions,"
+                f" not {version_from} and {version_to}"
+            )
+        mapping_string = f"{version_from}x{version_to}"
+        migrations = cls.__migration_transform_registry__.setdefault(klass_type_str, {})
+        migrations[mapping_string] = method
+
+    @classmethod
+    def get_migration_path(
+        cls, klass_type_str: str, version_from: int, version_to: int
+    ) -> List[Callable]:
+        """The migrations between consecutive versions from `version_from` to
+        `version_to`, which upgrade or downgrade an object one version at a time"""
+        migrations = cls.__migration_transform_registry__.get(klass_type_str, {})
+        step = 1 if version_to > version_from else -1
+        path = []
+        for version in range(version_from, version_to, step):
+            mapping_string = f"{version}x{version + step}"
+            if mapping_string not in migrations:
+                raise ValueError(
+                    f"No migration found for {klass_type_str} from version {version}"
+                    f" to {version + step}"
+                )
+            path.append(migrations[mapping_string])
+        return path
+
+
 print_type_cache = defaultdict(list)
 
 
@@ -161,6 +218,9 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
 
     __attr_repr_cols__: List[str] = []  # show these in html repr collections
 
+    # skip validation when deserializing data the node wrote, e.g. store rows
+    __trusted_construct__: bool = True
+
     def to_mongo(self) -> Dict[str, Any]:
         warnings.warn(
             "`SyftObject.to_mongo` is deprecated and will be removed in a future version",
@@ -289,6 +349,17 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry):
                 upgraded = upgraded._upgrade_version(latest=latest)
             return upgraded
 
+    def migrate_to(
+        self, version: int, context: Optional[Context] = None
+    ) -> "SyftObject":
+        """Upgrade or downgrade to `version` through the registered migrations"""
+        obj = self
+        for migration in SyftMigrationRegistry.get_migration_path(
+            self.__canonical_name__, self.__version__, version
+        ):
+            obj = migration(obj, context)
+        return obj
+
     # transform from one supported type to another
     def to(self, projection: type, context: Optional[Context] = None) -> Any:
         # 🟡 TODO 19: Could we do an mro style inheritence conversion? Risky?
@@ -4,6 +4,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -35,14 +36,13 @@ class TransformContext(Context):
 
     @staticmethod
     def from_context(obj: Any, context: Optional[Context] = None) -> Self:
-        t_context = TransformContext()
-        t_context.obj = obj
-        t_context.output = dict(obj)
-        if hasattr(context, "credentials"):
-            t_context.credentials = context.credentials
-        if hasattr(context, "node"):
-            t_context.node = context.node
-        return t_context
+        # built on every transform, the fields need no validation
+        return TransformContext.construct(
+            obj=obj,
+            output=dict(obj),
+            credentials=getattr(context, "credentials", None),
+            node=getattr(context, "node", None),
+        )
 
     def to_node_context(self) -> NodeServiceContext:
         if self.credentials:
@@ -62,12 +62,21 @@ def geteitherattr(
     return getattr(_self, key, default)
 
 
+# the dict operations of the transforms below, which are fused by
+# generate_transform_wrapper into one step
+SET_DEFAULT = "set_default"
+DROP = "drop"
+RENAME = "rename"
+KEEP = "keep"
+
+
 def make_set_default(key: str, value: Any) -> Callable:
     def set_default(context: TransformContext) -> TransformContext:
         if not geteitherattr(context.obj, context.output, key, None):
             context.output[key] = value
         return context
 
+    set_default.__transform_op__ = (SET_DEFAULT, (key, value))
     return set_default
 
 
@@ -78,6 +87,7 @@ def drop(list_keys: List[str]) -> Callable:
                 del context.output[key]
         return context
 
+    drop_keys.__transform_op__ = (DROP, tuple(list_keys))
     return drop_keys
 
 
@@ -88,6 +98,7 @@ def rename(old_key: str, new_key: str) -> Callable:
             del context.output[old_key]
         return context
 
+    drop_keys.__transform_op__ = (RENAME, (old_key, new_key))
     return drop_keys
 
 
@@ -105,9 +116,59 @@ def keep(list_keys: List[str]) -> Callable:
 
         return context
 
+    drop_keys.__transform_op__ = (KEEP, tuple(list_keys))
     return drop_keys
 
 
+def fuse_dict_ops(ops: List[Tuple[str, Any]]) -> Callable:
+    """Run consecutive keep / drop / rename / set_default transforms as one step"""
+    ops = tuple(ops)
+
+    def fused(context: TransformContext) -> TransformContext:
+        obj = context.obj
+        output = context.output
+        for op, args in ops:
+            if op == KEEP:
+                output = {
+                    key: output[key] if key in output else getattr(obj, key, None)
+                    for key in args
+                }
+            elif op == DROP:
+                for key in args:
+                    output.pop(key, None)
+            elif op == RENAME:
+                old_key, new_key = args
+                output[new_key] = (
+                    output[old_key] if old_key in output else getattr(obj, old_key)
+                )
+                output.pop(old_key, None)
+            else:
+                key, value = args
+                if not (output[key] if key in output else getattr(obj, key, None)):
+                    output[key] = value
+        context.output = output
+        return context
+
+    return fused
+
+
+def compile_transforms(transforms: List[Callable]) -> List[Callable]:
+    compiled: List[Callable] = []
+    ops: List[Tuple[str, Any]] = []
+    for transform in transforms:
+        op = getattr(transform, "__transform_op__", None)
+        if op is not None:
+            ops.append(op)
+            continue
+        if ops:
+            compiled.append(fuse_dict_ops(ops))
+            ops = []
+        compiled.append(transform)
+    if ops:
+        compiled.append(fuse_dict_ops(ops))
+    return compiled
+
+
 def convert_types(list_keys: List[str], types: Union[type, List[type]]) -> Callable:
     if not isinstance(types, list):
         types = [types] * len(list_keys)
@@ -161,12 +222,15 @@ def add_node_uid_for_key(key: str) -> Callable:
 def generate_transform_wrapper(
     klass_from: type, klass_to: type, transforms: List[Callable]
 ) -> Callable:
+    # compiled once, the registry then caches the wrapper per pair of classes
+    compiled = compile_transforms(transforms)
+
     def wrapper(
         self: klass_from,
         context: Optional[Union[TransformContext, NodeServiceContext]] = None,
     ) -> klass_to:
         t_context = TransformContext.from_context(obj=self, context=context)
-        for transform in transforms:
+        for transform in compiled:
             t_context = transform(t_context)
         return klass_to(**t_context.output)
 
@@ -1,4 +1,5 @@
 # stdlib
+import os
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -9,6 +10,7 @@ import uuid
 from uuid import UUID as uuid_type
 
 # relative
+from ..serde.recursive import recursive_serde_register_fixed_layout
 from ..serde.serializable import serializable
 from ..util.logger import critical
 from ..util.logger import traceback_and_raise
@@ -30,14 +32,19 @@ class UID:
 
     There is no other way in Syft to create an ID for any object.
 
+    UIDs are the keys of the stores and permissions, so they only keep the 16
+    bytes of the uuid, its hash and, once it is needed, its hex string.
+
     """
 
     __serde_overrides__: Dict[str, Sequence[Callable]] = {
         "value": (lambda x: x.bytes, lambda x: uuid.UUID(bytes=bytes(x)))
     }
 
-    __slots__ = "value"
-    value: uuid_type
+    __slots__ = ("_bytes", "_hash", "_hex")
+    _bytes: bytes
+    _hash: int
+    _hex: Optional[str]
 
     def __init__(self, value: Optional[Union[uuid_type, str, bytes]] = None):
         """Initializes the internal id using the uuid package.
@@ -59,18 +66,35 @@ class UID:
             from syft.types.uid import UID
             my_id = UID()
         """
-        # checks to make sure you've set a proto_type
-        super().__init__()
-
         # if value is not set - create a novel and unique ID.
-        if isinstance(value, str):
-            value = uuid.UUID(value)
-        elif isinstance(value, bytes):
-            value = uuid.UUID(bytes=value)
+        if value is None:
+            self._set_bytes(_uuid4_bytes())
         elif isinstance(value, UID):
-            value = value.value
+            self._bytes = value._bytes
+            self._hash = value._hash
+            self._hex = value._hex
+        else:
+            self.value = value
+
+    def _set_bytes(self, value: bytes) -> None:
+        self._bytes = value
+        # the hash of the 128-bit int, like hash(uuid.UUID)
+        self._hash = hash(int.from_bytes(value, "big"))
+        self._hex = None
+
+    @property
+    def value(self) -> uuid_type:
+        return uuid.UUID(bytes=self._bytes)
 
-        self.value = uuid.uuid4() if value is None else value
+    @value.setter
+    def value(self, value: Union[uuid_type, str, bytes]) -> None:
+        if isinstance(value, str):
+            value = uuid.UUID(value)
+        if isinstance(value, uuid.UUID):
+            value = value.bytes
+        elif len(value) != 16:
+            raise ValueError("bytes is not a 16-char string")
+        self._set_bytes(bytes(value))
 
     @staticmethod
     def from_string(value: str) -> "UID":
@@ -106,7 +130,7 @@ class UID:
             detected by the ObjectStore class in Syft.
         """
 
-        return self.value.int
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         """Checks to see if two UIDs are the same using the internal object
@@ -121,12 +145,17 @@ class UID:
         :rtype: bool
         """
 
+        if isinstance(other, UID):
+            return self._bytes == other._bytes
         try:
             return self.value == other.value
         except Exception:
             return False
 
     def __lt__(self, other: Any) -> bool:
+        if isinstance(other, UID):
+            # big endian bytes order like the 128-bit ints
+            return self._bytes < other._bytes
         try:
             return self.value < other.value
         except Exception:
@@ -142,7 +171,9 @@ class UID:
 
     @property
     def no_dash(self) -> str:
-        return str(self.value).replace("-", "")
+        if self._hex is None:
+            self._hex = self._bytes.hex()
+        return self._hex
 
     def __repr__(self) -> str:
         """Returns a human-readable version of the ID
@@ -201,6 +232,20 @@ class UID:
             )
 
 
+def _uuid4_bytes() -> bytes:
+    # same as uuid.uuid4().bytes without creating the UUID
+    value = bytearray(os.urandom(16))
+    value[6] = (value[6] & 0x0F) | 0x40
+    value[8] = (value[8] & 0x3F) | 0x80
+    return bytes(value)
+
+
+# the message of a UID only differs in its 16 bytes
+recursive_serde_register_fixed_layout(
+    UID, payload_size=16, to_payload=lambda uid: uid._bytes, from_payload=UID
+)
+
+
 @serializable(attrs=["syft_history_hash"])
 class LineageID(UID):
     """Extended UID containing a history hash as well, which is used for comparisons."""
@@ -219,7 +264,7 @@ class LineageID(UID):
         super().__init__(value)
 
         if syft_history_hash is None:
-            syft_history_hash = hash(self.value)
+            syft_history_hash = self._hash
         self.syft_history_hash = syft_history_hash
 
     @property
@@ -227,7 +272,7 @@ class LineageID(UID):
         return UID(self.value)
 
     def __hash__(self):
-        return hash((self.syft_history_hash, self.value))
+        return hash((self.syft_history_hash, self._hash))
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, LineageID):
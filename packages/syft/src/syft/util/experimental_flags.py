@@ -16,10 +16,64 @@ class ApacheArrowCompression(Enum):
     NONE = 0
 
 
+class DataFrameCodec(Enum):
+    # fast path, lossless and supports zstd / lz4 compression of the buffers
+    ARROW_IPC = "arrow_ipc"
+    # archival format, timestamps are coerced to microseconds
+    PARQUET = "parquet"
+
+
 class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        self._DATAFRAME_CODEC = DataFrameCodec(
+            os.getenv("SYFT_DATAFRAME_CODEC", DataFrameCodec.ARROW_IPC.value)
+        )
+        # threads which run the mock side of twin computations, 0 runs them inline
+        self._TWIN_EXECUTOR_WORKERS = int(os.getenv("SYFT_TWIN_EXECUTOR_WORKERS", 4))
+        # reuse the results of identical actions, assumes the actions are pure
+        self._ACTION_RESULT_CACHE = str_to_bool(
+            os.getenv("SYFT_ACTION_RESULT_CACHE", "False")
+        )
+        # results kept at most, the least recently used ones are dropped first
+        self._ACTION_RESULT_CACHE_SIZE = int(
+            os.getenv("SYFT_ACTION_RESULT_CACHE_SIZE", 1024)
+        )
+        # seconds a cached result is reused before the action runs again
+        self._ACTION_RESULT_CACHE_TTL = float(
+            os.getenv("SYFT_ACTION_RESULT_CACHE_TTL", 3600)
+        )
+        # rows per chunk when executing on large arrays and frames, 0 disables it
+        self._CHUNKED_EXECUTION_ROWS = int(os.getenv("SYFT_CHUNKED_EXECUTION_ROWS", 0))
+        # processes which run ops on the segments of on disk data, 0 runs them inline
+        self._SEGMENT_WORKERS = int(os.getenv("SYFT_SEGMENT_WORKERS", 0))
+        # processes which run the partitions of user code, 0 runs them inline
+        self._PARTITION_WORKERS = int(os.getenv("SYFT_PARTITION_WORKERS", 0))
+        # arrays this large go to worker processes through shared memory, 0 disables
+        self._SHARED_MEMORY_MIN_BYTES = int(
+            os.getenv("SYFT_SHARED_MEMORY_MIN_BYTES", 2**20)
+        )
+        # HTTP bodies this large are compressed when both sides support it, 0 disables
+        self._HTTP_COMPRESSION_MIN_BYTES = int(
+            os.getenv("SYFT_HTTP_COMPRESSION_MIN_BYTES", 2**14)
+        )
+        # largest size a compressed HTTP body may claim, larger ones are refused
+        self._MAX_DECOMPRESSED_BYTES = int(
+            os.getenv("SYFT_MAX_DECOMPRESSED_BYTES", 2**30)
+        )
+        # bcrypt work factor of new password hashes, older ones are redone on login
+        self._PASSWORD_HASH_ROUNDS = int(os.getenv("SYFT_PASSWORD_HASH_ROUNDS", 12))
+        # processes which hash the passwords of bulk user creation, 0 hashes inline
+        self._PASSWORD_HASH_WORKERS = int(os.getenv("SYFT_PASSWORD_HASH_WORKERS", 4))
+        # seconds a client of a peer is reused before its route is looked up again
+        self._PEER_CLIENT_TTL = float(os.getenv("SYFT_PEER_CLIENT_TTL", 300))
+        # clients of peers kept at most, the least recently used are dropped first
+        self._PEER_CLIENT_POOL_SIZE = int(os.getenv("SYFT_PEER_CLIENT_POOL_SIZE", 128))
+        # threads which call the peers of a fan out
+        self._PEER_FAN_OUT_WORKERS = int(os.getenv("SYFT_PEER_FAN_OUT_WORKERS", 16))
+        # seconds each peer of a fan out has to answer
+        self._PEER_CALL_TIMEOUT = float(os.getenv("SYFT_PEER_CALL_TIMEOUT", 30))
 
     @property
     def APACHE_ARROW_TENSOR_SERDE(self) -> bool:
@@ -41,6 +95,142 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def DATAFRAME_CODEC(self) -> DataFrameCodec:
+        return self._DATAFRAME_CODEC
+
+    @DATAFRAME_CODEC.setter
+    def DATAFRAME_CODEC(self, value: DataFrameCodec) -> None:
+        self._DATAFRAME_CODEC = value
+
+    @property
+    def TWIN_EXECUTOR_WORKERS(self) -> int:
+        return self._TWIN_EXECUTOR_WORKERS
+
+    @TWIN_EXECUTOR_WORKERS.setter
+    def TWIN_EXECUTOR_WORKERS(self, value: int) -> None:
+        self._TWIN_EXECUTOR_WORKERS = value
+
+    @property
+    def ACTION_RESULT_CACHE(self) -> bool:
+        return self._ACTION_RESULT_CACHE
+
+    @ACTION_RESULT_CACHE.setter
+    def ACTION_RESULT_CACHE(self, value: bool) -> None:
+        self._ACTION_RESULT_CACHE = value
+
+    @property
+    def ACTION_RESULT_CACHE_SIZE(self) -> int:
+        return self._ACTION_RESULT_CACHE_SIZE
+
+    @ACTION_RESULT_CACHE_SIZE.setter
+    def ACTION_RESULT_CACHE_SIZE(self, value: int) -> None:
+        self._ACTION_RESULT_CACHE_SIZE = value
+
+    @property
+    def ACTION_RESULT_CACHE_TTL(self) -> float:
+        return self._ACTION_RESULT_CACHE_TTL
+
+    @ACTION_RESULT_CACHE_TTL.setter
+    def ACTION_RESULT_CACHE_TTL(self, value: float) -> None:
+        self._ACTION_RESULT_CACHE_TTL = value
+
+    @property
+    def CHUNKED_EXECUTION_ROWS(self) -> int:
+        return self._CHUNKED_EXECUTION_ROWS
+
+    @CHUNKED_EXECUTION_ROWS.setter
+    def CHUNKED_EXECUTION_ROWS(self, value: int) -> None:
+        self._CHUNKED_EXECUTION_ROWS = value
+
+    @property
+    def SEGMENT_WORKERS(self) -> int:
+        return self._SEGMENT_WORKERS
+
+    @SEGMENT_WORKERS.setter
+    def SEGMENT_WORKERS(self, value: int) -> None:
+        self._SEGMENT_WORKERS = value
+
+    @property
+    def PARTITION_WORKERS(self) -> int:
+        return self._PARTITION_WORKERS
+
+    @PARTITION_WORKERS.setter
+    def PARTITION_WORKERS(self, value: int) -> None:
+        self._PARTITION_WORKERS = value
+
+    @property
+    def SHARED_MEMORY_MIN_BYTES(self) -> int:
+        return self._SHARED_MEMORY_MIN_BYTES
+
+    @SHARED_MEMORY_MIN_BYTES.setter
+    def SHARED_MEMORY_MIN_BYTES(self, value: int) -> None:
+        self._SHARED_MEMORY_MIN_BYTES = value
+
+    @property
+    def HTTP_COMPRESSION_MIN_BYTES(self) -> int:
+        return self._HTTP_COMPRESSION_MIN_BYTES
+
+    @HTTP_COMPRESSION_MIN_BYTES.setter
+    def HTTP_COMPRESSION_MIN_BYTES(self, value: int) -> None:
+        self._HTTP_COMPRESSION_MIN_BYTES = value
+
+    @property
+    def MAX_DECOMPRESSED_BYTES(self) -> int:
+        return self._MAX_DECOMPRESSED_BYTES
+
+    @MAX_DECOMPRESSED_BYTES.setter
+    def MAX_DECOMPRESSED_BYTES(self, value: int) -> None:
+        self._MAX_DECOMPRESSED_BYTES = value
+
+    @property
+    def PASSWORD_HASH_ROUNDS(self) -> int:
+        return self._PASSWORD_HASH_ROUNDS
+
+    @PASSWORD_HASH_ROUNDS.setter
+    def PASSWORD_HASH_ROUNDS(self, value: int) -> None:
+        self._PASSWORD_HASH_ROUNDS = value
+
+    @property
+    def PASSWORD_HASH_WORKERS(self) -> int:
+        return self._PASSWORD_HASH_WORKERS
+
+    @PASSWORD_HASH_WORKERS.setter
+    def PASSWORD_HASH_WORKERS(self, value: int) -> None:
+        self._PASSWORD_HASH_WORKERS = value
+
+    @property
+    def PEER_CLIENT_TTL(self) -> float:
+        return self._PEER_CLIENT_TTL
+
+    @PEER_CLIENT_TTL.setter
+    def PEER_CLIENT_TTL(self, value: float) -> None:
+        self._PEER_CLIENT_TTL = value
+
+    @property
+    def PEER_CLIENT_POOL_SIZE(self) -> int:
+        return self._PEER_CLIENT_POOL_SIZE
+
+    @PEER_CLIENT_POOL_SIZE.setter
+    def PEER_CLIENT_POOL_SIZE(self, value: int) -> None:
+        self._PEER_CLIENT_POOL_SIZE = value
+
+    @property
+    def PEER_FAN_OUT_WORKERS(self) -> int:
+        return self._PEER_FAN_OUT_WORKERS
+
+    @PEER_FAN_OUT_WORKERS.setter
+    def PEER_FAN_OUT_WORKERS(self, value: int) -> None:
+        self._PEER_FAN_OUT_WORKERS = value
+
+    @property
+    def PEER_CALL_TIMEOUT(self) -> float:
+        return self._PEER_CALL_TIMEOUT
+
+    @PEER_CALL_TIMEOUT.setter
+    def PEER_CALL_TIMEOUT(self, value: float) -> None:
+        self._PEER_CALL_TIMEOUT = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
@@ -1,5 +1,14 @@
-# third party
-from jax.config import config
+# stdlib
+import os
+import sys
 
-# this ensures that jax_enable_x64 is set before we import and use it
-config.update("jax_enable_x64", True)
+# jax reads JAX_ENABLE_X64 when it is first imported, which lets us enable x64
+# without paying for importing jax on `import syft`
+os.environ["JAX_ENABLE_X64"] = "True"
+
+if "jax" in sys.modules:
+    # third party
+    from jax.config import config
+
+    # jax was imported before syft so the flag has to be updated directly
+    config.update("jax_enable_x64", True)
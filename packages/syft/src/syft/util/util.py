@@ -20,6 +20,7 @@ import re
 from secrets import randbelow
 import socket
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import Any
@@ -238,6 +239,30 @@ def list_sum(*inp_lst: List[Any]) -> Any:
     return s
 
 
+_spawn_process_pools: Dict[str, ProcessPoolExecutor] = {}
+_spawn_process_pools_lock = threading.Lock()
+
+
+def get_spawn_process_pool(name: str, workers: int) -> Optional[ProcessPoolExecutor]:
+    """The process pool called `name` with `workers` processes, None if `workers`
+    is 0. It is made again when `workers` changes, so it can be sized from a flag.
+    """
+    if workers <= 0:
+        return None
+
+    with _spawn_process_pools_lock:
+        pool = _spawn_process_pools.get(name, None)
+        if pool is None or pool._max_workers != workers:  # type: ignore
+            if pool is not None:
+                pool.shutdown(wait=False)
+            # the node runs threads, forking it could copy a held lock
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _spawn_process_pools[name] = pool
+    return pool
+
+
 @contextmanager
 def concurrency_override(count: int = 1) -> Iterator:
     # this only effects local code so its best to use in unit tests
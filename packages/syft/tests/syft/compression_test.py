@@ -0,0 +1,76 @@
+# stdlib
+import struct
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.compression import accept_encoding_header
+from syft.serde.compression import choose_encoding
+from syft.serde.compression import compress_body
+from syft.serde.compression import decompress_body
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture
+def min_bytes():
+    prev_min_bytes = flags.HTTP_COMPRESSION_MIN_BYTES
+    flags.HTTP_COMPRESSION_MIN_BYTES = 1024
+    yield
+    flags.HTTP_COMPRESSION_MIN_BYTES = prev_min_bytes
+
+
+def test_choose_encoding():
+    assert choose_encoding(accept_encoding_header()) == "syft-zstd"
+    assert choose_encoding("gzip, syft-lz4") == "syft-lz4"
+    assert choose_encoding("syft-zstd;q=0, syft-lz4;q=0.5") == "syft-lz4"
+    assert choose_encoding("gzip, deflate") is None
+    assert choose_encoding(None) is None
+
+
+@pytest.mark.parametrize("encoding", ["syft-zstd", "syft-lz4"])
+def test_compress_body(min_bytes, encoding):
+    body = sy.serialize([f"patient-{i}" for i in range(1000)], to_bytes=True)
+
+    compressed, applied = compress_body(body, encoding)
+    assert applied == encoding
+    assert len(compressed) < len(body)
+    assert decompress_body(compressed, applied) == body
+
+    # small bodies and clients without support are sent as is
+    assert compress_body(body[:100], encoding) == (body[:100], None)
+    assert compress_body(body, None) == (body, None)
+
+
+def test_compress_body_skips_incompressible(min_bytes):
+    # arrow buffers of arrays are already compressed
+    body = sy.serialize(np.random.rand(10_000), to_bytes=True)
+
+    assert compress_body(body, "syft-zstd") == (body, None)
+
+
+def test_decompress_body_invalid():
+    assert decompress_body(b"abc", None) == b"abc"
+    assert decompress_body(b"abc", "identity") == b"abc"
+    with pytest.raises(ValueError):
+        decompress_body(b"abc", "gzip")
+    with pytest.raises(ValueError):
+        decompress_body(b"\xff" * 8 + b"abc", "syft-zstd")
+    # a header within the limit but a body which is not zstd
+    with pytest.raises(ValueError):
+        decompress_body(struct.pack("<Q", 100) + b"garbage", "syft-zstd")
+
+
+def test_decompress_body_max_size(min_bytes):
+    body = b"syft" * 10_000
+    compressed, applied = compress_body(body, "syft-zstd")
+    max_bytes = flags.MAX_DECOMPRESSED_BYTES
+    flags.MAX_DECOMPRESSED_BYTES = len(body) - 1
+    try:
+        with pytest.raises(ValueError):
+            decompress_body(compressed, applied)
+    finally:
+        flags.MAX_DECOMPRESSED_BYTES = max_bytes
+    assert decompress_body(compressed, applied) == body
@@ -0,0 +1,152 @@
+# stdlib
+from pathlib import Path
+from threading import Barrier
+from threading import Thread
+import time
+from typing import Any
+from typing import Tuple
+
+# syft absolute
+import syft as sy
+from syft.service.context import AuthedServiceContext
+from syft.service.data_subject.data_subject_closure import DataSubjectClosureStash
+from syft.service.data_subject.data_subject_member import DataSubjectMemberRelationship
+from syft.service.data_subject.data_subject_member import member_relationship_uid
+from syft.service.data_subject.data_subject_member_service import (
+    DataSubjectMemberService,
+)
+from syft.service.response import SyftSuccess
+
+# relative
+from ..stores.store_fixtures_test import dict_document_store_fn
+from ..stores.store_fixtures_test import sqlite_document_store_fn
+
+
+def check_closure(root_verify_key, store) -> None:
+    stash = DataSubjectClosureStash(store=store)
+    # added out of order, the closure doesn't depend on it
+    edges = [("state", "city"), ("country", "state"), ("city", "person")]
+    assert stash.add_edges(root_verify_key, edges).is_ok()
+
+    country = stash.get_by_name(root_verify_key, "country").ok()
+    assert country.descendants == {"state": 1, "city": 2, "person": 3}
+    assert country.ancestors == {}
+    person = stash.get_by_name(root_verify_key, "person").ok()
+    assert person.ancestors == {"city": 1, "state": 2, "country": 3}
+
+    # a shorter path to an existing descendant
+    assert stash.add_edges(root_verify_key, [("country", "city")]).is_ok()
+    country = stash.get_by_name(root_verify_key, "country").ok()
+    assert country.descendants == {"state": 1, "city": 1, "person": 2}
+
+    # cycles are rejected and nothing is written
+    assert stash.add_edges(root_verify_key, [("person", "country")]).is_err()
+    assert stash.get_by_name(root_verify_key, "person").ok().descendants == {}
+    assert stash.get_by_name(root_verify_key, "other").ok().ancestors == {}
+
+
+def test_closure_dict(root_verify_key) -> None:
+    check_closure(root_verify_key, dict_document_store_fn(root_verify_key))
+
+
+def test_closure_sqlite(root_verify_key, sqlite_workspace: Tuple[Path, str]) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    check_closure(root_verify_key, store)
+
+
+def test_closure_concurrent_adds(monkeypatch, worker) -> None:
+    member_service = worker.get_service(DataSubjectMemberService)
+    closure_rows = member_service.closure_stash.closure_rows
+
+    def slow_closure_rows(*args: Any) -> Any:
+        rows = closure_rows(*args)
+        # the other adds read the rows before these are saved
+        time.sleep(0.05)
+        return rows
+
+    monkeypatch.setattr(member_service.closure_stash, "closure_rows", slow_closure_rows)
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    threads = 8
+    barrier = Barrier(threads)
+    results = []
+
+    def add_state(i: int) -> None:
+        barrier.wait()
+        # every add changes the row of the country
+        edges = [("Country", f"State {i}"), (f"State {i}", f"City {i}")]
+        results.append(member_service.add_many(context, edges))
+
+    workers = [Thread(target=add_state, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    assert all(isinstance(result, SyftSuccess) for result in results)
+    descendants = member_service.get_descendants(context, "Country")
+    assert len(descendants) == 2 * threads
+    for i in range(threads):
+        assert descendants[f"City {i}"] == 2
+
+
+def test_data_subject_hierarchy(worker) -> None:
+    root_domain_client = worker.root_client
+    data_subjects = root_domain_client.api.services.data_subject
+
+    country = sy.DataSubject(name="Country")
+    for state_name in ["State A", "State B"]:
+        state = sy.DataSubject(name=state_name)
+        for i in range(2):
+            state.add_member(sy.DataSubject(name=f"{state_name} City {i}"))
+        country.add_member(state)
+    assert data_subjects.add_data_subject(country)
+
+    members = data_subjects.members_for("Country")
+    assert sorted(member.name for member in members) == ["State A", "State B"]
+    # every member of a parent is kept
+    assert len(data_subjects.members_for("State A")) == 2
+
+    descendants = data_subjects.get_all_descendants("Country")
+    assert len(descendants) == 6
+    assert {ds.name for ds in descendants[:2]} == {"State A", "State B"}
+    ancestors = data_subjects.get_all_ancestors("State B City 1")
+    assert [ds.name for ds in ancestors] == ["State B", "Country"]
+
+    # another batch joins the existing hierarchy
+    city = sy.DataSubject(name="State A City 0")
+    city.add_member(sy.DataSubject(name="Person"))
+    assert data_subjects.add_many([city])
+    ancestors = data_subjects.get_all_ancestors("Person")
+    assert [ds.name for ds in ancestors] == ["State A City 0", "State A", "Country"]
+    assert len(data_subjects.get_all()) == 8
+
+
+def test_closure_backfill(worker) -> None:
+    data_subjects = worker.root_client.api.services.data_subject
+    for name in ["Country", "State", "City"]:
+        assert data_subjects.add_data_subject(sy.DataSubject(name=name))
+
+    # relationships stored before the closure existed
+    member_service = worker.get_service(DataSubjectMemberService)
+    relations = [
+        DataSubjectMemberRelationship(
+            id=member_relationship_uid(parent, child), parent=parent, child=child
+        )
+        for parent, child in [("Country", "State"), ("State", "City")]
+    ]
+    credentials = worker.signing_key.verify_key
+    assert member_service.stash.set_many(credentials, relations).is_ok()
+    assert len(member_service.closure_stash) == 0
+    member_service._closure_backfilled = False
+
+    assert [ds.name for ds in data_subjects.members_for("Country")] == ["State"]
+    ancestors = data_subjects.get_all_ancestors("City")
+    assert [ds.name for ds in ancestors] == ["State", "Country"]
+
+    # a cycle is rejected before its relationship is stored
+    city = sy.DataSubject(name="City")
+    city.add_member(sy.DataSubject(name="Country"))
+    assert not data_subjects.add_many([city])
+    assert len(member_service.stash) == 2
@@ -0,0 +1,88 @@
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import TYPE_BANK
+from syft.util.experimental_flags import ApacheArrowCompression
+from syft.util.experimental_flags import DataFrameCodec
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "int": np.arange(100),
+            "float": np.random.rand(100),
+            "str": [str(i) for i in range(100)],
+            "time": pd.date_range("2023-01-01", periods=100, freq="ns"),
+        }
+    )
+
+
+@pytest.fixture
+def codec():
+    codec = flags.DATAFRAME_CODEC
+    compression = flags.APACHE_ARROW_COMPRESSION
+    yield
+    flags.DATAFRAME_CODEC = codec
+    flags.APACHE_ARROW_COMPRESSION = compression
+
+
+def roundtrip(obj):
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.parametrize("compression", list(ApacheArrowCompression))
+def test_dataframe_arrow_ipc(codec, dataframe, compression) -> None:
+    flags.DATAFRAME_CODEC = DataFrameCodec.ARROW_IPC
+    flags.APACHE_ARROW_COMPRESSION = compression
+
+    # arrow ipc keeps nanosecond timestamps
+    assert roundtrip(dataframe).equals(dataframe)
+
+
+def test_dataframe_parquet(codec, dataframe) -> None:
+    flags.DATAFRAME_CODEC = DataFrameCodec.PARQUET
+    df = roundtrip(dataframe.drop(columns=["time"]))
+
+    assert df.equals(dataframe.drop(columns=["time"]))
+
+
+def test_dataframe_decode_ignores_current_codec(codec, dataframe) -> None:
+    flags.DATAFRAME_CODEC = DataFrameCodec.ARROW_IPC
+    blob = sy.serialize(dataframe, to_bytes=True)
+    flags.DATAFRAME_CODEC = DataFrameCodec.PARQUET
+
+    assert sy.deserialize(blob, from_bytes=True).equals(dataframe)
+
+
+def test_dataframe_legacy_parquet_blob(dataframe) -> None:
+    # blobs written before the codec was configurable are plain parquet files
+    df = dataframe.drop(columns=["time"])
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df), sink)
+    _, _, deserialize, _, _, _ = TYPE_BANK["pandas.core.frame.DataFrame"]
+
+    assert deserialize(sink.getvalue().to_pybytes()).equals(df)
+
+
+@pytest.mark.parametrize("codec_value", list(DataFrameCodec))
+def test_series(codec, codec_value) -> None:
+    flags.DATAFRAME_CODEC = codec_value
+    series = pd.Series(np.random.rand(100), name="series")
+    series_2 = roundtrip(series)
+
+    assert series_2.equals(series)
+    assert series_2.name == series.name
+
+
+def test_series_mixed_types() -> None:
+    series = pd.Series([1, "a", None])
+
+    assert roundtrip(series).tolist() == series.tolist()
@@ -0,0 +1,163 @@
+# stdlib
+from pathlib import Path
+import sys
+from typing import Tuple
+
+# third party
+import pytest
+
+# syft absolute
+from syft.service.dataset.dataset import Asset
+from syft.service.dataset.dataset import Dataset
+from syft.service.dataset.dataset_search import DatasetSearchIndex
+from syft.service.dataset.dataset_search import InvertedIndex
+from syft.service.dataset.dataset_search import dataset_terms
+from syft.service.dataset.dataset_stash import DatasetStash
+from syft.types.datetime import DateTime
+from syft.types.uid import UID
+
+# relative
+from ..stores.store_constants_test import generate_db_name
+from ..stores.store_fixtures_test import dict_document_store_fn
+from ..stores.store_fixtures_test import mongo_document_store_fn
+from ..stores.store_fixtures_test import sqlite_document_store_fn
+
+
+def make_dataset(name: str, description: str = "", assets=()) -> Dataset:
+    asset_list = [
+        Asset(
+            name=asset,
+            node_uid=UID(),
+            action_id=UID(),
+            mock_is_real=False,
+            shape=(1,),
+            created_at=DateTime.now(),
+        )
+        for asset in assets
+    ]
+    return Dataset(name=name, description=description, asset_list=asset_list)
+
+
+def test_inverted_index() -> None:
+    index = InvertedIndex()
+    cancer, census, heart = UID(), UID(), UID()
+    index.add(cancer, {"breast": 1, "cancer": 3, "images": 1})
+    index.add(census, {"census": 2, "income": 1})
+    index.add(heart, {"heart": 1, "disease": 1, "cancer": 1})
+
+    # prefixes, ranked by term frequency
+    assert index.search("canc") == [(cancer, 3), (heart, 1)]
+    assert index.search("c") == [(cancer, 3), (census, 2), (heart, 1)]
+    # every word has to match
+    assert index.search("cancer HEART") == [(heart, 2)]
+    assert index.search("cancer income") == []
+    assert index.search("") == []
+
+    index.remove(heart)
+    assert index.search("cancer") == [(cancer, 3)]
+    assert "heart" not in index.terms and "disease" not in index.postings
+
+    # adding a document again replaces its terms
+    index.add(census, {"census": 1})
+    assert index.search("income") == []
+    assert index.terms == ["breast", "cancer", "census", "images"]
+
+
+def test_dataset_terms() -> None:
+    dataset = make_dataset(
+        "Breast Cancer", "Images of breast cancer biopsies", ["train-images"]
+    )
+    assert dataset_terms(dataset) == {
+        "breast": 2,
+        "cancer": 2,
+        "images": 2,
+        "of": 1,
+        "biopsies": 1,
+        "train": 1,
+    }
+
+
+def check_search_index(root_verify_key, store) -> None:
+    stash = DatasetStash(store=store)
+    datasets = [
+        make_dataset("Breast Cancer", "cancer biopsies", ["images"]),
+        make_dataset("Census", "income per county"),
+        make_dataset("Heart Disease", assets=["cancer-risk"]),
+    ]
+    # indexed when the index is loaded
+    assert stash.set(root_verify_key, datasets[0]).is_ok()
+
+    index = DatasetSearchIndex(store=store, dataset_stash=stash)
+    for dataset in datasets[1:]:
+        assert stash.set(root_verify_key, dataset).is_ok()
+        assert index.add(dataset).is_ok()
+
+    ranked = index.search("canc").ok()
+    assert [uid for uid, _ in ranked] == [datasets[0].id, datasets[2].id]
+    assert index.search("county inc").ok() == [(datasets[1].id, 2)]
+
+    # another index over the same store loads the stored entries
+    assert stash.delete_by_uid(root_verify_key, datasets[2].id).is_ok()
+    assert index.remove(datasets[2].id).is_ok()
+    other = DatasetSearchIndex(store=store, dataset_stash=stash)
+    assert other.search("cancer").ok() == [(datasets[0].id, 2)]
+    assert len(other.index) == 2
+
+    # the other index adds one and removes one, the number of entries is the same
+    heart = make_dataset("Heart Disease", "cardiology")
+    assert stash.set(root_verify_key, heart).is_ok()
+    assert other.add(heart).is_ok()
+    assert stash.delete_by_uid(root_verify_key, datasets[1].id).is_ok()
+    assert other.remove(datasets[1].id).is_ok()
+    assert index.search("cardio").ok() == [(heart.id, 1)]
+    assert index.search("census").ok() == []
+
+
+def test_search_index_local_changes(root_verify_key, monkeypatch) -> None:
+    store = dict_document_store_fn(root_verify_key)
+    stash = DatasetStash(store=store)
+    index = DatasetSearchIndex(store=store, dataset_stash=stash)
+    assert index.search("cancer").ok() == []
+
+    loads = []
+    load = index.load
+    monkeypatch.setattr(index, "load", lambda: loads.append(1) or load())
+
+    # the changes made through the index are already in memory
+    cancer = make_dataset("Breast Cancer")
+    assert stash.set(root_verify_key, cancer).is_ok()
+    assert index.add(cancer).is_ok()
+    assert index.search("cancer").ok() == [(cancer.id, 1)]
+    assert index.remove(cancer.id).is_ok()
+    assert index.search("cancer").ok() == []
+    assert loads == []
+
+    # a change made by another index is loaded
+    other = DatasetSearchIndex(store=store, dataset_stash=stash)
+    heart = make_dataset("Heart Cancer")
+    assert stash.set(root_verify_key, heart).is_ok()
+    assert other.add(heart).is_ok()
+    assert index.search("heart").ok() == [(heart.id, 1)]
+    assert loads == [1]
+
+
+def test_search_index_dict(root_verify_key) -> None:
+    check_search_index(root_verify_key, dict_document_store_fn(root_verify_key))
+
+
+def test_search_index_sqlite(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    check_search_index(root_verify_key, store)
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux", reason="pytest_mock_resources + docker issues on Windows"
+)
+def test_search_index_mongo(root_verify_key, mongo_server_mock) -> None:
+    mongo_kwargs = mongo_server_mock.pmr_credentials.as_mongo_kwargs()
+    store = mongo_document_store_fn(
+        root_verify_key, mongo_db_name=generate_db_name(), **mongo_kwargs
+    )
+    check_search_index(root_verify_key, store)
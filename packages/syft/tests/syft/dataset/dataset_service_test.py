@@ -0,0 +1,39 @@
+# third party
+import numpy as np
+
+# syft absolute
+import syft as sy
+from syft.service.dataset.dataset import DatasetView
+
+
+def test_dataset_views_pages(worker) -> None:
+    root_domain_client = worker.root_client
+    for i in range(5):
+        dataset = sy.Dataset(
+            name=f"dataset {i}",
+            asset_list=[
+                sy.Asset(
+                    name=f"asset {j}",
+                    data=np.array([1, 2, 3]),
+                    mock=np.array([1, 1, 1]),
+                    mock_is_real=False,
+                )
+                for j in range(i)
+            ],
+        )
+        assert root_domain_client.upload_dataset(dataset)
+
+    datasets = root_domain_client.api.services.dataset
+    views = datasets.get_all_views()
+    assert [view.name for view in views] == [f"dataset {i}" for i in range(5)]
+    assert all(isinstance(view, DatasetView) for view in views)
+    assert [view.asset_count for view in views] == list(range(5))
+    assert all(view.node_uid == worker.id for view in views)
+
+    page = datasets.get_all_views(page_size=2, page_index=1)
+    assert [view.name for view in page] == ["dataset 2", "dataset 3"]
+    assert datasets.get_all_views(page_size=2, page_index=3) == []
+
+    found = datasets.search_views(name="dataset", page_size=3, page_index=1)
+    assert [view.name for view in found] == ["dataset 3", "dataset 4"]
+    assert datasets.search_views(name="dataset 4") == [views[4]]
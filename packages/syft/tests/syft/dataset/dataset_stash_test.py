@@ -5,7 +5,10 @@ from typing import List
 import pytest
 
 # syft absolute
+import syft as sy
 from syft.service.dataset.dataset import Dataset
+from syft.service.dataset.dataset import DatasetView
+from syft.service.dataset.dataset import DatasetViewProjection
 from syft.service.dataset.dataset_stash import ActionIDsPartitionKey
 from syft.service.dataset.dataset_stash import NamePartitionKey
 from syft.store.document_store import QueryKey
@@ -112,3 +115,28 @@ def test_dataset_search_action_ids(root_verify_key, mock_dataset_stash, mock_dat
     random_obj = object()
     with pytest.raises(AttributeError):
         result = mock_dataset_stash.search_action_ids(root_verify_key, uid=random_obj)
+
+
+def test_dataset_projection(mock_dataset) -> None:
+    view = DatasetViewProjection.from_object(mock_dataset)
+    assert isinstance(view, DatasetView)
+    assert (view.id, view.name, view.asset_count) == (
+        mock_dataset.id,
+        "test_dataset",
+        1,
+    )
+
+    # the assets aren't deserialized to count them
+    blob = sy.serialize(mock_dataset, to_bytes=True)
+    assert DatasetViewProjection.from_bytes(blob) == view
+
+
+def test_dataset_get_all_views(root_verify_key, mock_dataset_stash, mock_dataset):
+    result = mock_dataset_stash.get_all_views(root_verify_key)
+    assert result.is_ok(), f"Dataset views could not be retrieved, result: {result}"
+    (view,) = result.ok()
+    assert isinstance(view, DatasetView)
+    assert view.id == mock_dataset.id
+    assert view.name == mock_dataset.name
+    assert view.asset_count == len(mock_dataset.asset_list)
+    assert view.mb_size == mock_dataset.mb_size
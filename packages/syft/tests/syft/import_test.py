@@ -0,0 +1,61 @@
+# stdlib
+import json
+import os
+import subprocess  # nosec
+import sys
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import LAZY_TYPE_BANK
+from syft.serde.recursive import TYPE_BANK
+
+# seconds, override with SYFT_IMPORT_BUDGET to tighten on a known machine
+IMPORT_BUDGET = float(os.environ.get("SYFT_IMPORT_BUDGET", 15))
+
+LAZY_MODULES = [
+    "jax",
+    "jaxlib",
+    "flax",
+    "IPython",
+    "gipc",
+    "pymongo",
+    "pyarrow.parquet",
+]
+
+
+def import_syft_in_subprocess() -> dict:
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import syft\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': list(sys.modules)}))\n"
+    )
+    output = subprocess.check_output([sys.executable, "-c", script])  # nosec
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def test_import_syft_skips_heavy_modules() -> None:
+    modules = set(import_syft_in_subprocess()["modules"])
+    for module in LAZY_MODULES:
+        assert module not in modules, f"{module} imported by import syft"
+
+
+@pytest.mark.slow
+def test_import_syft_time_budget() -> None:
+    elapsed = import_syft_in_subprocess()["elapsed"]
+    assert elapsed < IMPORT_BUDGET
+
+
+def test_lazy_serde_registered_on_first_use() -> None:
+    df = pd.DataFrame({"a": np.arange(5), "b": np.arange(5) * 2.0})
+    df_2 = sy.deserialize(sy.serialize(df, to_bytes=True), from_bytes=True)
+    assert df.equals(df_2)
+
+    assert "pandas" not in LAZY_TYPE_BANK
+    assert "pandas.core.frame.DataFrame" in TYPE_BANK
@@ -360,22 +360,21 @@ def test_messagestash_delete_all_for_verify_key(
         test_stash.delete_all_for_verify_key(root_verify_key, random_signing_key)
 
 
-def test_messagestash_delete_all_for_verify_key_error_on_get_all_inbox_for_verify_key(
+def test_messagestash_delete_all_for_verify_key_error_on_delete_where(
     root_verify_key, monkeypatch: MonkeyPatch, document_store
 ) -> None:
     random_signing_key = SyftSigningKey.generate()
     random_verify_key = random_signing_key.verify_key
     test_stash = MessageStash(store=document_store)
+    add_mock_message(root_verify_key, test_stash, test_verify_key, random_verify_key)
 
-    def mock_get_all_inbox_for_verify_key(
-        root_verify_key, verify_key: random_verify_key
-    ) -> Err:
+    def mock_delete_where(root_verify_key, qks) -> Err:
         return Err(None)
 
     monkeypatch.setattr(
         test_stash,
-        "get_all_inbox_for_verify_key",
-        mock_get_all_inbox_for_verify_key,
+        "delete_where",
+        mock_delete_where,
     )
 
     response = test_stash.delete_all_for_verify_key(root_verify_key, random_verify_key)
@@ -383,27 +382,28 @@ def test_messagestash_delete_all_for_verify_key_error_on_get_all_inbox_for_verif
     assert response == Err(None)
 
 
-def test_messagestash_delete_all_for_verify_key_error_on_delete_by_uid(
-    root_verify_key, monkeypatch: MonkeyPatch, document_store
+def test_messagestash_update_all_status_for_verify_key(
+    root_verify_key, document_store
 ) -> None:
-    random_signing_key = SyftSigningKey.generate()
-    random_verify_key = random_signing_key.verify_key
+    random_verify_key = SyftSigningKey.generate().verify_key
     test_stash = MessageStash(store=document_store)
-    mock_message = add_mock_message(
-        root_verify_key, test_stash, test_verify_key, random_verify_key
+    for _ in range(3):
+        add_mock_message(
+            root_verify_key, test_stash, test_verify_key, random_verify_key
+        )
+    other = add_mock_message(
+        root_verify_key, test_stash, random_verify_key, test_verify_key
     )
 
-    def mock_delete_by_uid(root_verify_key, uid=mock_message.id) -> Err:
-        return Err(None)
-
-    monkeypatch.setattr(
-        test_stash,
-        "delete_by_uid",
-        mock_delete_by_uid,
+    response = test_stash.update_all_status_for_verify_key(
+        root_verify_key, random_verify_key, MessageStatus.DELIVERED
+    )
+    assert response.ok() == 3
+
+    delivered = test_stash.get_all_by_verify_key_for_status(
+        root_verify_key, random_verify_key, MessageStatus.DELIVERED
+    ).ok()
+    assert len(delivered) == 3
+    assert test_stash.get_by_uid(root_verify_key, other.id).ok().status == (
+        MessageStatus.UNDELIVERED
     )
-
-    response = test_stash.delete_all_for_verify_key(
-        root_verify_key, random_verify_key
-    ).value
-
-    assert response is None
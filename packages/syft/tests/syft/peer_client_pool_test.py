@@ -0,0 +1,182 @@
+# stdlib
+import time
+from typing import Any
+from typing import List
+
+# third party
+from faker import Faker
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.client import PythonConnection
+from syft.node.peer_client_pool import PeerClientPool
+from syft.node.worker import Worker
+from syft.service.metadata.node_metadata import NodeMetadata
+from syft.service.network.network_service import NetworkService
+from syft.service.network.network_service import NodePeer
+from syft.service.network.network_service import connection_to_route
+from syft.service.response import SyftError
+from syft.types.uid import UID
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def add_peer(worker: Worker, peer: Worker) -> None:
+    node_peer = NodePeer(
+        id=peer.id,
+        name=peer.name,
+        verify_key=peer.signing_key.verify_key,
+        node_routes=[connection_to_route(PythonConnection(node=peer))],
+    )
+    stash = worker.get_service(NetworkService).stash
+    assert stash.set(worker.signing_key.verify_key, node_peer).is_ok()
+
+
+def add_latency(pool: PeerClientPool, peer_uid: UID, seconds: float) -> None:
+    node = pool.get(peer_uid).ok().connection.node
+    handle_api_call = node.handle_api_call
+
+    def slow_handle_api_call(api_call: Any) -> Any:
+        time.sleep(seconds)
+        return handle_api_call(api_call)
+
+    node.handle_api_call = slow_handle_api_call
+
+
+@pytest.fixture
+def peers(worker) -> List[Worker]:
+    peers = [sy.Worker.named(name=Faker().name()) for _ in range(2)]
+    for peer in peers:
+        add_peer(worker, peer)
+    return peers
+
+
+def metadata_call(worker: Worker) -> SyftAPICall:
+    return SyftAPICall(node_uid=worker.id, path="metadata", args=[], kwargs={})
+
+
+def test_peer_client_pool_ttl(worker, peers) -> None:
+    clock = FakeClock()
+    pool = PeerClientPool(node=worker, ttl=10, clock=clock)
+
+    client = pool.get(peers[0].id).ok()
+    assert client.connection.node.id == peers[0].id
+    assert pool.get(peers[0].id).ok() is client
+
+    clock.now = 11
+    assert pool.get(peers[0].id).ok() is not client
+    assert len(pool) == 1
+
+    assert pool.get(UID()).is_err()
+    assert len(pool) == 1
+
+
+def test_peer_client_pool_lru(worker, peers) -> None:
+    pool = PeerClientPool(node=worker, max_size=1)
+    pool.get(peers[0].id)
+    pool.get(peers[1].id)
+    assert peers[0].id not in pool
+    assert peers[1].id in pool
+
+
+def test_peer_client_pool_evict_on_route_failure(worker, peers) -> None:
+    pool = PeerClientPool(node=worker)
+    node = pool.get(peers[0].id).ok().connection.node
+
+    def broken_handle_api_call(api_call: Any) -> Any:
+        raise ConnectionError("route is down")
+
+    node.handle_api_call = broken_handle_api_call
+    signed_call = metadata_call(peers[0]).sign(worker.signing_key)
+    result = pool.call(peers[0].id, signed_call)
+    assert isinstance(result, SyftError)
+    assert peers[0].id not in pool
+
+    # the next call connects again
+    result = pool.call(peers[0].id, signed_call)
+    assert not isinstance(result, SyftError)
+    assert peers[0].id in pool
+
+
+def test_peer_client_pool_fan_out(worker, peers) -> None:
+    pool = PeerClientPool(node=worker)
+    for peer in peers:
+        add_latency(pool, peer.id, 1)
+
+    # the peers are called at the same time
+    start = time.monotonic()
+    results = pool.fan_out(metadata_call(worker), [peer.id for peer in peers])
+    assert time.monotonic() - start < 1.8
+    for peer in peers:
+        assert isinstance(results[peer.id], NodeMetadata)
+        assert results[peer.id].id == peer.id
+
+    # a slow peer only fails on its own
+    add_latency(pool, peers[1].id, 2)
+    unknown = UID()
+    results = pool.fan_out(
+        metadata_call(worker), [peers[0].id, peers[1].id, unknown], timeout=2
+    )
+    assert not isinstance(results[peers[0].id], SyftError)
+    assert isinstance(results[peers[1].id], SyftError)
+    assert "didn't answer" in results[peers[1].id].message
+    assert isinstance(results[unknown], SyftError)
+
+
+def hang_connection(monkeypatch: Any, peer: Worker) -> None:
+    """Calls to `peer` hang until their timeout, like a peer behind HTTP which
+    doesn't answer"""
+    make_call = PythonConnection.make_call
+
+    def hung_make_call(self: Any, signed_call: Any, timeout: Any = None) -> Any:
+        if self.node.id != peer.id:
+            return make_call(self, signed_call, timeout=timeout)
+        time.sleep(timeout)
+        raise TimeoutError(f"no answer after {timeout} seconds")
+
+    monkeypatch.setattr(PythonConnection, "make_call", hung_make_call)
+
+
+def test_peer_client_pool_fan_out_after_hung_peer(monkeypatch, worker, peers) -> None:
+    pool = PeerClientPool(node=worker, fan_out_workers=1)
+    hang_connection(monkeypatch, peers[1])
+
+    results = pool.fan_out(metadata_call(worker), [peers[1].id], timeout=0.5)
+    assert isinstance(results[peers[1].id], SyftError)
+    assert peers[1].id not in pool
+
+    # the call timed out and gave the only thread back to the next fan out
+    executor = pool._executor
+    results = pool.fan_out(metadata_call(worker), [peers[0].id], timeout=5)
+    assert isinstance(results[peers[0].id], NodeMetadata)
+    assert pool._executor is executor
+    assert len(executor._threads) == 1
+
+
+def test_peer_client_pool_fan_out_after_shutdown(worker, peers) -> None:
+    pool = PeerClientPool(node=worker)
+    executor = pool._get_executor()
+    pool.shutdown()
+    # a fan out which got the executor before it was shut down
+    handed_out = [executor]
+    get_executor = pool._get_executor
+    pool._get_executor = lambda: handed_out.pop() if handed_out else get_executor()
+
+    results = pool.fan_out(metadata_call(worker), [peers[0].id])
+    assert isinstance(results[peers[0].id], NodeMetadata)
+    assert pool._executor is not executor
+
+
+def test_forward_message(worker, peers) -> None:
+    signed_call = metadata_call(peers[0]).sign(worker.root_client.credentials)
+    result = worker.handle_api_call_with_unsigned_result(signed_call)
+    assert result.message.data.name == peers[0].name
+    assert peers[0].id in worker.peer_client_pool
@@ -0,0 +1,75 @@
+# stdlib
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.node.routes import make_routes
+
+
+def test_api_call_does_not_block_event_loop(worker) -> None:
+    def slow_handle_api_call(api_call: Any) -> Any:
+        time.sleep(1)
+        return SyftAPIData(data=1).sign(worker.signing_key)
+
+    worker.handle_api_call = slow_handle_api_call
+    router = make_routes(worker)
+    endpoint = next(
+        route.endpoint for route in router.routes if route.path == "/api_call"
+    )
+    api_call = SyftAPICall(node_uid=worker.id, path="metadata", args=[], kwargs={})
+    body = sy.serialize(api_call.sign(worker.signing_key), to_bytes=True)
+
+    async def call_and_tick() -> Any:
+        call = asyncio.ensure_future(endpoint(SimpleNamespace(headers={}), data=body))
+        start = time.monotonic()
+        # a handler blocking the loop would delay this until the call is done
+        await asyncio.sleep(0.1)
+        tick = time.monotonic() - start
+        response = await call
+        return tick, time.monotonic() - start, response
+
+    tick, total, response = asyncio.run(call_and_tick())
+    assert tick < 0.5
+    assert total >= 1
+    assert response.status_code == 200
+    assert sy.deserialize(response.body, from_bytes=True).message.data == 1
+
+
+def test_queue_wait_does_not_hold_api_call_threads(worker) -> None:
+    def handle_api_call(api_call: Any) -> Any:
+        if api_call.message.path == "queue":
+            # a long poll for a result which isn't ready
+            time.sleep(1)
+        return SyftAPIData(data=api_call.message.path).sign(worker.signing_key)
+
+    worker.handle_api_call = handle_api_call
+    router = make_routes(worker, api_call_workers=1, queue_wait_workers=1)
+    endpoint = next(
+        route.endpoint for route in router.routes if route.path == "/api_call"
+    )
+
+    def body(path: str, **kwargs: Any) -> bytes:
+        api_call = SyftAPICall(node_uid=worker.id, path=path, args=[], kwargs=kwargs)
+        return sy.serialize(api_call.sign(worker.signing_key), to_bytes=True)
+
+    async def wait_and_call() -> Any:
+        request = SimpleNamespace(headers={})
+        wait = asyncio.ensure_future(
+            endpoint(request, data=body("queue", uid=sy.UID(), timeout=1))
+        )
+        await asyncio.sleep(0.1)
+        start = time.monotonic()
+        response = await endpoint(request, data=body("metadata"))
+        elapsed = time.monotonic() - start
+        assert not wait.done()
+        await wait
+        return elapsed, response
+
+    elapsed, response = asyncio.run(wait_and_call())
+    assert elapsed < 0.5
+    assert sy.deserialize(response.body, from_bytes=True).message.data == "metadata"
@@ -1010,3 +1010,20 @@ def test_actionobject_syft_getattr_pandas(worker):
 
     obj.columns = ["a", "b", "c"]
     assert obj.columns == ["a", "b", "c"]
+
+
+def test_actionobject_dispatch_table():
+    # syft absolute
+    from syft.service.action.numpy import NumpyArrayObject
+
+    obj = ActionObject.from_obj(np.array([1, 2, 3]))
+
+    assert isinstance(obj._syft_passthrough_attrs(), frozenset)
+    assert "id" in obj._syft_passthrough_attrs()
+    assert "dtype" in NumpyArrayObject._syft_dont_wrap_set
+    assert "dtype" not in ActionObject._syft_dont_wrap_set
+
+    # dont wrap attrs are returned unwrapped, the rest is wrapped
+    assert obj.dtype == np.array([1, 2, 3]).dtype
+    assert isinstance(obj.shape, ActionObject)
+    assert (obj.sum() + obj).syft_action_data.tolist() == [7, 8, 9]
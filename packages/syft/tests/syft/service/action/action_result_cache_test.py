@@ -0,0 +1,126 @@
+# stdlib
+import time
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.action.action_object import Action
+from syft.service.action.action_object import ActionObject
+from syft.service.action.action_result_cache import ActionResultCache
+from syft.service.action.action_result_cache import is_cacheable
+from syft.service.action.action_service import TwinMode
+from syft.service.context import AuthedServiceContext
+from syft.types.uid import LineageID
+from syft.types.uid import UID
+from syft.util.experimental_flags import flags
+
+
+def make_action(op="__add__", remote_self=None, args=None):
+    return Action(
+        path="numpy.ndarray",
+        op=op,
+        remote_self=remote_self if remote_self is not None else LineageID(),
+        args=args if args is not None else [LineageID()],
+        kwargs={},
+        result_id=LineageID(),
+    )
+
+
+@pytest.fixture
+def credentials():
+    return SyftSigningKey.generate().verify_key
+
+
+@pytest.fixture
+def action_result_cache():
+    enabled = flags.ACTION_RESULT_CACHE
+    yield
+    flags.ACTION_RESULT_CACHE = enabled
+
+
+def test_cache_hit_and_miss(credentials):
+    cache = ActionResultCache()
+    action = make_action()
+    assert cache.get(credentials, action) is None
+
+    result_id = UID()
+    cache.set(credentials, action, result_id)
+    # a new action with the same inputs and a different result_id
+    same_action = make_action(remote_self=action.remote_self, args=action.args)
+    assert cache.get(credentials, same_action) == result_id
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_cache_key_keeps_argument_order(credentials):
+    cache = ActionResultCache()
+    a, b = LineageID(), LineageID()
+    cache.set(credentials, make_action("__sub__", a, [b]), UID())
+
+    assert cache.get(credentials, make_action("__sub__", b, [a])) is None
+
+
+def test_cache_scoped_by_credentials(credentials):
+    cache = ActionResultCache()
+    action = make_action()
+    cache.set(credentials, action, UID())
+
+    assert cache.get(SyftSigningKey.generate().verify_key, action) is None
+
+
+def test_cache_lru_eviction(credentials):
+    cache = ActionResultCache(max_size=2)
+    actions = [make_action() for _ in range(3)]
+    cache.set(credentials, actions[0], UID())
+    cache.set(credentials, actions[1], UID())
+    # touch the first action so the second one is the least recently used
+    cache.get(credentials, actions[0])
+    cache.set(credentials, actions[2], UID())
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(credentials, actions[1]) is None
+    assert cache.get(credentials, actions[0]) is not None
+
+
+def test_cache_ttl(credentials):
+    cache = ActionResultCache(ttl=0.01)
+    action = make_action()
+    cache.set(credentials, action, UID())
+    time.sleep(0.02)
+
+    assert cache.get(credentials, action) is None
+    assert len(cache) == 0
+
+
+def test_inplace_ops_not_cacheable():
+    assert is_cacheable(make_action("__add__"))
+    assert not is_cacheable(make_action("__iadd__"))
+
+
+def test_action_service_execute_cached(worker, action_result_cache):
+    flags.ACTION_RESULT_CACHE = True
+    service = worker.get_service("actionservice")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    obj = ActionObject.from_obj(np.array([1, 2, 3]))
+    service.set(context, obj)
+
+    results = []
+    for _ in range(2):
+        action = make_action(remote_self=LineageID(obj.id), args=[LineageID(obj.id)])
+        assert service.execute(context, action).is_ok()
+        result = service.get(context, action.result_id, TwinMode.NONE)
+        results.append(result.ok())
+
+    stats = service.cache_stats(context)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert results[0].id != results[1].id
+    assert (results[1].syft_action_data == np.array([2, 4, 6])).all()
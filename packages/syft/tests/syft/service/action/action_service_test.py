@@ -1,10 +1,25 @@
 # stdlib
+from io import StringIO
+import sys
+import threading
 
 # third party
+import numpy as np
+import pytest
 
 # syft absolute
+from syft.service.action.action_object import Action
 from syft.service.action.action_object import ActionObject
+from syft.service.action.action_service import TwinMode
+from syft.service.action.action_service import execute_twin
+from syft.service.action.action_service import resolve_lib_callable
+from syft.service.code.user_code import redirect_thread_output
 from syft.service.context import AuthedServiceContext
+from syft.service.service import LibConfigRegistry
+from syft.service.service import UserLibConfigRegistry
+from syft.types.twin_object import TwinObject
+from syft.types.uid import LineageID
+from syft.util.experimental_flags import flags
 
 # TODO: Improve ActionService testing
 
@@ -23,3 +38,125 @@ def test_action_service_sanity(worker):
     assert len(service.store.data) == 1
     res = pointer.capitalize()
     assert res[0] == "A"
+
+
+@pytest.fixture
+def twin_executor_workers():
+    workers = flags.TWIN_EXECUTOR_WORKERS
+    yield
+    flags.TWIN_EXECUTOR_WORKERS = workers
+
+
+def test_execute_twin_parallel(twin_executor_workers):
+    flags.TWIN_EXECUTOR_WORKERS = 2
+    # both sides have to be running at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def side(name):
+        barrier.wait()
+        return name, threading.get_ident()
+
+    private, mock = execute_twin(lambda: side("private"), lambda: side("mock"))
+    assert private[0] == "private"
+    assert mock[0] == "mock"
+    assert private[1] != mock[1]
+
+
+def test_execute_twin_sequential(twin_executor_workers):
+    flags.TWIN_EXECUTOR_WORKERS = 0
+    calls = []
+
+    private, mock = execute_twin(
+        lambda: calls.append("private") or 1, lambda: calls.append("mock") or 2
+    )
+    assert (private, mock) == (1, 2)
+    assert calls == ["private", "mock"]
+
+
+@pytest.mark.parametrize("failing_side", ["private", "mock"])
+def test_execute_twin_error(twin_executor_workers, failing_side):
+    flags.TWIN_EXECUTOR_WORKERS = 2
+
+    def side(name):
+        if name == failing_side:
+            raise ValueError(name)
+        return name
+
+    with pytest.raises(ValueError, match=failing_side):
+        execute_twin(lambda: side("private"), lambda: side("mock"))
+
+
+def test_redirect_thread_output():
+    original = sys.stdout, sys.stderr
+    outputs = [StringIO(), StringIO()]
+    barrier = threading.Barrier(2, timeout=5)
+
+    def write(idx):
+        with redirect_thread_output(outputs[idx], StringIO()):
+            barrier.wait()
+            print(idx)
+            barrier.wait()
+
+    threads = [threading.Thread(target=write, args=(idx,)) for idx in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outputs[0].getvalue() == "0\n"
+    assert outputs[1].getvalue() == "1\n"
+    # the last redirect to exit puts back the original streams
+    assert (sys.stdout, sys.stderr) == original
+
+    outer, inner = StringIO(), StringIO()
+    with redirect_thread_output(outer, StringIO()):
+        with redirect_thread_output(inner, StringIO()):
+            print("inner")
+        print("outer")
+    assert (outer.getvalue(), inner.getvalue()) == ("outer\n", "inner\n")
+
+
+def test_action_service_execute_twin(worker):
+    service = worker.get_service("actionservice")
+    twin = TwinObject(
+        private_obj=np.array([1, 2, 3]),
+        mock_obj=np.array([1, 1, 1]),
+    )
+    service.set(get_auth_ctx(worker), twin)
+    action = Action(
+        path="numpy.ndarray",
+        op="__add__",
+        remote_self=LineageID(twin.id),
+        args=[LineageID(twin.id)],
+        kwargs={},
+        result_id=LineageID(),
+    )
+
+    result = service.execute(get_auth_ctx(worker), action)
+    assert result.is_ok()
+
+    result = service.get(get_auth_ctx(worker), action.result_id, TwinMode.NONE)
+    assert isinstance(result.ok(), TwinObject)
+    assert (result.ok().private.syft_action_data == np.array([2, 4, 6])).all()
+    assert (result.ok().mock.syft_action_data == np.array([2, 2, 2])).all()
+
+
+def test_resolve_lib_callable():
+    assert resolve_lib_callable("numpy", "concatenate") is np.concatenate
+    # cached after the first lookup
+    assert resolve_lib_callable("numpy", "concatenate") is np.concatenate
+
+    with pytest.raises(ValueError):
+        resolve_lib_callable("os", "system")
+
+
+def test_user_lib_config_registry(worker):
+    registry = UserLibConfigRegistry.from_user(worker.signing_key.verify_key)
+    credentials = worker.signing_key.verify_key
+
+    assert "numpy.concatenate" in registry
+    assert registry.get_registered_configs() == {
+        path: lib_config
+        for path, lib_config in LibConfigRegistry.get_registered_configs().items()
+        if lib_config.has_permission(credentials)
+    }
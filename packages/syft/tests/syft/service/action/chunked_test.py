@@ -0,0 +1,107 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+from syft.service.action.action_object import Action
+from syft.service.action.action_object import ActionObject
+from syft.service.action.action_service import TwinMode
+from syft.service.action.chunked import chunked_method
+from syft.service.context import AuthedServiceContext
+from syft.types.uid import LineageID
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture
+def chunk_rows():
+    rows = flags.CHUNKED_EXECUTION_ROWS
+    flags.CHUNKED_EXECUTION_ROWS = 3
+    yield
+    flags.CHUNKED_EXECUTION_ROWS = rows
+
+
+def run_chunked(data, op, *args):
+    method = chunked_method(data, op, getattr(data, op))
+    assert method is not getattr(data, op)
+    return method(*args)
+
+
+@pytest.mark.parametrize("op", ["sum", "prod", "min", "max", "any", "all", "mean"])
+def test_chunked_numpy_reductions(chunk_rows, op):
+    data = np.random.rand(10, 2) + 0.5
+
+    assert np.isclose(run_chunked(data, op), getattr(data, op)())
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        np.arange(10),
+        np.random.rand(10).astype(np.float32),
+        np.random.rand(10).astype(np.float16),
+        np.random.rand(10) + 1j * np.random.rand(10),
+    ],
+)
+def test_chunked_numpy_mean_dtype(chunk_rows, data):
+    result = run_chunked(data, "mean")
+
+    assert result.dtype == data.mean().dtype
+    assert np.isclose(result, data.mean())
+
+
+@pytest.mark.parametrize("op", ["__add__", "__mul__", "__gt__", "__rsub__"])
+def test_chunked_numpy_elementwise(chunk_rows, op):
+    data = np.random.rand(10, 2)
+
+    assert (run_chunked(data, op, 0.5) == getattr(data, op)(0.5)).all()
+    assert (run_chunked(data, op, data) == getattr(data, op)(data)).all()
+
+
+def test_chunked_numpy_fallback(chunk_rows):
+    data = np.random.rand(10, 2)
+
+    # broadcasting and kwargs run on the whole array
+    assert (run_chunked(data, "__add__", data[0]) == data + data[0]).all()
+    assert np.allclose(chunked_method(data, "sum", data.sum)(axis=0), data.sum(axis=0))
+
+
+def test_chunked_disabled():
+    data = np.random.rand(10)
+
+    assert chunked_method(data, "sum", data.sum) == data.sum
+
+
+@pytest.mark.parametrize("op", ["sum", "count", "min", "max", "mean"])
+def test_chunked_pandas_reductions(chunk_rows, op):
+    df = pd.DataFrame({"a": np.arange(10), "b": np.random.rand(10)})
+
+    assert np.allclose(run_chunked(df, op), getattr(df, op)())
+
+
+def test_chunked_pandas_elementwise(chunk_rows):
+    df = pd.DataFrame({"a": np.arange(10), "b": np.random.rand(10)})
+
+    assert run_chunked(df, "__mul__", 2).equals(df * 2)
+    assert run_chunked(df, "__sub__", df).equals(df - df)
+
+
+def test_execute_chunked(worker, chunk_rows):
+    service = worker.get_service("actionservice")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    data = np.arange(10)
+    obj = ActionObject.from_obj(data)
+    service.set(context, obj)
+
+    action = Action(
+        path="numpy.ndarray",
+        op="sum",
+        remote_self=LineageID(obj.id),
+        args=[],
+        kwargs={},
+    )
+    assert service.execute(context, action).is_ok()
+    result = service.get(context, action.result_id, TwinMode.NONE)
+    assert result.ok().syft_action_data == data.sum()
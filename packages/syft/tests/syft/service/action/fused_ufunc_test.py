@@ -0,0 +1,120 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.service.action.action_object import ActionObject
+from syft.service.action.fused_ufunc import CONSTANT
+from syft.service.action.fused_ufunc import FusedUfuncExpression
+from syft.service.action.fused_ufunc import INPUT
+from syft.service.action.fused_ufunc import STEP
+from syft.service.action.fused_ufunc import fuse
+from syft.service.action.fused_ufunc import trace_fused
+from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftError
+from syft.service.response import SyftException
+from syft.types.twin_object import TwinObject
+
+
+def test_trace_fused():
+    a = ActionObject.from_obj(np.arange(4.0))
+    b = ActionObject.from_obj(np.arange(4.0))
+    expression = trace_fused(lambda x, y: np.sqrt(x * y + 1), a, b)
+
+    assert expression.inputs == [a.syft_lineage_id, b.syft_lineage_id]
+    assert expression.constants == [1]
+    assert expression.steps == [
+        ("multiply", [(INPUT, 0), (INPUT, 1)]),
+        ("add", [(STEP, 0), (CONSTANT, 0)]),
+        ("sqrt", [(STEP, 1)]),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [0, 7, 1000])
+def test_fused_evaluate_chunks(chunk_size):
+    a = np.random.rand(10, 10)
+    b = np.random.rand(10, 10)
+    expression = trace_fused(
+        lambda x, y: np.sqrt(x * y + 1),
+        ActionObject.from_obj(a),
+        ActionObject.from_obj(b),
+    )
+
+    result = expression.evaluate([a, b], chunk_size=chunk_size)
+    assert result.shape == (10, 10)
+    assert np.allclose(result, np.sqrt(a * b + 1))
+
+
+def test_fused_evaluate_broadcast():
+    a = np.random.rand(10, 3)
+    b = np.random.rand(3)
+    expression = trace_fused(
+        lambda x, y: x - y, ActionObject.from_obj(a), ActionObject.from_obj(b)
+    )
+
+    assert np.allclose(expression.evaluate([a, b], chunk_size=4), a - b)
+
+
+def test_fused_invalid_expression():
+    a = ActionObject.from_obj(np.arange(4))
+    with pytest.raises(SyftException):
+        trace_fused(lambda x: np.add.reduce(x), a)
+
+    for name in ["eval", "matmul"]:
+        expression = FusedUfuncExpression(
+            inputs=[a.syft_lineage_id, a.syft_lineage_id],
+            constants=[],
+            steps=[(name, [(INPUT, 0), (INPUT, 1)])],
+        )
+        with pytest.raises(SyftException):
+            expression.validate_steps()
+    # a generalized ufunc isn't elementwise
+    with pytest.raises(SyftException):
+        trace_fused(lambda x, y: x @ y, a, a)
+
+
+def test_fused_invalid_constant(worker):
+    service = worker.get_service("actionservice")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    pointer = service.set(context, ActionObject.from_obj(np.arange(4))).ok()
+    for constant in ["1", [1], object()]:
+        expression = FusedUfuncExpression(
+            inputs=[pointer.syft_lineage_id],
+            constants=[constant],
+            steps=[("add", [(INPUT, 0), (CONSTANT, 0)])],
+        )
+        result = service.execute_fused(context, expression)
+        assert isinstance(result, SyftError)
+        assert "Invalid constant" in result.message
+
+
+def test_fuse_local():
+    a = ActionObject.from_obj(np.arange(4.0))
+    result = fuse(lambda x: np.exp(-x) * 2, a)
+
+    assert np.allclose(result.syft_action_data, np.exp(-np.arange(4.0)) * 2)
+
+
+def test_fuse_pointers(root_domain_client):
+    a = np.random.rand(100)
+    b = np.random.rand(100)
+    a_ptr = root_domain_client.api.services.action.set(ActionObject.from_obj(a))
+    b_ptr = root_domain_client.api.services.action.set(ActionObject.from_obj(b))
+
+    result = fuse(lambda x, y: np.sqrt(x * y + 1), a_ptr, b_ptr)
+    assert np.allclose(result.get_from(root_domain_client), np.sqrt(a * b + 1))
+
+
+def test_fuse_twin(worker, root_domain_client):
+    service = worker.get_service("actionservice")
+    twin = TwinObject(private_obj=np.array([1.0, 4.0]), mock_obj=np.array([1.0, 1.0]))
+    root_domain_client.api.services.action.set(twin)
+    pointer = root_domain_client.api.services.action.get_pointer(twin.id)
+
+    result = fuse(lambda x: np.sqrt(x) + 1, pointer)
+    assert result.syft_action_data.tolist() == [2.0, 2.0]
+
+    stored = service.store.get(result.id, worker.signing_key.verify_key).ok()
+    assert stored.private.syft_action_data.tolist() == [2.0, 3.0]
@@ -0,0 +1,155 @@
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.service.action.action_object import Action
+from syft.service.action.action_object import ActionObject
+from syft.service.action.action_service import TwinMode
+from syft.service.action.segmented import SegmentedArray
+from syft.service.action.segmented import SegmentedFrame
+from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftException
+from syft.types.uid import LineageID
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture(params=[0, 2])
+def segment_workers(request):
+    workers = flags.SEGMENT_WORKERS
+    flags.SEGMENT_WORKERS = request.param
+    yield request.param
+    flags.SEGMENT_WORKERS = workers
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "hospital": list("abcabcabca"),
+            "age": np.arange(10),
+            "weight": np.random.rand(10),
+        }
+    )
+
+
+def test_segmented_array(tmp_path, segment_workers):
+    data = np.random.rand(10, 2)
+    segmented = SegmentedArray.from_array(data, 3, str(tmp_path))
+
+    assert len(segmented.paths) == 4
+    assert segmented.shape == data.shape
+    assert segmented.dtype == data.dtype
+    assert np.array_equal(segmented.to_numpy(), data)
+    for op in ["sum", "prod", "min", "max", "any", "all", "mean"]:
+        assert np.isclose(getattr(segmented, op)(), getattr(data, op)())
+
+    result = segmented * 2 + segmented
+    assert isinstance(result, SegmentedArray)
+    assert np.allclose(result.to_numpy(), data * 3)
+    assert (-segmented > -0.5).to_numpy().tolist() == (-data > -0.5).tolist()
+    # the inputs are left as they are
+    assert np.array_equal(segmented.to_numpy(), data)
+
+
+def test_segmented_array_mean_dtype(tmp_path):
+    data = np.random.rand(10) + 1j * np.random.rand(10)
+    result = SegmentedArray.from_array(data, 3, str(tmp_path)).mean()
+
+    assert result.dtype == data.mean().dtype
+    assert np.isclose(result, data.mean())
+
+
+def test_segmented_frame(tmp_path, frame, segment_workers):
+    segmented = SegmentedFrame.from_frame(frame, 3, str(tmp_path))
+
+    assert segmented.columns == list(frame.columns)
+    assert len(segmented) == len(frame)
+    assert segmented.to_pandas().equals(frame)
+    numeric = SegmentedFrame.from_frame(frame[["age", "weight"]], 4)
+    for op in ["sum", "count", "min", "max", "mean"]:
+        assert np.allclose(
+            getattr(numeric, op)(), getattr(frame[["age", "weight"]], op)()
+        )
+    assert (numeric * 2).to_pandas().equals(frame[["age", "weight"]] * 2)
+    assert (numeric - numeric).to_pandas().equals(frame[["age", "weight"]] * 0)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "mean",
+        "sum",
+        ["sum", "mean", "count", "min", "max"],
+        {"age": "max", "weight": "min"},
+        {"age": ["mean", "count"], "weight": "sum"},
+    ],
+)
+def test_segmented_groupby_agg(tmp_path, frame, segment_workers, func):
+    segmented = SegmentedFrame.from_frame(frame, 3, str(tmp_path))
+
+    pd.testing.assert_frame_equal(
+        segmented.groupby("hospital").agg(func), frame.groupby("hospital").agg(func)
+    )
+
+
+def test_segmented_errors(tmp_path, frame):
+    array = SegmentedArray.from_array(np.arange(10), 3, str(tmp_path / "a"))
+    other = SegmentedArray.from_array(np.arange(10), 4, str(tmp_path / "b"))
+    segmented = SegmentedFrame.from_frame(frame, 3, str(tmp_path / "c"))
+
+    with pytest.raises(SyftException):
+        array + other
+    with pytest.raises(SyftException):
+        array + np.arange(10)
+    with pytest.raises(SyftException):
+        segmented.groupby("hospital").agg("median")
+    with pytest.raises(SyftException):
+        SegmentedArray.from_segments(segmented.paths)
+    with pytest.raises(SyftException):
+        SegmentedArray.from_segments([])
+
+
+def test_segmented_serde(tmp_path, frame):
+    segmented = SegmentedFrame.from_frame(frame, 3, str(tmp_path))
+    groupby = segmented.groupby(["hospital"])
+
+    result = sy.deserialize(sy.serialize(groupby, to_bytes=True), from_bytes=True)
+
+    assert result.frame.paths == segmented.paths
+    assert result.by == ["hospital"]
+
+
+def test_execute_segmented(worker, tmp_path, frame):
+    service = worker.get_service("actionservice")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    obj = ActionObject.from_obj(SegmentedFrame.from_frame(frame, 3, str(tmp_path)))
+    service.set(context, obj)
+    by = ActionObject.from_obj("hospital")
+    service.set(context, by)
+    func = ActionObject.from_obj("sum")
+    service.set(context, func)
+
+    groupby = Action(
+        path="syft.service.action.segmented.SegmentedFrame",
+        op="groupby",
+        remote_self=LineageID(obj.id),
+        args=[],
+        kwargs={"by": LineageID(by.id)},
+    )
+    assert service.execute(context, groupby).is_ok()
+
+    agg = Action(
+        path="syft.service.action.segmented.SegmentedGroupBy",
+        op="agg",
+        remote_self=LineageID(groupby.result_id),
+        args=[],
+        kwargs={"func": LineageID(func.id)},
+    )
+    assert service.execute(context, agg).is_ok()
+    result = service.get(context, agg.result_id, TwinMode.NONE)
+    assert result.ok().syft_action_data.equals(frame.groupby("hospital").agg("sum"))
@@ -0,0 +1,227 @@
+# stdlib
+from textwrap import dedent
+from types import SimpleNamespace
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.service.code.partition import COMBINERS
+from syft.service.code.partition import split_partitions
+from syft.service.code.user_code import SubmitUserCode
+from syft.service.code.user_code import SubmitUserCodeV1
+from syft.service.code.user_code import UserCode
+from syft.service.code.user_code import UserCodeV1
+from syft.service.code.user_code import execute_byte_code
+from syft.service.code.user_code import process_code
+from syft.service.response import SyftError
+from syft.service.response import SyftException
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SYFT_OBJECT_VERSION_2
+from syft.types.uid import UID
+from syft.util.experimental_flags import flags
+from syft.util.util import get_spawn_process_pool
+
+SOURCE = dedent(
+    """
+    def total_age(patients, factor):
+        print(len(patients))
+        return patients["age"].sum() * factor
+    """
+)
+
+
+def make_code_item(combine: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=UID(),
+        partition_key="hospital",
+        combine=combine,
+        unique_func_name="user_func_total_age",
+        parsed_code=process_code(
+            raw_code=SOURCE,
+            func_name="user_func_total_age",
+            original_func_name="total_age",
+            input_kwargs=["patients", "factor"],
+        ),
+    )
+
+
+@pytest.fixture
+def patients() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "hospital": ["b", "a", "b", "c", "a"],
+            "age": [10, 20, 30, 40, 50],
+        }
+    )
+
+
+def test_split_partitions(patients):
+    visits = pd.DataFrame({"hospital": ["a", "d"], "visits": [1, 2]})
+    partitions = split_partitions(
+        {"patients": patients, "visits": visits, "factor": 2}, "hospital"
+    )
+
+    assert [key for key, _ in partitions] == ["b", "a", "c", "d"]
+    by_key = dict(partitions)
+    assert by_key["a"]["patients"]["age"].tolist() == [20, 50]
+    assert by_key["a"]["visits"]["visits"].tolist() == [1]
+    # a missing key is an empty frame with the same columns
+    assert by_key["b"]["visits"].empty
+    assert list(by_key["b"]["visits"].columns) == ["hospital", "visits"]
+    assert all(kwargs["factor"] == 2 for _, kwargs in partitions)
+
+    with pytest.raises(SyftException):
+        split_partitions({"patients": patients}, "ward")
+
+
+def test_combiners():
+    assert COMBINERS["sum"]({"a": 1, "b": 2}) == 3
+    assert COMBINERS["dict"]({"a": 1}) == {"a": 1}
+    assert COMBINERS["concat"]({"a": [1], "b": [2, 3]}) == [1, 2, 3]
+    assert (
+        COMBINERS["concat"]({"a": np.array([1]), "b": np.array([2])}) == [1, 2]
+    ).all()
+    with pytest.raises(SyftException):
+        COMBINERS["concat"]({"a": 1, "b": 2})
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_execute_partitioned_byte_code(patients, workers):
+    prev_workers = flags.PARTITION_WORKERS
+    flags.PARTITION_WORKERS = workers
+    try:
+        result = execute_byte_code(
+            make_code_item("dict"), {"patients": patients, "factor": 2}
+        )
+        assert result.result == {"b": 80, "a": 140, "c": 80}
+        assert result.stdout == "2\n2\n1\n"
+
+        result = execute_byte_code(
+            make_code_item("sum"), {"patients": patients, "factor": 2}
+        )
+        assert result.result == patients["age"].sum() * 2
+    finally:
+        flags.PARTITION_WORKERS = prev_workers
+
+
+def test_spawn_process_pool():
+    assert get_spawn_process_pool("test", 0) is None
+
+    pool = get_spawn_process_pool("test", 1)
+    assert get_spawn_process_pool("test", 1) is pool
+    assert get_spawn_process_pool("other", 1) is not pool
+
+    resized = get_spawn_process_pool("test", 2)
+    assert resized is not pool
+    assert resized.submit(abs, -2).result() == 2
+    resized.shutdown()
+    get_spawn_process_pool("other", 1).shutdown()
+
+
+def test_syft_function_partition_key():
+    @sy.syft_function(
+        input_policy=sy.ExactMatch(),
+        output_policy=sy.SingleExecutionExactOutput(),
+        partition_key="hospital",
+        combine="sum",
+    )
+    def func(patients):
+        return len(patients)
+
+    assert func.partition_key == "hospital"
+    assert func.combine == "sum"
+
+    with pytest.raises(SyftException):
+        sy.syft_function(
+            input_policy=sy.ExactMatch(),
+            output_policy=sy.SingleExecutionExactOutput(),
+            partition_key="hospital",
+            combine="median",
+        )
+
+
+def test_user_code_migrate_v1(worker, patients):
+    client = worker.root_client
+    dataset = sy.Dataset(
+        name="patients",
+        asset_list=[
+            sy.Asset(name="patients", data=patients, mock=patients, mock_is_real=False)
+        ],
+    )
+    client.upload_dataset(dataset)
+
+    @sy.syft_function(
+        input_policy=sy.ExactMatch(patients=client.datasets[0].assets[0]),
+        output_policy=sy.SingleExecutionExactOutput(),
+        partition_key="hospital",
+        combine="sum",
+    )
+    def func(patients):
+        return len(patients)
+
+    old = func.migrate_to(SYFT_OBJECT_VERSION_1)
+    assert isinstance(old, SubmitUserCodeV1)
+    assert "partition_key" not in old.__fields__
+    new = old.migrate_to(SYFT_OBJECT_VERSION_2)
+    assert isinstance(new, SubmitUserCode)
+    assert (new.code, new.partition_key, new.combine) == (func.code, None, None)
+
+    func.code = dedent(func.code)
+    assert client.api.services.code.request_code_execution(func)
+    user_code = client.api.services.code.get_all()[0]
+    assert (user_code.partition_key, user_code.combine) == ("hospital", "sum")
+
+    old = user_code.migrate_to(SYFT_OBJECT_VERSION_1)
+    assert isinstance(old, UserCodeV1)
+    new = old.migrate_to(SYFT_OBJECT_VERSION_2)
+    assert isinstance(new, UserCode)
+    assert new.code_hash == user_code.code_hash
+    assert (new.partition_key, new.combine) == (None, None)
+
+
+def test_partitioned_code_through_node(worker, patients):
+    client = worker.root_client
+    dataset = sy.Dataset(
+        name="patients",
+        asset_list=[
+            sy.Asset(name="patients", data=patients, mock=patients, mock_is_real=False)
+        ],
+    )
+    client.upload_dataset(dataset)
+    asset = client.datasets[0].assets[0]
+
+    @sy.syft_function(
+        input_policy=sy.ExactMatch(patients=asset),
+        output_policy=sy.SingleExecutionExactOutput(),
+        partition_key="hospital",
+        combine="dict",
+    )
+    def ages(patients):
+        return int(patients["age"].sum())
+
+    @sy.syft_function(
+        input_policy=sy.ExactMatch(patients=asset),
+        output_policy=sy.SingleExecutionExactOutput(),
+        partition_key="ward",
+        combine="dict",
+    )
+    def wards(patients):
+        return len(patients)
+
+    for func in [ages, wards]:
+        func.code = dedent(func.code)
+        assert client.api.services.code.request_code_execution(func)
+    for request in client.api.services.request.get_all():
+        request.approve()
+
+    result = client.api.services.code.ages(patients=asset)
+    assert result.syft_action_data == {"b": 40, "a": 70, "c": 40}
+
+    # the error of a partition comes back like the error of any other code
+    result = client.api.services.code.wards(patients=asset)
+    assert isinstance(result, SyftError)
+    assert "ward" in result.message
@@ -0,0 +1,206 @@
+# stdlib
+from typing import Any
+from typing import List
+from typing import Optional
+
+# third party
+from faker import Faker
+import gevent
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.client.api import SyftAPIData
+from syft.node.credentials import SyftSigningKey
+from syft.service.queue.queue_manager import QueueConfig
+from syft.service.queue.queue_manager import QueueManager
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import Status
+from syft.service.response import SyftSuccess
+from syft.service.user.user_roles import ServiceRole
+from syft.types.uid import UID
+
+
+class FakeTask:
+    """Stand in for queue_task which runs the call in this process."""
+
+    def __init__(self, worker: Any, failures: int = 0) -> None:
+        self.worker = worker
+        self.failures = failures
+        self.calls: List[str] = []
+
+    def __call__(
+        self, api_call: Any, worker_settings: Any, task_uid: UID, blocking: bool
+    ) -> Optional[Any]:
+        gevent.sleep(0)
+        self.calls.append(api_call.message.path)
+        if self.failures > 0:
+            # the worker process died
+            self.failures -= 1
+            return None
+
+        if blocking:
+            return SyftAPIData(data=api_call.message.path)
+        item = QueueItem(
+            node_uid=self.worker.id,
+            id=task_uid,
+            result=api_call.message.path,
+            resolved=True,
+            status=Status.COMPLETED,
+        )
+        self.worker.queue_stash.set_result(self.worker.signing_key.verify_key, item)
+        return None
+
+
+def make_call(worker: Any, path: str, blocking: bool = False) -> Any:
+    call = SyftAPICall(
+        node_uid=worker.id, path=path, args=[], kwargs={}, blocking=blocking
+    )
+    return call.sign(SyftSigningKey.generate())
+
+
+def make_manager(worker: Any, task: FakeTask, **kwargs: Any) -> QueueManager:
+    return QueueManager(
+        node=worker, stash=worker.queue_stash, task=task, config=QueueConfig(**kwargs)
+    )
+
+
+def get_item(worker: Any, uid: UID) -> QueueItem:
+    return worker.queue_stash.get_by_uid(worker.signing_key.verify_key, uid).ok()
+
+
+def test_queue_backlog_rejects(worker) -> None:
+    manager = make_manager(worker, FakeTask(worker), max_concurrency=1, max_backlog=1)
+
+    assert manager.submit(make_call(worker, "a"), ServiceRole.GUEST).is_ok()
+    assert manager.submit(make_call(worker, "b"), ServiceRole.GUEST).is_ok()
+    assert manager.submit(make_call(worker, "c"), ServiceRole.GUEST).is_err()
+
+    gevent.sleep(0.1)
+    assert manager.backlog == 0
+    assert manager.submit(make_call(worker, "c"), ServiceRole.GUEST).is_ok()
+
+
+def test_queue_role_priority(worker) -> None:
+    task = FakeTask(worker)
+    manager = make_manager(worker, task, max_concurrency=1)
+
+    items = [
+        manager.submit(make_call(worker, "first"), ServiceRole.GUEST).ok(),
+        manager.submit(make_call(worker, "guest"), ServiceRole.GUEST).ok(),
+        manager.submit(make_call(worker, "admin"), ServiceRole.ADMIN).ok(),
+    ]
+    gevent.sleep(0.1)
+
+    assert task.calls == ["first", "admin", "guest"]
+    for item in items:
+        stored = get_item(worker, item.id)
+        assert stored.status is Status.COMPLETED
+
+
+def test_queue_cancel_pending(worker) -> None:
+    task = FakeTask(worker)
+    manager = make_manager(worker, task, max_concurrency=1)
+
+    manager.submit(make_call(worker, "first"), ServiceRole.GUEST)
+    item = manager.submit(make_call(worker, "cancelled"), ServiceRole.GUEST).ok()
+    assert manager.cancel(item.id).is_ok()
+    gevent.sleep(0.1)
+
+    assert task.calls == ["first"]
+    stored = get_item(worker, item.id)
+    assert stored.status is Status.INTERRUPTED
+    assert stored.resolved
+    assert manager.cancel(item.id).is_err()
+
+
+def test_queue_retry_blocking(worker) -> None:
+    task = FakeTask(worker, failures=1)
+    manager = make_manager(worker, task, max_retries=1)
+
+    item = manager.submit(make_call(worker, "retry", blocking=True), ServiceRole.GUEST)
+    api_data = manager.wait(item.ok().id)
+
+    assert task.calls == ["retry", "retry"]
+    assert api_data.data == "retry"
+
+
+def test_queue_errored_after_retries(worker) -> None:
+    task = FakeTask(worker, failures=2)
+    manager = make_manager(worker, task, max_retries=1)
+
+    item = manager.submit(make_call(worker, "fail"), ServiceRole.GUEST).ok()
+    gevent.sleep(0.1)
+
+    stored = get_item(worker, item.id)
+    assert stored.status is Status.ERRORED
+    assert stored.resolved
+
+
+def test_queue_recover(worker) -> None:
+    api_call = make_call(worker, "recovered")
+    # dispatched once before the node stopped
+    item = QueueItem(
+        id=UID(),
+        node_uid=worker.id,
+        status=Status.PROCESSING,
+        attempts=1,
+        api_call=api_call,
+    )
+    worker.queue_stash.set_placeholder(worker.signing_key.verify_key, item)
+
+    task = FakeTask(worker)
+    manager = make_manager(worker, task, max_retries=1)
+    assert manager.recover().ok() == 1
+    gevent.sleep(0.1)
+
+    assert task.calls == ["recovered"]
+    assert get_item(worker, item.id).status is Status.COMPLETED
+
+
+def test_queue_recover_errored_after_retries(worker) -> None:
+    # a job which stopped the node every time it ran
+    item = QueueItem(
+        id=UID(),
+        node_uid=worker.id,
+        status=Status.PROCESSING,
+        attempts=2,
+        api_call=make_call(worker, "crashes"),
+    )
+    worker.queue_stash.set_placeholder(worker.signing_key.verify_key, item)
+
+    task = FakeTask(worker)
+    manager = make_manager(worker, task, max_retries=1)
+    assert manager.recover().ok() == 0
+    gevent.sleep(0.1)
+
+    assert task.calls == []
+    stored = get_item(worker, item.id)
+    assert stored.status is Status.ERRORED
+    assert stored.resolved
+
+
+def test_queue_cancel_through_node() -> None:
+    node = sy.Worker.named(name=Faker().name(), processes=1)
+
+    def hung_task(*args: Any) -> None:
+        gevent.sleep(60)
+
+    # the first job never ends, so the second one stays queued
+    node.queue_manager.task = hung_task
+    signing_key = node.signing_key
+    items = [
+        node.handle_api_call(make_call(node, "user.get_all").message.sign(signing_key))
+        for _ in range(2)
+    ]
+    running, queued = [item.message.data for item in items]
+    assert get_item(node, queued.id).status is Status.CREATED
+
+    # answered by the node itself, which knows its jobs
+    for job in [queued, running]:
+        cancel = SyftAPICall(
+            node_uid=node.id, path="queue.cancel", args=[], kwargs={"uid": job.id}
+        )
+        result = node.handle_api_call(cancel.sign(signing_key)).message.data
+        assert isinstance(result, SyftSuccess), result
+        assert get_item(node, job.id).status is Status.INTERRUPTED
@@ -0,0 +1,143 @@
+# stdlib
+import multiprocessing
+import os
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.client.api import SyftAPICall
+from syft.node.node import gipc_decoder
+from syft.node.node import gipc_encoder
+from syft.node.node import task_producer
+from syft.serde.shared_memory import SHARED_ARRAY_PREFIX
+from syft.serde.shared_memory import SHARED_MEMORY_DIR
+from syft.serde.shared_memory import share_arrays
+from syft.serde.shared_memory import task_array_prefix
+from syft.serde.shared_memory import unlink_shared_arrays
+from syft.service.action.action_object import ActionObject
+from syft.types.uid import UID
+from syft.util.experimental_flags import flags
+
+
+@pytest.fixture
+def min_bytes():
+    prev_min_bytes = flags.SHARED_MEMORY_MIN_BYTES
+    flags.SHARED_MEMORY_MIN_BYTES = 1024
+    yield
+    flags.SHARED_MEMORY_MIN_BYTES = prev_min_bytes
+
+
+def shared_files():
+    return {
+        f for f in os.listdir(SHARED_MEMORY_DIR) if f.startswith(SHARED_ARRAY_PREFIX)
+    }
+
+
+def decode_sum(blob, queue):
+    queue.put(float(gipc_decoder(blob).syft_action_data.sum()))
+
+
+def test_shared_memory_roundtrip(min_bytes):
+    before = shared_files()
+    large = np.arange(1024, dtype=np.float32).reshape(32, 32).T
+    small = np.arange(8)
+
+    blob = gipc_encoder([large, small])
+    # only a handle of the large array is in the message
+    assert len(blob) < large.nbytes
+    assert len(shared_files() - before) == 1
+
+    result = gipc_decoder(blob)
+    assert (result[0] == large).all()
+    assert result[0].dtype == large.dtype
+    assert (result[1] == small).all()
+    assert shared_files() == before
+
+    # the mapping is private to the receiver
+    result[0][0, 0] = -1
+    assert result[0][0, 0] == -1
+
+
+def test_shared_memory_handle_needs_pipe(min_bytes):
+    with share_arrays():
+        blob = sy.serialize(np.zeros(1024), to_bytes=True)
+
+    with pytest.raises(Exception):
+        sy.deserialize(blob, from_bytes=True)
+
+    with share_arrays():
+        assert (sy.deserialize(blob, from_bytes=True) == 0).all()
+
+    # outside of the pipe arrays are serialized as usual
+    before = shared_files()
+    blob = sy.serialize(np.zeros(1024), to_bytes=True)
+    assert shared_files() == before
+    assert (sy.deserialize(blob, from_bytes=True) == 0).all()
+
+
+def test_shared_memory_between_processes(min_bytes):
+    data = np.random.rand(4096)
+    blob = gipc_encoder(ActionObject.from_obj(data))
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=decode_sum, args=(blob, queue))
+    process.start()
+    assert queue.get(timeout=60) == pytest.approx(data.sum())
+    process.join()
+
+
+class RecordingPipe:
+    def __init__(self):
+        self.sent = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def put(self, obj):
+        self.sent.append(obj)
+
+    def close(self):
+        pass
+
+
+def test_shared_memory_signed_call(min_bytes, worker):
+    data = np.random.rand(4096)
+    call = SyftAPICall(
+        node_uid=worker.id, path="action.np_array", args=[], kwargs={"data": data}
+    )
+    pipe = RecordingPipe()
+    task_producer(pipe, call.sign(worker.signing_key), blocking=False)
+
+    before = shared_files()
+    prefix = task_array_prefix(UID())
+    blob = gipc_encoder(pipe.sent[0], prefix=prefix)
+    assert len(blob) < data.nbytes
+    created = shared_files() - before
+    assert len(created) == 1
+    assert created.pop().startswith(prefix)
+
+    credentials, api_call = gipc_decoder(blob)
+    assert credentials == worker.signing_key.verify_key
+    assert (api_call.kwargs["data"] == data).all()
+    assert shared_files() == before
+
+
+def test_shared_memory_unlink_unreceived(min_bytes):
+    before = shared_files()
+    prefix = task_array_prefix(UID())
+    gipc_encoder(np.zeros(1024), prefix=prefix)
+    gipc_encoder(np.zeros(1024))
+    assert len(shared_files() - before) == 2
+
+    # the receiver died, only the arrays of its task are removed
+    assert unlink_shared_arrays(prefix) == 1
+    left = shared_files() - before
+    assert len(left) == 1
+    os.unlink(os.path.join(SHARED_MEMORY_DIR, left.pop()))
@@ -137,3 +137,31 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_action_store"),
+        pytest.lazy_fixture("sqlite_action_store"),
+    ],
+)
+@pytest.mark.flaky(reruns=3, reruns_delay=1)
+def test_action_store_test_data_get_many(store: Any):
+    client_key = SyftVerifyKey.from_string(test_verify_key_string_client)
+    root_key = SyftVerifyKey.from_string(test_verify_key_string_root)
+    hacker_key = SyftVerifyKey.from_string(test_verify_key_string_hacker)
+
+    uids = [UID() for _ in range(3)]
+    objs = [MockSyftObject(data=idx) for idx in range(3)]
+    for uid, obj in zip(uids, objs):
+        assert store.set(uid, client_key, obj).is_ok()
+
+    # order and duplicates are kept
+    res = store.get_many([uids[2], uids[0], uids[2]], client_key)
+    assert res.is_ok()
+    assert res.ok() == [objs[2], objs[0], objs[2]]
+
+    assert store.get_many(uids, root_key).ok() == objs
+    assert store.get_many(uids, hacker_key).is_err()
+    assert store.get_many([*uids, UID()], root_key).is_err()
@@ -2,6 +2,7 @@
 from threading import Thread
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
 from syft.store.dict_document_store import DictStorePartition
 from syft.store.document_store import QueryKeys
 
@@ -88,6 +89,77 @@ def test_dict_store_partition_set(
         )
 
 
+def test_dict_store_partition_set_many(
+    root_verify_key,
+    dict_store_partition: DictStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=idx) for idx in range(10)]
+    res = dict_store_partition.set_many(root_verify_key, objs)
+    assert res.is_ok()
+    assert res.ok() == objs
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 10
+    stored = dict_store_partition.get_all_from_store(
+        root_verify_key, dict_store_partition.store_query_keys(objs[:3])
+    )
+    assert sorted(obj.data for obj in stored.ok()) == [0, 1, 2]
+
+    # nothing is written when a duplicate isn't ignored
+    new_objs = [MockSyftObject(data=10), objs[0]]
+    res = dict_store_partition.set_many(root_verify_key, new_objs)
+    assert res.is_err()
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 10
+
+    res = dict_store_partition.set_many(
+        root_verify_key, new_objs, ignore_duplicates=True
+    )
+    assert res.is_ok()
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 11
+
+    # the objects can be updated and deleted like the ones set one by one
+    obj = objs[1]
+    res = dict_store_partition.delete(
+        root_verify_key, dict_store_partition.store_query_key(obj)
+    )
+    assert res.is_ok()
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 10
+
+
+def test_dict_store_partition_delete_update_where(
+    root_verify_key,
+    dict_store_partition: DictStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=idx) for idx in range(10)]
+    res = dict_store_partition.set_many(root_verify_key, objs)
+    assert res.is_ok()
+
+    qks = QueryKeys(qks=[dict_store_partition.store_query_key(obj) for obj in objs[:5]])
+    res = dict_store_partition.update_where(root_verify_key, qks, {"data": "updated"})
+    assert res.ok() == 5
+    stored = dict_store_partition.all(root_verify_key).ok()
+    assert sorted(str(obj.data) for obj in stored).count("updated") == 5
+
+    # unique keys can't be set to the same value on many objects
+    res = dict_store_partition.update_where(root_verify_key, qks, {"id": objs[0].id})
+    assert res.is_err()
+
+    # nothing is deleted when one of the objects can't be written
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    res = dict_store_partition.delete_where(guest_verify_key, qks)
+    assert res.is_err()
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 10
+
+    res = dict_store_partition.delete_where(root_verify_key, qks)
+    assert res.ok() == 5
+    assert len(dict_store_partition.all(root_verify_key).ok()) == 10 - 5
+    assert all(
+        obj.data != "updated" for obj in dict_store_partition.all(root_verify_key).ok()
+    )
+
+    # the objects which are gone don't match anymore
+    res = dict_store_partition.delete_where(root_verify_key, qks)
+    assert res.ok() == 0
+
+
 def test_dict_store_partition_delete(
     root_verify_key, dict_store_partition: DictStorePartition
 ) -> None:
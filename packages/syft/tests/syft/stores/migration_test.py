@@ -0,0 +1,161 @@
+# stdlib
+from pathlib import Path
+from typing import Tuple
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import rs_object2proto
+from syft.serde.serializable import serializable
+from syft.store.document_store import BaseUIDStoreStash
+from syft.store.document_store import PartitionSettings
+from syft.store.migration import MigrationProgressStash
+from syft.store.migration import PartitionMigrator
+from syft.types.syft_migration import migrate
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SYFT_OBJECT_VERSION_2
+from syft.types.syft_object import SyftMigrationRegistry
+from syft.types.syft_object import SyftObject
+from syft.types.transforms import drop
+from syft.types.transforms import make_set_default
+from syft.types.uid import UID
+
+# relative
+from .store_fixtures_test import dict_document_store_fn
+from .store_fixtures_test import sqlite_document_store_fn
+
+
+@serializable()
+class MigrationMockV1(SyftObject):
+    __canonical_name__ = "MigrationMock"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    id: UID
+    name: str
+
+
+@serializable()
+class MigrationMock(SyftObject):
+    __canonical_name__ = "MigrationMock"
+    __version__ = SYFT_OBJECT_VERSION_2
+
+    id: UID
+    name: str
+    priority: int
+
+
+@migrate(MigrationMockV1, MigrationMock)
+def upgrade_migration_mock_v1_to_v2():
+    return [make_set_default("priority", 0)]
+
+
+@migrate(MigrationMock, MigrationMockV1)
+def downgrade_migration_mock_v2_to_v1():
+    return [drop(["priority"])]
+
+
+def stash_of(object_type: type):
+    class MigrationMockStash(BaseUIDStoreStash):
+        settings = PartitionSettings(
+            name=object_type.__canonical_name__, object_type=object_type
+        )
+
+    MigrationMockStash.object_type = object_type
+    return MigrationMockStash
+
+
+MigrationMockV1Stash = stash_of(MigrationMockV1)
+MigrationMockStash = stash_of(MigrationMock)
+
+
+def test_migrate_to_and_back() -> None:
+    old = MigrationMockV1(name="old")
+
+    new = old.migrate_to(SYFT_OBJECT_VERSION_2)
+    assert isinstance(new, MigrationMock)
+    assert (new.id, new.name, new.priority) == (old.id, "old", 0)
+    assert new.migrate_to(SYFT_OBJECT_VERSION_1) == old
+
+    with pytest.raises(ValueError):
+        SyftMigrationRegistry.get_migration_path("MigrationMock", 1, 3)
+
+
+def test_deserialize_older_version() -> None:
+    old = MigrationMockV1(name="old")
+    # as if the class was renamed after the object was stored
+    proto = rs_object2proto(old)
+    proto.fullyQualifiedName = f"{MigrationMock.__module__}.MigrationMock"
+
+    obj = sy.deserialize(proto.to_bytes(), from_bytes=True)
+    assert type(obj) is MigrationMockV1
+    assert obj == old
+
+
+def check_migrated_on_read(root_verify_key, store) -> None:
+    old_stash = MigrationMockV1Stash(store=store)
+    olds = [MigrationMockV1(name=f"old {i}") for i in range(5)]
+    for old in olds:
+        assert old_stash.set(root_verify_key, old).is_ok()
+
+    stash = MigrationMockStash(store=store)
+    objs = stash.get_all(root_verify_key).ok()
+    assert sorted(obj.id for obj in objs) == sorted(old.id for old in olds)
+    assert all(type(obj) is MigrationMock and obj.priority == 0 for obj in objs)
+
+    new = stash.get_by_uid(root_verify_key, olds[0].id).ok()
+    assert type(new) is MigrationMock and new.name == "old 0"
+
+
+def test_migrate_on_read_dict(root_verify_key) -> None:
+    check_migrated_on_read(root_verify_key, dict_document_store_fn(root_verify_key))
+
+
+def test_migrate_on_read_sqlite(
+    root_verify_key, sqlite_workspace: Tuple[Path, str]
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    check_migrated_on_read(root_verify_key, store)
+
+
+def test_partition_migrator_resumes(
+    root_verify_key, sqlite_workspace: Tuple[Path, str], monkeypatch
+) -> None:
+    store = sqlite_document_store_fn(root_verify_key, sqlite_workspace)
+    old_stash = MigrationMockV1Stash(store=store)
+    olds = [MigrationMockV1(name=f"old {i}") for i in range(7)]
+    for old in olds:
+        assert old_stash.set(root_verify_key, old).is_ok()
+
+    stash = MigrationMockStash(store=store)
+    progress_stash = MigrationProgressStash(store=store)
+    migrator = PartitionMigrator(stash, progress_stash, chunk_size=3)
+
+    # interrupt the migration in the second chunk
+    fail_id = sorted(old.id for old in olds)[4]
+    migrate_obj = stash.migrate
+
+    def interrupted(obj):
+        if obj.id == fail_id:
+            raise RuntimeError("interrupted")
+        return migrate_obj(obj)
+
+    def read_all(*args, **kwargs):
+        raise AssertionError("the partition is read in chunks")
+
+    monkeypatch.setattr(stash, "migrate", interrupted)
+    monkeypatch.setattr(stash.partition, "_all", read_all)
+    assert migrator.run().is_err()
+    progress = progress_stash.get_by_partition(root_verify_key, "MigrationMock").ok()
+    assert progress.migrated == 3 and not progress.completed
+
+    monkeypatch.setattr(stash, "migrate", migrate_obj)
+    progress = migrator.run().ok()
+    monkeypatch.undo()
+    # the object rewritten before the interruption is already up to date
+    assert progress.migrated == 6 and progress.completed
+
+    stored = stash.partition.all(root_verify_key).ok()
+    assert len(stored) == 7
+    assert all(type(obj) is MigrationMock for obj in stored)
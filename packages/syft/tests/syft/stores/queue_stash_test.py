@@ -1,6 +1,7 @@
 # stdlib
 import sys
 from threading import Thread
+import time
 from typing import Any
 
 # third party
@@ -8,6 +9,15 @@ from joblib import Parallel
 from joblib import delayed
 import pytest
 
+# syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.queue.queue_stash import QueueItem
+from syft.service.queue.queue_stash import QueueItemV1
+from syft.service.queue.queue_stash import Status
+from syft.types.syft_object import SYFT_OBJECT_VERSION_2
+from syft.types.uid import UID
+
 # relative
 from .store_fixtures_test import mongo_queue_stash_fn
 from .store_fixtures_test import sqlite_queue_stash_fn
@@ -568,3 +578,155 @@ def test_queue_delete_threading_mongo(mongo_document_store, backend):
         return mongo_queue_stash_fn(mongo_document_store)
 
     backend(create_queue_cbk)
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("dict_queue_stash"),
+        pytest.lazy_fixture("sqlite_queue_stash"),
+    ],
+)
+def test_queue_pop_keeps_unresolved(root_verify_key, queue: Any) -> None:
+    item = QueueItem(id=UID(), node_uid=UID())
+    res = queue.set_placeholder(root_verify_key, item)
+    assert res.is_ok()
+
+    popped = queue.pop(root_verify_key, item.id)
+    assert popped.is_ok()
+    assert popped.ok().resolved is False
+    assert len(queue) == 1
+
+    item.result = 1
+    item.resolved = True
+    res = queue.set_result(root_verify_key, item)
+    assert res.is_ok()
+    assert len(queue) == 1
+
+    popped = queue.pop(root_verify_key, item.id)
+    assert popped.ok().result == 1
+    assert len(queue) == 0
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("dict_queue_stash"),
+        pytest.lazy_fixture("sqlite_queue_stash"),
+    ],
+)
+def test_queue_get_by_status(root_verify_key, queue: Any) -> None:
+    # other objects in the partition don't have a status
+    assert queue.set(root_verify_key, MockSyftObject(data=0)).is_ok()
+    created = QueueItem(id=UID(), node_uid=UID())
+    processing = [
+        QueueItem(id=UID(), node_uid=UID(), status=Status.PROCESSING) for _ in range(2)
+    ]
+    for item in [created] + processing:
+        assert queue.set(root_verify_key, item).is_ok()
+
+    res = queue.get_by_status(root_verify_key, Status.PROCESSING)
+    assert {item.id for item in res.ok()} == {item.id for item in processing}
+
+    processing[0].status = Status.COMPLETED
+    assert queue.update(root_verify_key, processing[0]).is_ok()
+    res = queue.get_by_status(root_verify_key, Status.PROCESSING)
+    assert [item.id for item in res.ok()] == [processing[1].id]
+    res = queue.get_by_status(root_verify_key, Status.CREATED)
+    assert [item.id for item in res.ok()] == [created.id]
+
+
+def test_queue_item_migrate_v1() -> None:
+    old = QueueItemV1(node_uid=UID(), result=1, resolved=True)
+    new = old.migrate_to(SYFT_OBJECT_VERSION_2)
+    assert isinstance(new, QueueItem)
+    assert new.status is Status.COMPLETED
+    assert (new.id, new.result, new.priority, new.attempts) == (old.id, 1, 0, 0)
+
+    pending = QueueItemV1(node_uid=UID()).migrate_to(SYFT_OBJECT_VERSION_2)
+    assert pending.status is Status.CREATED
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("dict_queue_stash"),
+        pytest.lazy_fixture("sqlite_queue_stash"),
+    ],
+)
+def test_queue_set_result_permissions_on_update(root_verify_key, queue: Any) -> None:
+    item = QueueItem(id=UID(), node_uid=UID())
+    queue.set_placeholder(root_verify_key, item)
+
+    user_verify_key = SyftSigningKey.generate().verify_key
+    assert queue.get_by_uid(user_verify_key, item.id).ok() is None
+
+    item.result = 1
+    item.resolved = True
+    res = queue.set_result(
+        root_verify_key,
+        item,
+        add_permissions=[ActionObjectREAD(uid=item.id, credentials=user_verify_key)],
+    )
+    assert res.is_ok()
+    assert queue.get_by_uid(user_verify_key, item.id).ok().result == 1
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("dict_queue_stash"),
+        pytest.lazy_fixture("sqlite_queue_stash"),
+    ],
+)
+def test_queue_wait_for_result(root_verify_key, queue: Any) -> None:
+    item = QueueItem(id=UID(), node_uid=UID())
+    queue.set_placeholder(root_verify_key, item)
+
+    res = queue.wait_for_result(root_verify_key, item.id, timeout=0.1)
+    assert res.is_ok()
+    assert res.ok().resolved is False
+
+    def set_result() -> None:
+        time.sleep(0.2)
+        resolved = QueueItem(id=item.id, node_uid=item.node_uid, result=1)
+        resolved.resolved = True
+        queue.set_result(root_verify_key, resolved)
+
+    thread = Thread(target=set_result)
+    start = time.monotonic()
+    thread.start()
+    # the poll interval is longer than the test so only the notification can
+    # wake up the waiter in time
+    res = queue.wait_for_result(root_verify_key, item.id, timeout=10, poll_interval=10)
+    thread.join()
+
+    assert time.monotonic() - start < 5
+    assert res.ok().resolved is True
+    assert res.ok().result == 1
+
+
+@pytest.mark.parametrize(
+    "queue",
+    [
+        pytest.lazy_fixture("dict_queue_stash"),
+        pytest.lazy_fixture("sqlite_queue_stash"),
+    ],
+)
+def test_queue_pop_with_read_permission(root_verify_key, queue: Any) -> None:
+    user_verify_key = SyftSigningKey.generate().verify_key
+    item = QueueItem(id=UID(), node_uid=UID(), result=1, resolved=True)
+    res = queue.set_result(
+        root_verify_key,
+        item,
+        add_permissions=[ActionObjectREAD(uid=item.id, credentials=user_verify_key)],
+    )
+    assert res.is_ok()
+
+    other_verify_key = SyftSigningKey.generate().verify_key
+    assert queue.pop(other_verify_key, item.id).ok() is None
+    assert len(queue) == 1
+
+    popped = queue.pop(user_verify_key, item.id)
+    assert popped.ok().result == 1
+    assert len(queue) == 0
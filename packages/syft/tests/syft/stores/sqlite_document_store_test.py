@@ -8,6 +8,7 @@ from joblib import delayed
 import pytest
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
 from syft.store.document_store import QueryKeys
 from syft.store.sqlite_document_store import SQLiteStorePartition
 
@@ -95,6 +96,80 @@ def test_sqlite_store_partition_set(
         )
 
 
+def test_sqlite_store_partition_set_many(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=idx) for idx in range(REPEATS)]
+    res = sqlite_store_partition.set_many(root_verify_key, objs)
+    assert res.is_ok()
+    assert res.ok() == objs
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+    stored = sqlite_store_partition.get_all_from_store(
+        root_verify_key, sqlite_store_partition.store_query_keys(objs[:3])
+    )
+    assert sorted(obj.data for obj in stored.ok()) == [0, 1, 2]
+
+    # nothing is written when a duplicate isn't ignored
+    new_objs = [MockSyftObject(data=REPEATS), objs[0]]
+    res = sqlite_store_partition.set_many(root_verify_key, new_objs)
+    assert res.is_err()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+
+    res = sqlite_store_partition.set_many(
+        root_verify_key, new_objs, ignore_duplicates=True
+    )
+    assert res.is_ok()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS + 1
+
+    # the objects can be updated and deleted like the ones set one by one
+    obj = objs[1]
+    res = sqlite_store_partition.delete(
+        root_verify_key, sqlite_store_partition.store_query_key(obj)
+    )
+    assert res.is_ok()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+
+
+def test_sqlite_store_partition_delete_update_where(
+    root_verify_key,
+    sqlite_store_partition: SQLiteStorePartition,
+) -> None:
+    objs = [MockSyftObject(data=idx) for idx in range(REPEATS)]
+    res = sqlite_store_partition.set_many(root_verify_key, objs)
+    assert res.is_ok()
+
+    qks = QueryKeys(
+        qks=[sqlite_store_partition.store_query_key(obj) for obj in objs[:5]]
+    )
+    res = sqlite_store_partition.update_where(root_verify_key, qks, {"data": "updated"})
+    assert res.ok() == 5
+    stored = sqlite_store_partition.all(root_verify_key).ok()
+    assert sorted(str(obj.data) for obj in stored).count("updated") == 5
+
+    # unique keys can't be set to the same value on many objects
+    res = sqlite_store_partition.update_where(root_verify_key, qks, {"id": objs[0].id})
+    assert res.is_err()
+
+    # nothing is deleted when one of the objects can't be written
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    res = sqlite_store_partition.delete_where(guest_verify_key, qks)
+    assert res.is_err()
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS
+
+    res = sqlite_store_partition.delete_where(root_verify_key, qks)
+    assert res.ok() == 5
+    assert len(sqlite_store_partition.all(root_verify_key).ok()) == REPEATS - 5
+    assert all(
+        obj.data != "updated"
+        for obj in sqlite_store_partition.all(root_verify_key).ok()
+    )
+
+    # the objects which are gone don't match anymore
+    res = sqlite_store_partition.delete_where(root_verify_key, qks)
+    assert res.ok() == 0
+
+
 @pytest.mark.flaky(reruns=3, reruns_delay=1)
 def test_sqlite_store_partition_delete(
     root_verify_key,
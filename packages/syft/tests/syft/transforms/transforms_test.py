@@ -10,6 +10,7 @@ import pytest
 # syft absolute
 from syft.types import transforms
 from syft.types.syft_object import SyftBaseObject
+from syft.types.syft_object import SyftObject
 from syft.types.syft_object import SyftObjectRegistry
 from syft.types.transforms import TransformContext
 from syft.types.transforms import validate_klass_and_version
@@ -186,3 +187,66 @@ def test_transform_method(monkeypatch):
     assert resultant_func() == mock_method()
     assert mapping_key in mock_syft_transform_registry
     assert mock_syft_transform_registry[mapping_key] == mock_wrapper
+
+
+def test_compile_transforms_fuses_dict_ops():
+    obj = MockObjectFromSyftBaseObj(value=1)
+
+    def add_extra(context: TransformContext) -> TransformContext:
+        context.output["extra"] = context.output.get("renamed")
+        return context
+
+    steps = [
+        transforms.make_set_default("flag", True),
+        transforms.rename("value", "renamed"),
+        add_extra,
+        transforms.drop(["flag"]),
+        transforms.make_set_default("missing", 0),
+        transforms.keep(["renamed", "extra", "missing", "absent"]),
+    ]
+    compiled = transforms.compile_transforms(steps)
+    # the dict ops around add_extra are fused into one step each
+    assert len(compiled) == 3
+    assert compiled[1] is add_extra
+
+    def run(pipeline: List[Callable]) -> dict:
+        context = TransformContext.from_context(obj=obj)
+        for step in pipeline:
+            context = step(context)
+        return context.output
+
+    assert run(compiled) == run(steps)
+    assert run(compiled) == {"renamed": 1, "extra": 1, "missing": 0, "absent": None}
+
+
+def test_get_transform_cache():
+    class MockCacheFrom(SyftObject):
+        __canonical_name__ = "MockCacheFrom"
+        __version__ = 1
+
+    def first(self, context=None):
+        return "first"
+
+    def second(self, context=None):
+        return "second"
+
+    SyftObjectRegistry.add_transform(
+        "MockCacheFrom", 1, "MockObjectToSyftBaseObj", 1, first
+    )
+    assert (
+        SyftObjectRegistry.get_transform(MockCacheFrom, MockObjectToSyftBaseObj)
+        is first
+    )
+    # cached per pair of classes
+    assert (MockCacheFrom, MockObjectToSyftBaseObj) in (
+        SyftObjectRegistry.__object_transform_cache__
+    )
+
+    # registering a transform invalidates the cache
+    SyftObjectRegistry.add_transform(
+        "MockCacheFrom", 1, "MockObjectToSyftBaseObj", 1, second
+    )
+    assert (
+        SyftObjectRegistry.get_transform(MockCacheFrom, MockObjectToSyftBaseObj)
+        is second
+    )
@@ -0,0 +1,123 @@
+# stdlib
+from enum import Enum
+import typing
+from typing import Any
+from typing import Dict
+from typing import Type
+
+# third party
+from pydantic import BaseModel
+from pydantic import EmailStr
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.node.credentials import SyftVerifyKey
+from syft.serde.recursive import TYPE_BANK
+from syft.serde.recursive import trusted_deserialize
+from syft.types.datetime import DateTime
+from syft.types.grid_url import GridURL
+from syft.types.uid import UID
+
+signing_key = SyftSigningKey.generate()
+
+SAMPLES = {
+    UID: UID,
+    str: lambda: "syft",
+    int: lambda: 1,
+    float: lambda: 1.5,
+    bool: lambda: True,
+    bytes: lambda: b"syft",
+    EmailStr: lambda: "info@openmined.org",
+    SyftSigningKey: lambda: signing_key,
+    SyftVerifyKey: lambda: signing_key.verify_key,
+    DateTime: DateTime.now,
+    GridURL: lambda: GridURL.from_url("http://localhost:8080"),
+}
+
+
+def sample(type_: Any, depth: int = 0) -> Any:
+    origin = typing.get_origin(type_)
+    if origin in (list, set, tuple, dict):
+        return origin()
+    if origin is type:
+        (arg,) = typing.get_args(type_)
+        return arg if isinstance(arg, type) and arg is not Any else int
+    if origin is typing.Union:
+        return sample(typing.get_args(type_)[0], depth)
+    if type_ in SAMPLES:
+        return SAMPLES[type_]()
+    if isinstance(type_, type) and issubclass(type_, Enum) and len(type_):
+        return list(type_)[0]
+    if isinstance(type_, type) and issubclass(type_, BaseModel) and depth < 3:
+        return sample_object(type_, depth + 1)
+    raise TypeError(f"No sample for {type_}")
+
+
+def sample_object(cls: Type[BaseModel], depth: int = 0) -> BaseModel:
+    kwargs: Dict[str, Any] = {}
+    for name, field in cls.__fields__.items():
+        try:
+            kwargs[name] = sample(field.outer_type_, depth)
+        except TypeError:
+            # keep the default of optional fields
+            if field.required:
+                if not field.allow_none:
+                    raise
+                kwargs[name] = None
+    return cls(**kwargs)
+
+
+TRUSTED_TYPES = {
+    fqn: cls
+    for fqn, (nonrecursive, _, _, _, _, cls) in TYPE_BANK.items()
+    if not nonrecursive
+    and isinstance(cls, type)
+    and issubclass(cls, BaseModel)
+    and getattr(cls, "__trusted_construct__", False)
+}
+
+
+@pytest.mark.parametrize("fqn", sorted(TRUSTED_TYPES))
+def test_trusted_deserialize_matches_validation(fqn: str) -> None:
+    cls = TRUSTED_TYPES[fqn]
+    try:
+        obj = sample_object(cls)
+        blob = sy.serialize(obj, to_bytes=True)
+    except Exception as e:
+        pytest.skip(f"Can't create a sample {cls.__name__}: {e}")
+
+    validated = sy.deserialize(blob, from_bytes=True)
+    with trusted_deserialize():
+        constructed = sy.deserialize(blob, from_bytes=True)
+
+    assert type(constructed) is type(validated)
+    assert constructed.__dict__.keys() == validated.__dict__.keys()
+    assert constructed.__fields_set__ == validated.__fields_set__
+    # fields which aren't serialized, like the ids of SignedSyftAPICalls, are
+    # created again by the validators so only the serialized state is the same
+    assert sy.serialize(constructed, to_bytes=True) == sy.serialize(
+        validated, to_bytes=True
+    )
+
+
+def test_trusted_deserialize_is_scoped() -> None:
+    class Validated(Exception):
+        pass
+
+    obj = sample_object(TRUSTED_TYPES["syft.service.message.messages.Message"])
+    blob = sy.serialize(obj, to_bytes=True)
+    cls = type(obj)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+
+        def validate(*args: Any, **kwargs: Any) -> None:
+            raise Validated()
+
+        monkeypatch.setattr(cls, "__init__", validate)
+        with trusted_deserialize():
+            assert sy.deserialize(blob, from_bytes=True) == obj
+
+        # everything else, like the messages of clients, is validated
+        with pytest.raises(Validated):
+            sy.deserialize(blob, from_bytes=True)
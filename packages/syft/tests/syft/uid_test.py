@@ -129,3 +129,40 @@ def test_uid_proto_deserialization() -> None:
 
     obj = sy.deserialize(blob=blob, from_proto=True)
     assert obj == UID(value=uuid.UUID(int=333779996850170035686993356951732753684))
+
+
+def test_uid_fixed_layout_serde_is_wire_compatible() -> None:
+    """Tests that the spliced UID bytes are the same as the recursive serde ones"""
+
+    # syft absolute
+    from syft.serde.recursive import rs_bytes2object
+    from syft.serde.recursive import rs_object2proto
+
+    for _ in range(10):
+        uid = UID()
+        blob = sy.serialize(uid, to_bytes=True)
+        assert blob == rs_object2proto(uid).to_bytes()
+        assert rs_bytes2object(blob) == uid
+        assert sy.deserialize(blob, from_bytes=True) == uid
+
+    # nested UIDs and subclasses use the same wire format
+    uids = [UID(), UID()]
+    assert sy.deserialize(sy.serialize(uids, to_bytes=True), from_bytes=True) == uids
+
+
+def test_uid_caches_hash_and_hex() -> None:
+    """Tests that UID keeps the uuid bytes and matches the uuid hash and hex"""
+
+    uid = UID()
+    value = uid.value
+    assert value.version == 4
+    assert hash(uid) == hash(value)
+    assert str(uid) == value.hex
+    assert uid.no_dash is uid.no_dash
+    assert not hasattr(uid, "__dict__")
+
+    assert UID(value.bytes) == UID(str(value)) == UID(value) == UID(uid) == uid
+    assert sorted([UID(uuid.UUID(int=2)), UID(uuid.UUID(int=1))]) == [
+        UID(uuid.UUID(int=1)),
+        UID(uuid.UUID(int=2)),
+    ]
@@ -1,14 +1,18 @@
 # third party
 from faker import Faker
 import pytest
+from result import Ok
 
 # syft absolute
 from syft.client.api import SyftAPICall
 from syft.service.context import AuthedServiceContext
+from syft.service.response import SyftError
 from syft.service.user.user import ServiceRole
 from syft.service.user.user import UserCreate
 from syft.service.user.user import UserUpdate
 from syft.service.user.user import UserView
+from syft.service.user.user import password_hash_rounds
+from syft.util.experimental_flags import flags
 
 GUEST_ROLES = [ServiceRole.GUEST]
 DS_ROLES = [ServiceRole.GUEST, ServiceRole.DATA_SCIENTIST]
@@ -111,6 +115,80 @@ def test_user_create(worker, do_client, guest_client, ds_client, root_domain_cli
         assert isinstance(res, UserView)
 
 
+def test_user_create_many(worker, guest_client, root_domain_client, monkeypatch):
+    monkeypatch.setattr(flags, "PASSWORD_HASH_ROUNDS", 4)
+    monkeypatch.setattr(flags, "PASSWORD_HASH_WORKERS", 2)
+    emails = [Faker().unique.email() for _ in range(5)]
+    existing = Faker().unique.email()
+    assert worker.guest_client.register(name="z", email=existing, password="pw")
+    user_creates = [
+        UserCreate(email=email, name="z", password=email, password_verify=email)
+        for email in emails
+    ]
+    user_creates += [
+        # an existing user, a user of the same batch and a wrong password
+        UserCreate(email=existing, name="z", password="pw", password_verify="pw"),
+        UserCreate(email=emails[0], name="z", password="pw", password_verify="pw"),
+        UserCreate(
+            email=Faker().unique.email(), name="z", password="pw", password_verify="p"
+        ),
+    ]
+    assert not manually_call_service(
+        worker, guest_client, "user.create_many", args=[user_creates]
+    )
+
+    results = manually_call_service(
+        worker, root_domain_client, "user.create_many", args=[user_creates]
+    )
+    assert [result.email for result in results[:5]] == emails
+    assert all(isinstance(result, UserView) for result in results[:5])
+    assert all(isinstance(result, SyftError) for result in results[5:])
+
+    user = worker.get_service("UserService").stash.get_by_email(
+        worker.signing_key.verify_key, emails[1]
+    )
+    assert password_hash_rounds(user.ok().hashed_password) == 4
+    assert worker.guest_client.login(email=emails[1], password=emails[1])
+
+
+def test_user_create_many_fallback(worker, root_domain_client, monkeypatch):
+    monkeypatch.setattr(flags, "PASSWORD_HASH_ROUNDS", 4)
+    existing = Faker().unique.email()
+    assert worker.guest_client.register(name="z", email=existing, password="pw")
+    # as if the existing user was created after the emails were checked
+    stash = worker.get_service("UserService").stash
+    monkeypatch.setattr(stash, "get_all_emails", lambda credentials: Ok(set()))
+
+    emails = [Faker().unique.email() for _ in range(2)] + [existing]
+    user_creates = [
+        UserCreate(email=email, name="z", password="pw", password_verify="pw")
+        for email in emails
+    ]
+    results = manually_call_service(
+        worker, root_domain_client, "user.create_many", args=[user_creates]
+    )
+    # the batch fails on the duplicate, the other users are still created
+    assert [result.email for result in results[:2]] == emails[:2]
+    assert isinstance(results[2], SyftError)
+    for email in emails[:2]:
+        assert stash.get_by_email(worker.signing_key.verify_key, email).ok()
+
+
+def test_user_rehash_on_login(worker, monkeypatch):
+    monkeypatch.setattr(flags, "PASSWORD_HASH_ROUNDS", 4)
+    email = Faker().email()
+    assert worker.guest_client.register(name="z", email=email, password="pw")
+    stash = worker.get_service("UserService").stash
+    user = stash.get_by_email(worker.signing_key.verify_key, email).ok()
+    assert password_hash_rounds(user.hashed_password) == 4
+
+    monkeypatch.setattr(flags, "PASSWORD_HASH_ROUNDS", 5)
+    assert worker.guest_client.login(email=email, password="pw")
+    user = stash.get_by_email(worker.signing_key.verify_key, email).ok()
+    assert password_hash_rounds(user.hashed_password) == 5
+    assert worker.guest_client.login(email=email, password="pw")
+
+
 def test_user_delete(do_client, guest_client, ds_client, worker, root_domain_client):
     # admins can delete lower users
     clients = [get_mock_client(root_domain_client, role) for role in DO_ROLES]
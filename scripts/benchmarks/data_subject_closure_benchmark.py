@@ -0,0 +1,139 @@
+"""Importing and querying a DataSubject hierarchy with a closure table, on SQLite
+
+    python scripts/benchmarks/data_subject_closure_benchmark.py [count]
+
+The hierarchy has 10 levels below a root, each about three times the size of the
+one above it, and every DataSubject is a member of a random one of the level above.
+"""
+
+# stdlib
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.data_subject.data_subject import DataSubject
+from syft.service.data_subject.data_subject import data_subject_uid
+from syft.service.data_subject.data_subject_closure import DataSubjectClosureStash
+from syft.service.data_subject.data_subject_member import DataSubjectMemberRelationship
+from syft.service.data_subject.data_subject_member import member_relationship_uid
+from syft.service.data_subject.data_subject_member_service import DataSubjectMemberStash
+from syft.service.data_subject.data_subject_service import DataSubjectStash
+from syft.store.sqlite_document_store import SQLiteDocumentStore
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
+from syft.types.uid import UID
+
+COUNT = 100_000
+LEVELS = 10
+RATIO = 3
+
+
+def hierarchy(count: int) -> Tuple[List[List[str]], List[Tuple[str, str]]]:
+    rng = random.Random(0)
+    scale = count * (RATIO - 1) / (RATIO ** (LEVELS + 1) - 1)
+    levels = [["level 0 subject 0"]]
+    edges = []
+    for level in range(1, LEVELS + 1):
+        size = max(1, round(scale * RATIO**level))
+        names = [f"level {level} subject {i}" for i in range(size)]
+        for name in names:
+            edges.append((rng.choice(levels[-1]), name))
+        levels.append(names)
+    return levels, edges
+
+
+def timed(name: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{name:<44} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+    return result
+
+
+def walk_members(
+    credentials, members: DataSubjectMemberStash, subjects: DataSubjectStash, name
+) -> List[DataSubject]:
+    # the previous get_members, one level at a time with a query for each member
+    found = []
+    for relation in members.get_all_for_parent(credentials, name=name).ok():
+        found.append(subjects.get_by_name(credentials, name=relation.child).ok())
+        found += walk_members(credentials, members, subjects, relation.child)
+    return found
+
+
+def main(count: int) -> None:
+    credentials = SyftSigningKey.generate().verify_key
+    workspace = Path(tempfile.mkdtemp())
+    store = SQLiteDocumentStore(
+        credentials,
+        store_config=SQLiteStoreConfig(
+            client_config=SQLiteStoreClientConfig(filename="bench.db", path=workspace)
+        ),
+    )
+    subjects = DataSubjectStash(store=store)
+    members = DataSubjectMemberStash(store=store)
+    closure = DataSubjectClosureStash(store=store)
+
+    levels, edges = hierarchy(count)
+    node_uid = UID()
+    data_subjects = [
+        DataSubject(id=data_subject_uid(name), node_uid=node_uid, name=name)
+        for level in levels
+        for name in level
+    ]
+    relations = [
+        DataSubjectMemberRelationship(
+            id=member_relationship_uid(parent, child), parent=parent, child=child
+        )
+        for parent, child in edges
+    ]
+    print(f"{len(data_subjects)} DataSubjects in {len(levels)} levels")
+
+    timed("import DataSubjects", subjects.set_many, credentials, data_subjects)
+    timed("import relationships", members.set_many, credentials, relations)
+    timed("import closure", closure.add_edges, credentials, edges)
+
+    def descendants(name: str) -> Dict[str, DataSubject]:
+        row = closure.get_by_name(credentials, name).ok()
+        return subjects.get_many_by_name(credentials, row.descendants).ok()
+
+    root = levels[0][0]
+    subtree = edges[-1][0]
+    while len(closure.get_by_name(credentials, subtree).ok().descendants) < 20:
+        subtree = closure.get_by_name(credentials, subtree).ok().ancestors
+        subtree = min(subtree, key=subtree.__getitem__)
+    size = len(closure.get_by_name(credentials, subtree).ok().descendants)
+
+    timed(f"closure descendants of root ({len(data_subjects) - 1})", descendants, root)
+    timed(f"closure descendants of subtree ({size})", descendants, subtree)
+    timed(
+        f"walked descendants of subtree ({size})",
+        walk_members,
+        credentials,
+        members,
+        subjects,
+        subtree,
+    )
+    leaf = levels[-1][0]
+    timed(
+        "closure ancestors of leaf",
+        lambda: subjects.get_many_by_name(
+            credentials, closure.get_by_name(credentials, leaf).ok().ancestors
+        ),
+    )
+    timed(
+        "add one member to a leaf",
+        closure.add_edges,
+        credentials,
+        [(leaf, "new subject")],
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
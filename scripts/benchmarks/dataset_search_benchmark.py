@@ -0,0 +1,58 @@
+"""Queries of the inverted index of DatasetService.search over many Datasets
+
+    python scripts/benchmarks/dataset_search_benchmark.py [count]
+"""
+
+# stdlib
+from collections import Counter
+import random
+import string
+import sys
+import timeit
+
+# syft absolute
+from syft.service.dataset.dataset_search import InvertedIndex
+from syft.service.dataset.dataset_search import tokenize
+from syft.types.uid import UID
+
+COUNT = 100_000
+REPEAT = 5
+NUMBER = 20
+VOCABULARY = 50_000
+WORDS_PER_DATASET = 20
+
+
+def word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+
+
+def main(count: int) -> None:
+    rng = random.Random(0)
+    vocabulary = [word(rng) for _ in range(VOCABULARY)]
+    # word frequencies of natural text follow Zipf's law
+    weights = [1 / rank for rank in range(1, VOCABULARY + 1)]
+    index = InvertedIndex()
+    for _ in range(count):
+        words = rng.choices(vocabulary, weights=weights, k=WORDS_PER_DATASET)
+        index.add(UID(), dict(Counter(tokenize(" ".join(words)))))
+
+    common, frequent, rare = vocabulary[0], vocabulary[50], vocabulary[5000]
+    queries = [
+        common,
+        rare,
+        rare[:3],
+        f"{frequent} {rare[:4]}",
+        f"{common} {frequent} {vocabulary[10]}",
+    ]
+
+    print(f"{count} Datasets, {len(index.terms)} terms")
+    for query in queries:
+        seconds = min(
+            timeit.repeat(lambda: index.search(query), number=NUMBER, repeat=REPEAT)
+        )
+        matches = len(index.search(query))
+        print(f"{query!r:<28} {matches:6} matches {seconds / NUMBER * 1e3:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
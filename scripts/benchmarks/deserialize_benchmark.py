@@ -0,0 +1,55 @@
+"""Deserializing store rows of Messages with and without pydantic validation
+
+    python scripts/benchmarks/deserialize_benchmark.py [count]
+"""
+
+# stdlib
+import sys
+import timeit
+from typing import List
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.serde.recursive import trusted_deserialize
+from syft.service.message.messages import Message
+from syft.types.datetime import DateTime
+from syft.types.uid import UID
+
+COUNT = 100_000
+REPEAT = 3
+
+
+def main(count: int) -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+    rows = [
+        sy.serialize(
+            Message(
+                subject=f"Request {i} approved",
+                node_uid=UID(),
+                from_user_verify_key=verify_key,
+                to_user_verify_key=verify_key,
+                created_at=DateTime.now(),
+            ),
+            to_bytes=True,
+        )
+        for i in range(count)
+    ]
+
+    def load() -> List[Message]:
+        return [sy.deserialize(row, from_bytes=True) for row in rows]
+
+    def load_trusted() -> List[Message]:
+        # like the rows read by the sqlite and mongo stores
+        with trusted_deserialize():
+            return load()
+
+    assert load_trusted() == load()
+    print(f"{count} Messages")
+    for name, func in [("validated", load), ("trusted", load_trusted)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"{name:<10} {seconds:8.3f} s {seconds / count * 1e6:8.2f} us/row")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
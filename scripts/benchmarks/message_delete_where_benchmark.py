@@ -0,0 +1,95 @@
+"""Clearing the inbox of a user one message at a time and with delete_where
+
+    python scripts/benchmarks/message_delete_where_benchmark.py [count]
+"""
+
+# stdlib
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+# syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.message.message_stash import MessageStash
+from syft.service.message.messages import Message
+from syft.service.message.messages import MessageStatus
+from syft.store.dict_document_store import DictDocumentStore
+from syft.store.document_store import DocumentStore
+from syft.store.sqlite_document_store import SQLiteDocumentStore
+from syft.store.sqlite_document_store import SQLiteStoreClientConfig
+from syft.store.sqlite_document_store import SQLiteStoreConfig
+from syft.types.datetime import DateTime
+from syft.types.uid import UID
+
+COUNT = 2_000
+
+
+def fill(stash: MessageStash, credentials, count: int) -> None:
+    sender = SyftSigningKey.generate().verify_key
+    node_uid = UID()
+    messages = [
+        Message(
+            subject=f"message {i}",
+            node_uid=node_uid,
+            from_user_verify_key=sender,
+            to_user_verify_key=credentials,
+            created_at=DateTime.now(),
+            status=MessageStatus.UNDELIVERED,
+        )
+        for i in range(count)
+    ]
+    stash.set_many(credentials, messages)
+
+
+def delete_one_by_one(stash: MessageStash, credentials) -> None:
+    # the previous delete_all_for_verify_key
+    messages = stash.get_all_inbox_for_verify_key(credentials, credentials).ok()
+    for message in messages:
+        stash.delete_by_uid(credentials, message.id)
+
+
+def timed(name: str, func, *args) -> None:
+    start = time.perf_counter()
+    func(*args)
+    print(f"{name:<44} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+def run(name: str, store: DocumentStore, credentials, count: int) -> None:
+    stash = MessageStash(store=store)
+    fill(stash, credentials, count)
+    timed(f"{name} delete one by one", delete_one_by_one, stash, credentials)
+    fill(stash, credentials, count)
+    timed(
+        f"{name} update_all_status_for_verify_key",
+        stash.update_all_status_for_verify_key,
+        credentials,
+        credentials,
+        MessageStatus.DELIVERED,
+    )
+    timed(
+        f"{name} delete_all_for_verify_key",
+        stash.delete_all_for_verify_key,
+        credentials,
+        credentials,
+    )
+    assert len(stash) == 0
+
+
+def main(count: int) -> None:
+    credentials = SyftSigningKey.generate().verify_key
+    print(f"{count} messages")
+    run("dict", DictDocumentStore(credentials), credentials, count)
+    store = SQLiteDocumentStore(
+        credentials,
+        store_config=SQLiteStoreConfig(
+            client_config=SQLiteStoreClientConfig(
+                filename="bench.db", path=Path(tempfile.mkdtemp())
+            )
+        ),
+    )
+    run("sqlite", store, credentials, count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
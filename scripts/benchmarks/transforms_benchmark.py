@@ -0,0 +1,68 @@
+"""Per-call overhead of SyftObject.to
+
+    python scripts/benchmarks/transforms_benchmark.py
+"""
+
+# stdlib
+import timeit
+
+# syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.user.user import User
+from syft.service.user.user import UserView
+from syft.service.user.user_roles import ServiceRole
+from syft.types.syft_object import SyftObjectRegistry
+from syft.types.transforms import TransformContext
+from syft.types.transforms import drop
+from syft.types.transforms import generate_transform_wrapper
+from syft.types.transforms import keep
+from syft.types.transforms import make_set_default
+from syft.types.transforms import rename
+from syft.types.uid import UID
+
+NUMBER = 20_000
+
+
+def report(name: str, stmt: str, **env: object) -> None:
+    seconds = min(timeit.repeat(stmt, globals=env, number=NUMBER, repeat=5))
+    print(f"{name:<28} {seconds / NUMBER * 1e6:8.2f} us/call")
+
+
+def main() -> None:
+    user = User(
+        id=UID(),
+        role=ServiceRole.DATA_SCIENTIST,
+        email="info@openmined.org",
+        name="Jane Doe",
+        signing_key=SyftSigningKey.generate(),
+        verify_key=SyftSigningKey.generate().verify_key,
+    )
+    dict_ops = generate_transform_wrapper(
+        User,
+        dict,
+        [
+            drop(["hashed_password", "salt"]),
+            rename("name", "full_name"),
+            make_set_default("institution", "OpenMined"),
+            keep(["id", "email", "full_name", "institution"]),
+        ],
+    )
+
+    report(
+        "get_transform",
+        "get_transform(User, UserView)",
+        get_transform=SyftObjectRegistry.get_transform,
+        User=User,
+        UserView=UserView,
+    )
+    report(
+        "TransformContext",
+        "from_context(obj=user)",
+        **{"from_context": TransformContext.from_context, "user": user},
+    )
+    report("dict ops pipeline", "dict_ops(user)", dict_ops=dict_ops, user=user)
+    report("User.to(UserView)", "user.to(UserView)", user=user, UserView=UserView)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Creating, hashing and (de)serializing UIDs, which key every store partition
+
+    python scripts/benchmarks/uid_benchmark.py [count]
+"""
+
+# stdlib
+import sys
+import time
+from typing import Any
+from typing import Callable
+
+# syft absolute
+import syft as sy
+from syft.types.uid import UID
+
+COUNT = 1_000_000
+
+
+def report(name: str, func: Callable[[], Any], count: int) -> Any:
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    print(f"{name:<16} {seconds:8.3f} s {seconds / count * 1e6:8.2f} us/uid")
+    return result
+
+
+def main(count: int) -> None:
+    print(f"{count} UIDs")
+    uids = report("create", lambda: [UID() for _ in range(count)], count)
+    index = report("dict insert", lambda: {uid: i for i, uid in enumerate(uids)}, count)
+    report("dict lookup", lambda: [index[uid] for uid in uids], count)
+    report("str", lambda: [str(uid) for uid in uids], count)
+    blobs = report(
+        "serialize",
+        lambda: [sy.serialize(uid, to_bytes=True) for uid in uids],
+        count,
+    )
+    report(
+        "deserialize",
+        lambda: [sy.deserialize(blob, from_bytes=True) for blob in blobs],
+        count,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
@@ -0,0 +1,80 @@
+"""Creating users one at a time and with user.create_many
+
+    python scripts/benchmarks/user_create_many_benchmark.py [count] [workers]
+
+The passwords are hashed with flags.PASSWORD_HASH_ROUNDS, set it with
+SYFT_PASSWORD_HASH_ROUNDS.
+"""
+
+# stdlib
+import os
+import sys
+import time
+from typing import List
+
+# syft absolute
+import syft as sy
+from syft.service.context import AuthedServiceContext
+from syft.service.user.user import UserCreate
+from syft.service.user.user import get_password_hash_executor
+from syft.util.experimental_flags import flags
+
+COUNT = 1_000
+
+
+def user_creates(name: str, count: int) -> List[UserCreate]:
+    return [
+        UserCreate(
+            email=f"{name}{i}@openmined.org",
+            name=f"{name} {i}",
+            password=f"password {i}",
+            password_verify=f"password {i}",
+        )
+        for i in range(count)
+    ]
+
+
+def timed(name: str, func, *args) -> None:
+    start = time.perf_counter()
+    func(*args)
+    print(f"{name:<44} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+def main(count: int, workers: int) -> None:
+    worker = sy.Worker.named(name="user_create_many_benchmark", reset=True)
+    service = worker.get_service("UserService")
+    context = AuthedServiceContext(
+        node=worker, credentials=worker.signing_key.verify_key
+    )
+    print(f"{count} users, {flags.PASSWORD_HASH_ROUNDS} rounds")
+
+    def create_one_by_one(user_creates: List[UserCreate]) -> None:
+        for user_create in user_creates:
+            service.create(context, user_create)
+
+    timed("create one by one", create_one_by_one, user_creates("serial", count))
+
+    flags.PASSWORD_HASH_WORKERS = 0
+    timed(
+        "create_many without workers",
+        service.create_many,
+        context,
+        user_creates("inline", count),
+    )
+
+    flags.PASSWORD_HASH_WORKERS = workers
+    # the workers are started outside of the timing
+    get_password_hash_executor().submit(os.getpid).result()
+    timed(
+        f"create_many with {workers} workers",
+        service.create_many,
+        context,
+        user_creates("pooled", count),
+    )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else COUNT,
+        int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count(),
+    )